@@ -2,9 +2,29 @@
 Snake MIP Solver -  Mixed Integer Programming approach to solving Snake logic puzzles.
 """
 
-from .puzzle import SnakePuzzle
-from .solver import SnakeSolver
+from .puzzle import BaseSnakePuzzle, SnakePuzzle, FrozenSnakePuzzle, ValidationResult
 from .generator import SnakePuzzleGenerator
+from .rater import DifficultyRater, DifficultyRating
+from .dedup import PuzzleDeduplicator, BloomFilter
+from .counter import SolutionCounter, count_solutions
+from .incremental import IncrementalValidator
+from .events import ProgressEvent, EVENT_KINDS
+from .cuts import CutStore
 
 __version__ = "0.3.0"
-__all__ = ["SnakePuzzle", "SnakeSolver", "SnakePuzzleGenerator"]
+__all__ = ["BaseSnakePuzzle", "SnakePuzzle", "FrozenSnakePuzzle", "SnakeSolver", "LNSSolver", "SnakePuzzleGenerator", "ValidationResult",
+           "DifficultyRater", "DifficultyRating", "PuzzleDeduplicator", "BloomFilter",
+           "SolutionCounter", "count_solutions", "IncrementalValidator", "ProgressEvent", "EVENT_KINDS", "CutStore"]
+
+
+def __getattr__(name):
+    # The solvers load the OR-Tools backend, so they are only imported on first use
+    if name == "SnakeSolver":
+        from .solver import SnakeSolver
+        globals()["SnakeSolver"] = SnakeSolver
+        return SnakeSolver
+    if name == "LNSSolver":
+        from .lns import LNSSolver
+        globals()["LNSSolver"] = LNSSolver
+        return LNSSolver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,332 @@
+"""
+Reproducible performance benchmarks for the Snake MIP solver.
+
+Puzzles are generated with fixed seeds, so every run measures the same corpus.
+Each puzzle is solved once per configured engine (a named set of SnakeSolver
+keyword arguments) and the model build time, solve time, iteration count and
+number of cutting planes are recorded.
+
+With --startup, the cost of importing the package in a fresh interpreter is
+measured as well, together with the heavy dependencies the import loads.
+
+Usage:
+    python -m snake_mip_solver.benchmark --output results.json
+    python -m snake_mip_solver.benchmark --baseline baseline.json --threshold 1.5
+    python -m snake_mip_solver.benchmark --startup --baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .generator import SnakePuzzleGenerator
+from .solver import SnakeSolver
+
+
+DEFAULT_SIZES: List[Tuple[int, int]] = [(5, 5), (10, 10), (15, 15), (20, 20), (30, 30), (40, 40)]
+DEFAULT_FILL_PERCENTAGES: List[float] = [0.2, 0.3, 0.4]
+DEFAULT_SEEDS: List[int] = [0, 1, 2]
+DEFAULT_ENGINES: Dict[str, Dict[str, Any]] = {
+    "SCIP": {"solver_type": "SCIP"},
+    "SCIP-array": {"solver_type": "SCIP", "builder": "array"},
+}
+
+# Metrics compared against the baseline. Timings below MIN_SECONDS are treated as noise.
+TIMING_METRICS = ("build_seconds", "solve_seconds")
+COUNT_METRICS = ("iterations", "cutting_planes_added")
+MIN_SECONDS = 0.01
+
+# Heavy dependencies that `import snake_mip_solver` must not load. They are
+# imported on first use of SnakeSolver or of the features that need them.
+LAZY_MODULES = ("ortools", "numpy")
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start_time = time.perf_counter()
+import snake_mip_solver
+import_seconds = time.perf_counter() - start_time
+print(json.dumps({"import_seconds": import_seconds,
+                  "loaded_modules": [name for name in %r if name in sys.modules]}))
+"""
+
+
+def build_corpus(sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES,
+                 fill_percentages: Sequence[float] = DEFAULT_FILL_PERCENTAGES,
+                 seeds: Sequence[int] = DEFAULT_SEEDS) -> List[Dict[str, Any]]:
+    """
+    Generate the benchmark corpus.
+
+    Args:
+        sizes: List of (rows, cols) grid sizes
+        fill_percentages: Fill percentages passed to the generator
+        seeds: Generator seeds used for every size and fill percentage
+
+    Returns:
+        List of corpus entries with keys rows, cols, fill_percentage, seed and
+        puzzle (None if generation failed for that combination)
+    """
+    corpus = []
+    for rows, cols in sizes:
+        for fill_percentage in fill_percentages:
+            for seed in seeds:
+                try:
+                    puzzle, _ = SnakePuzzleGenerator(seed=seed).generate(rows, cols, fill_percentage)
+                except RuntimeError:
+                    puzzle = None
+                corpus.append({
+                    "rows": rows,
+                    "cols": cols,
+                    "fill_percentage": fill_percentage,
+                    "seed": seed,
+                    "puzzle": puzzle,
+                })
+    return corpus
+
+
+def run_benchmark(sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES,
+                  fill_percentages: Sequence[float] = DEFAULT_FILL_PERCENTAGES,
+                  seeds: Sequence[int] = DEFAULT_SEEDS,
+                  engines: Optional[Dict[str, Dict[str, Any]]] = None,
+                  max_iterations: int = 50,
+                  time_limit: Optional[float] = 10.0) -> Dict[str, Any]:
+    """
+    Run the benchmark and collect the results.
+
+    Args:
+        sizes: List of (rows, cols) grid sizes
+        fill_percentages: Fill percentages passed to the generator
+        seeds: Generator seeds used for every size and fill percentage
+        engines: Mapping of engine name to SnakeSolver keyword arguments
+        max_iterations: Maximum number of cutting plane iterations per solve
+        time_limit: Backend time limit in seconds for each Solve() call (None for no limit)
+
+    Returns:
+        JSON-serializable dictionary with metadata, individual runs and a summary
+        keyed by "<engine>/<rows>x<cols>/<fill_percentage>"
+    """
+    engines = engines if engines is not None else DEFAULT_ENGINES
+    corpus = build_corpus(sizes, fill_percentages, seeds)
+
+    runs = []
+    for engine_name, solver_kwargs in engines.items():
+        for entry in corpus:
+            run: Dict[str, Any] = {
+                "engine": engine_name,
+                "rows": entry["rows"],
+                "cols": entry["cols"],
+                "fill_percentage": entry["fill_percentage"],
+                "seed": entry["seed"],
+                "generated": entry["puzzle"] is not None,
+            }
+            if entry["puzzle"] is not None:
+                run.update(_time_solve(entry["puzzle"], solver_kwargs, max_iterations, time_limit))
+            runs.append(run)
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "max_iterations": max_iterations,
+            "time_limit": time_limit,
+        },
+        "runs": runs,
+        "summary": summarize_runs(runs),
+    }
+
+
+def _time_solve(puzzle, solver_kwargs: Dict[str, Any], max_iterations: int,
+                time_limit: Optional[float]) -> Dict[str, Any]:
+    """Build and solve one puzzle, returning the measured timings and statistics."""
+    start_time = time.perf_counter()
+    solver = SnakeSolver(puzzle, **solver_kwargs)
+    build_seconds = time.perf_counter() - start_time
+
+    if time_limit is not None:
+        solver.solver.SetTimeLimit(int(time_limit * 1000))
+
+    start_time = time.perf_counter()
+    solution = solver.solve(max_iterations=max_iterations)
+    solve_seconds = time.perf_counter() - start_time
+
+    stats = solver.get_solve_stats()
+    return {
+        "build_seconds": build_seconds,
+        "solve_seconds": solve_seconds,
+        "iterations": stats["iterations"],
+        "cutting_planes_added": stats["cutting_planes_added"],
+        "solved": solution is not None,
+    }
+
+
+def measure_startup(repeats: int = 5) -> Dict[str, Any]:
+    """
+    Measure the cost of `import snake_mip_solver` in fresh interpreters.
+
+    Args:
+        repeats: Number of interpreters to start
+
+    Returns:
+        Dictionary with the median import_seconds and the loaded_modules among
+        LAZY_MODULES that the import pulled in
+    """
+    measurements = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT % (LAZY_MODULES,)],
+                                capture_output=True, text=True, check=True).stdout
+        measurements.append(json.loads(output))
+    return {
+        "import_seconds": statistics.median(m["import_seconds"] for m in measurements),
+        "loaded_modules": sorted(set().union(*(m["loaded_modules"] for m in measurements))),
+    }
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate individual runs per engine, grid size and fill percentage.
+
+    Timings and counts are aggregated using the median, which is robust to the
+    occasional outlier caused by a busy machine.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for run in runs:
+        if not run["generated"]:
+            continue
+        key = f"{run['engine']}/{run['rows']}x{run['cols']}/{run['fill_percentage']:.2f}"
+        groups.setdefault(key, []).append(run)
+
+    summary = {}
+    for key, group in groups.items():
+        entry: Dict[str, Any] = {
+            "runs": len(group),
+            "solved": sum(1 for run in group if run["solved"]),
+        }
+        for metric in TIMING_METRICS + COUNT_METRICS:
+            entry[metric] = statistics.median(run[metric] for run in group)
+        summary[key] = entry
+    return summary
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                          threshold: float = 1.5,
+                          min_seconds: float = MIN_SECONDS) -> List[str]:
+    """
+    Compare benchmark results against a stored baseline.
+
+    A metric regresses when it exceeds the baseline value multiplied by threshold.
+    Timing differences smaller than min_seconds are ignored, and fewer solved
+    puzzles than in the baseline always counts as a regression. When both contain
+    startup measurements, the import time is compared the same way and any lazy
+    module loaded at import that the baseline did not load is a regression.
+
+    Args:
+        results: Results from run_benchmark
+        baseline: Previously stored results from run_benchmark
+        threshold: Allowed ratio between current and baseline values
+        min_seconds: Absolute timing difference below which changes are ignored
+
+    Returns:
+        List of human readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for key, base_entry in baseline.get("summary", {}).items():
+        entry = results["summary"].get(key)
+        if entry is None:
+            continue
+
+        if entry["solved"] < base_entry["solved"]:
+            regressions.append(f"{key}: solved {entry['solved']} puzzles, baseline solved {base_entry['solved']}")
+
+        for metric in TIMING_METRICS:
+            current, reference = entry[metric], base_entry[metric]
+            if current > reference * threshold and current - reference > min_seconds:
+                regressions.append(f"{key}: {metric} {current:.4f}s exceeds baseline {reference:.4f}s x {threshold}")
+
+        for metric in COUNT_METRICS:
+            current, reference = entry[metric], base_entry[metric]
+            if current > max(reference, 1) * threshold:
+                regressions.append(f"{key}: {metric} {current} exceeds baseline {reference} x {threshold}")
+
+    startup, base_startup = results.get("startup"), baseline.get("startup")
+    if startup and base_startup:
+        current, reference = startup["import_seconds"], base_startup["import_seconds"]
+        if current > reference * threshold and current - reference > min_seconds:
+            regressions.append(f"startup: import_seconds {current:.4f}s exceeds baseline {reference:.4f}s x {threshold}")
+        for name in sorted(set(startup["loaded_modules"]) - set(base_startup["loaded_modules"])):
+            regressions.append(f"startup: import snake_mip_solver now loads {name}")
+
+    return regressions
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """Write benchmark results to a JSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read benchmark results from a JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Read a benchmark configuration file.
+
+    The file is a JSON object with any of the keys sizes, fill_percentages,
+    seeds, engines, max_iterations, time_limit and threshold.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    if "sizes" in config:
+        config["sizes"] = [tuple(size) for size in config["sizes"]]
+    return config
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point. Returns 1 if a regression was detected."""
+    parser = argparse.ArgumentParser(description="Benchmark the Snake MIP solver")
+    parser.add_argument("--config", help="JSON benchmark configuration file")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare results against this JSON file")
+    parser.add_argument("--threshold", type=float, help="Allowed slowdown ratio against the baseline (default: 1.5)")
+    parser.add_argument("--startup", action="store_true", help="Also measure the package import time")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config) if args.config else {}
+    threshold = args.threshold if args.threshold is not None else config.pop("threshold", 1.5)
+    config.pop("threshold", None)
+
+    results = run_benchmark(**config)
+
+    for key, entry in results["summary"].items():
+        print(f"{key}: build {entry['build_seconds']:.4f}s, solve {entry['solve_seconds']:.4f}s, "
+              f"iterations {entry['iterations']}, cuts {entry['cutting_planes_added']}, "
+              f"solved {entry['solved']}/{entry['runs']}")
+
+    if args.startup:
+        results["startup"] = measure_startup()
+        loaded = ", ".join(results["startup"]["loaded_modules"]) or "none"
+        print(f"startup: import {results['startup']['import_seconds']:.4f}s, lazy modules loaded: {loaded}")
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, load_results(args.baseline), threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from .puzzle import BaseSnakePuzzle
+
+
+# Frontier state: (component label per column, degree per column, whether the cell
+# up-left of the next cell is filled, filled cells per column, filled cells in the
+# current row, whether the snake is complete)
+_State = Tuple[Tuple[int, ...], Tuple[int, ...], bool, Tuple[int, ...], int, bool]
+
+
+class SolutionCounter:
+    """
+    Exact solution counter for Snake puzzles.
+
+    Sweeps the grid cell by cell in row-major order with a transfer-matrix (frontier)
+    dynamic program instead of enumerating solutions with repeated MIP solves. The
+    frontier holds the most recently decided cell of every column, labelled with its
+    connected component and its number of filled neighbours so far. The sweep
+    enforces the rules as cells leave the frontier:
+
+    - a filled cell has exactly two filled neighbours (one for the start and end cells)
+    - joining two cells of the same component would close a loop, so it is rejected
+    - once a component leaves the frontier it must be the whole snake
+    - two filled diagonal neighbours must share a filled orthogonal neighbour
+    - rows are checked when they are complete, columns as the sweep goes
+
+    The puzzle is transposed so the frontier runs along the shorter side. The number
+    of frontier states is bounded by the connectivity patterns of that side times the
+    possible column counts, so the running time is polynomial in the number of rows
+    for boards of fixed width.
+    """
+
+    def __init__(self, puzzle: BaseSnakePuzzle):
+        """
+        Initialize the counter with a puzzle.
+
+        Args:
+            puzzle: The SnakePuzzle instance to count solutions of
+
+        Raises:
+            ValueError: If puzzle is not a SnakePuzzle
+        """
+        if not isinstance(puzzle, BaseSnakePuzzle):
+            raise ValueError("Puzzle must be a SnakePuzzle instance")
+
+        self.puzzle = puzzle
+        self._stats: Dict[str, int] = {'cells': 0, 'max_states': 0}
+
+    def count(self) -> int:
+        """
+        Count the solutions of the puzzle.
+
+        Returns:
+            The exact number of distinct solutions
+        """
+        puzzle = self.puzzle
+        if puzzle.cols > puzzle.rows:
+            # Sweep along the longer side so the frontier stays narrow
+            puzzle = puzzle.transformed((False, False, True))
+
+        rows, cols = puzzle.rows, puzzle.cols
+        row_sums, col_sums = puzzle.row_sums, puzzle.col_sums
+        endpoints = {puzzle.start_cell, puzzle.end_cell}
+
+        def required_degree(row: int, col: int) -> int:
+            return 1 if (row, col) in endpoints else 2
+
+        states: Dict[_State, int] = {((0,) * cols, (0,) * cols, False, (0,) * cols, 0, False): 1}
+        self._stats = {'cells': 0, 'max_states': 1}
+
+        # A final virtual row of empty cells closes the last components
+        for row in range(rows + 1):
+            is_virtual = row == rows
+            row_sum = None if is_virtual else row_sums[row]
+            for col in range(cols):
+                if is_virtual:
+                    options: Tuple[int, ...] = (0,)
+                elif (row, col) in endpoints:
+                    options = (1,)
+                else:
+                    options = (0, 1)
+                col_sum = None if is_virtual else col_sums[col]
+                rows_left = rows - 1 - row
+                cells_left = cols - 1 - col
+
+                new_states: Dict[_State, int] = defaultdict(int)
+                for state, ways in states.items():
+                    labels, degrees, up_left, col_counts, row_count, done = state
+                    up = labels[col]
+                    left = labels[col - 1] if col > 0 else 0
+                    for value in options:
+                        new_state = self._transition(
+                            labels, degrees, up_left, col_counts, row_count, done,
+                            row, col, value, up, left, required_degree, col_sums[col] is not None
+                        )
+                        if new_state is None:
+                            continue
+                        new_labels, new_degrees, new_col_counts, new_row_count, new_done = new_state
+
+                        # Line sums: never exceed a clue, and keep enough cells left to reach it
+                        if col_sum is not None and not (
+                                col_sum - rows_left <= new_col_counts[col] <= col_sum):
+                            continue
+                        if row_sum is None:
+                            new_row_count = 0
+                        elif not row_sum - cells_left <= new_row_count <= row_sum:
+                            continue
+                        elif col == cols - 1:
+                            # Row complete: the bounds above require the exact sum
+                            new_row_count = 0
+
+                        # Next cell's up-left neighbour is this cell's up neighbour
+                        next_up_left = up != 0 and col < cols - 1
+                        new_states[(new_labels, new_degrees, next_up_left, new_col_counts,
+                                    new_row_count, new_done)] += ways
+                states = new_states
+                self._stats['cells'] += 1
+                self._stats['max_states'] = max(self._stats['max_states'], len(states))
+
+        return sum(ways for state, ways in states.items() if state[5])
+
+    @staticmethod
+    def _transition(labels: Tuple[int, ...], degrees: Tuple[int, ...], up_left: bool,
+                    col_counts: Tuple[int, ...], row_count: int, done: bool,
+                    row: int, col: int, value: int, up: int, left: int,
+                    required_degree, count_col: bool) -> Optional[Tuple[Tuple[int, ...], Tuple[int, ...],
+                                                       Tuple[int, ...], int, bool]]:
+        """
+        Decide one cell, returning the updated frontier or None if the choice is invalid.
+
+        The cell's up neighbour leaves the frontier, so its degree becomes final.
+        """
+        # 2x2 block of up-left, up, left and this cell: filled diagonal neighbours
+        # need a filled shared neighbour
+        if value and up_left and not up and not left:
+            return None
+        if not value and up and left and not up_left:
+            return None
+
+        new_labels = list(labels)
+        new_degrees = list(degrees)
+        new_col_counts = col_counts
+
+        if value:
+            if done:
+                return None
+            degree = (up != 0) + (left != 0)
+            if degree > required_degree(row, col):
+                return None
+            if up:
+                if degrees[col] + 1 != required_degree(row - 1, col):
+                    return None
+            if left:
+                new_degrees[col - 1] += 1
+                if new_degrees[col - 1] > required_degree(row, col - 1):
+                    return None
+            if up and left:
+                if up == left:
+                    # Closing a loop
+                    return None
+                new_labels = [left if label == up else label for label in new_labels]
+            label = left or up or max(labels) + 1
+            new_labels[col] = label
+            new_degrees[col] = degree
+            if count_col:
+                # Unlabelled columns are not counted, so they do not multiply the states
+                new_col_counts = col_counts[:col] + (col_counts[col] + 1,) + col_counts[col + 1:]
+            row_count += 1
+        else:
+            new_labels[col] = 0
+            new_degrees[col] = 0
+            if up:
+                if degrees[col] != required_degree(row - 1, col):
+                    return None
+                if up not in new_labels:
+                    # The component left the frontier: it must be the whole snake
+                    if any(new_labels):
+                        return None
+                    done = True
+
+        return _canonical_labels(new_labels), tuple(new_degrees), new_col_counts, row_count, done
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the last count.
+
+        Returns:
+            Dictionary with the number of cells swept and the largest number of
+            frontier states held at once
+        """
+        return self._stats.copy()
+
+
+def _canonical_labels(labels: List[int]) -> Tuple[int, ...]:
+    """Renumber component labels in order of first appearance, so equal frontiers match."""
+    mapping = {0: 0}
+    return tuple(mapping.setdefault(label, len(mapping)) for label in labels)
+
+
+def count_solutions(puzzle: BaseSnakePuzzle) -> int:
+    """
+    Count the solutions of a puzzle exactly (see SolutionCounter).
+
+    Args:
+        puzzle: The SnakePuzzle instance to count solutions of
+
+    Returns:
+        The exact number of distinct solutions
+    """
+    return SolutionCounter(puzzle).count()
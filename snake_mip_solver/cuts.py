@@ -0,0 +1,130 @@
+from typing import Dict, Iterable, List, Set, Tuple
+import json
+import os
+from .puzzle import BaseSnakePuzzle
+
+
+# Cut in canonical coordinates: sorted (row, col) tuples
+_CanonicalCut = Tuple[Tuple[int, int], ...]
+
+
+class CutStore:
+    """
+    Persistent pool of learned connectivity cuts, keyed by canonical puzzle.
+
+    Cuts learned by SnakeSolver are recorded in the coordinates of the puzzle's
+    canonical form (see SnakePuzzle.canonical_form), so they are found again for any
+    rotation or reflection of the puzzle. Preloading them into a new solver lets it
+    skip the cutting plane rounds that learned them.
+
+    The store is a JSON file, read when the store is created and written by save.
+
+    Usage:
+        store = CutStore('results/cuts.json')
+        solver = SnakeSolver(puzzle)
+        store.preload(solver)
+        solver.solve()
+        store.record(solver)
+        store.save()
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, loading the file if it exists.
+
+        Args:
+            path: JSON file the cuts are stored in
+
+        Raises:
+            ValueError: If the file is not a cut store
+        """
+        self.path = path
+        self._cuts: Dict[str, Dict[_CanonicalCut, None]] = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or not isinstance(data.get('puzzles'), dict):
+                raise ValueError(f"File {path} is not a cut store")
+            for fingerprint, cuts in data['puzzles'].items():
+                self._cuts[fingerprint] = {tuple(tuple(position) for position in cut): None for cut in cuts}
+
+    def get(self, puzzle: BaseSnakePuzzle) -> List[Set[Tuple[int, int]]]:
+        """
+        Get the stored cuts of a puzzle, in its own coordinates.
+
+        Args:
+            puzzle: The puzzle to look up
+
+        Returns:
+            List of cuts as sets of (row, col) tuples (empty if none are stored)
+        """
+        cuts = self._cuts.get(puzzle.fingerprint())
+        if not cuts:
+            return []
+        # Invert the puzzle's canonical transform
+        _, transform = puzzle.canonical_form()
+        original = {puzzle.transform_position((row, col), transform): (row, col)
+                    for row in range(puzzle.rows) for col in range(puzzle.cols)}
+        return [{original[position] for position in cut} for cut in cuts]
+
+    def add(self, puzzle: BaseSnakePuzzle, cuts: Iterable[Iterable[Tuple[int, int]]]) -> int:
+        """
+        Store cuts of a puzzle, given in its own coordinates.
+
+        Args:
+            puzzle: The puzzle the cuts were learned for
+            cuts: Cuts as collections of (row, col) positions
+
+        Returns:
+            Number of cuts that were not stored yet
+        """
+        _, transform = puzzle.canonical_form()
+        stored = self._cuts.setdefault(puzzle.fingerprint(), {})
+        added = 0
+        for cut in cuts:
+            canonical = tuple(sorted(puzzle.transform_position(tuple(position), transform)  # type: ignore
+                                     for position in cut))
+            if canonical not in stored:
+                stored[canonical] = None
+                added += 1
+        return added
+
+    def preload(self, solver) -> int:
+        """
+        Add the stored cuts of the solver's puzzle to its model.
+
+        Args:
+            solver: SnakeSolver whose puzzle is looked up
+
+        Returns:
+            Number of cuts added to the model
+        """
+        return solver.add_cuts(self.get(solver.puzzle))
+
+    def record(self, solver) -> int:
+        """
+        Store the connectivity cuts of a solver (see SnakeSolver.get_learned_cuts).
+
+        Args:
+            solver: SnakeSolver after solving
+
+        Returns:
+            Number of cuts that were not stored yet
+        """
+        return self.add(solver.puzzle, solver.get_learned_cuts())
+
+    def save(self) -> None:
+        """Write the store to its file, replacing it atomically."""
+        data = {'puzzles': {fingerprint: [[list(position) for position in cut] for cut in cuts]
+                            for fingerprint, cuts in sorted(self._cuts.items()) if cuts}}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+
+    def __len__(self) -> int:
+        """Number of puzzles with stored cuts."""
+        return sum(1 for cuts in self._cuts.values() if cuts)
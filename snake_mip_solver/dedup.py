@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+import hashlib
+import math
+from .puzzle import BaseSnakePuzzle
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set of strings.
+
+    Membership tests never give false negatives, and give false positives with
+    roughly the configured probability once capacity items have been added.
+    Memory use is fixed at construction: about 1.44 * log2(1 / false_positive_rate)
+    bits per item of capacity.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        """
+        Initialize an empty Bloom filter.
+
+        Args:
+            capacity: Expected number of items
+            false_positive_rate: Target false-positive probability at capacity
+
+        Raises:
+            ValueError: If capacity or false_positive_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not (0.0 < false_positive_rate < 1.0):
+            raise ValueError("False-positive rate must be between 0.0 and 1.0")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Bit positions of an item, using double hashing of one 128-bit digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (first + i * second) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Returns:
+            True if the item was (probably) not present before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] >> bit & 1:
+                self._bits[byte] |= 1 << bit
+                added = True
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position // 8] >> (position % 8) & 1 for position in self._positions(item))
+
+
+class PuzzleDeduplicator:
+    """
+    Index of puzzles already seen in a stream, up to rotations and reflections.
+
+    Puzzles are identified by SnakePuzzle.fingerprint. By default the fingerprints
+    are kept in an exact set. With bloom_capacity, a BloomFilter of fixed size is
+    used instead, which bounds memory for very large corpora at the cost of
+    occasionally dropping a new puzzle as a false duplicate.
+    """
+
+    def __init__(self, bloom_capacity: Optional[int] = None, false_positive_rate: float = 0.001):
+        """
+        Initialize an empty index.
+
+        Args:
+            bloom_capacity: Expected number of unique puzzles for a Bloom filter
+                            index (None for an exact set)
+            false_positive_rate: Target false-positive probability of the Bloom filter
+        """
+        self._exact: Optional[Set[str]] = set() if bloom_capacity is None else None
+        self._bloom = BloomFilter(bloom_capacity, false_positive_rate) if bloom_capacity is not None else None
+        self._stats: Dict[str, int] = {'seen': 0, 'unique': 0, 'duplicates': 0}
+
+    def add(self, puzzle: BaseSnakePuzzle) -> bool:
+        """
+        Record a puzzle.
+
+        Args:
+            puzzle: The puzzle to record
+
+        Returns:
+            True if the puzzle is new, False if it (or a symmetric copy) was seen before
+        """
+        fingerprint = puzzle.fingerprint()
+        if self._exact is not None:
+            is_new = fingerprint not in self._exact
+            self._exact.add(fingerprint)
+        else:
+            is_new = self._bloom.add(fingerprint)  # type: ignore
+
+        self._stats['seen'] += 1
+        self._stats['unique' if is_new else 'duplicates'] += 1
+        return is_new
+
+    def __contains__(self, puzzle: BaseSnakePuzzle) -> bool:
+        fingerprint = puzzle.fingerprint()
+        if self._exact is not None:
+            return fingerprint in self._exact
+        return fingerprint in self._bloom  # type: ignore
+
+    def __len__(self) -> int:
+        return self._stats['unique']
+
+    def filter(self, items: Iterable[Tuple[BaseSnakePuzzle, Set[Tuple[int, int]]]]
+               ) -> Iterator[Tuple[BaseSnakePuzzle, Set[Tuple[int, int]]]]:
+        """
+        Lazily drop duplicate puzzles from a stream of (puzzle, solution) pairs.
+
+        Args:
+            items: Iterable of (SnakePuzzle, solution) pairs, e.g. from iter_generate
+
+        Yields:
+            The pairs whose puzzle was not seen before
+        """
+        for item in items:
+            if self.add(item[0]):
+                yield item
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get counts of the puzzles recorded so far.
+
+        Returns:
+            Dictionary with the number of puzzles seen, unique puzzles and duplicates
+        """
+        return self._stats.copy()
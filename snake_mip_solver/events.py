@@ -0,0 +1,123 @@
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+import logging
+import time
+
+
+# Progress event kinds, in the order they occur during a solve
+EVENT_KINDS = ('solve_started', 'iteration_started', 'backend_status', 'components_found',
+               'cuts_added', 'window_solved', 'incumbent_found', 'finished')
+
+# Events are also logged at DEBUG level, with the event attached as record.event
+logger = logging.getLogger('snake_mip_solver')
+
+
+@dataclass
+class ProgressEvent:
+    """
+    Progress report emitted during SnakeSolver.solve and LNSSolver.solve.
+
+    Attributes:
+        kind: One of EVENT_KINDS
+        iteration: Cutting plane iteration (1-based, 0 before the first iteration)
+        elapsed: Seconds since the solve started
+        data: Details of the event:
+              - solve_started: info (get_solver_info), max_iterations
+              - iteration_started: no details
+              - backend_status: status (backend status code), name (e.g. 'OPTIMAL')
+              - components_found: count, sizes (cells per component of the returned
+                solution), solutions (disconnected solutions in the solution pool)
+              - cuts_added: count, total (cuts added during this solve)
+              - window_solved (LNSSolver only): window (top, left, height, width),
+                accepted, improved, violation (remaining sum violation)
+              - incumbent_found: cells (number of cells of the valid solution)
+              - finished: status (as get_solve_status), plus rule for 'invalid',
+                backend_status for 'not_solved' and violation for LNSSolver
+    """
+    kind: str
+    iteration: int
+    elapsed: float
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+# A listener receives every event. Returning False stops the solve.
+ProgressCallback = Callable[[ProgressEvent], Optional[bool]]
+
+
+class ProgressEmitter:
+    """
+    Delivers the events of one solve to its listeners and to the logger.
+
+    Evaluates to False when nobody is listening, so callers can skip building
+    event details entirely.
+    """
+
+    def __init__(self, listeners: List[ProgressCallback]):
+        """
+        Initialize the emitter.
+
+        Args:
+            listeners: Callbacks receiving each event
+        """
+        self.listeners = listeners
+        self.log = logger.isEnabledFor(logging.DEBUG)
+        self.start_time = time.perf_counter()
+
+    def __bool__(self) -> bool:
+        return bool(self.listeners) or self.log
+
+    def emit(self, kind: str, iteration: int, **data: Any) -> bool:
+        """
+        Send an event to every listener.
+
+        Args:
+            kind: One of EVENT_KINDS
+            iteration: Current cutting plane iteration
+            **data: Details of the event
+
+        Returns:
+            False if a listener asked to stop the solve, True otherwise
+        """
+        if not self:
+            return True
+        event = ProgressEvent(kind, iteration, time.perf_counter() - self.start_time, data)
+        if self.log:
+            logger.debug("%s (iteration %d): %s", kind, iteration, data, extra={'event': event})
+        proceed = True
+        for listener in self.listeners:
+            if listener(event) is False:
+                proceed = False
+        return proceed
+
+
+def print_progress(event: ProgressEvent) -> None:
+    """Listener that prints the verbose output of SnakeSolver.solve."""
+    data = event.data
+    if event.kind == 'solve_started':
+        print("Solving Snake puzzle...")
+        for key, value in data['info'].items():
+            print(f"  {key}: {value}")
+    elif event.kind == 'iteration_started':
+        if event.iteration > 1:
+            print(f"Iteration {event.iteration}")
+    elif event.kind == 'components_found':
+        print(f"Found disconnected solution with {data['count']} components, adding cutting plane constraint")
+    elif event.kind == 'window_solved':
+        if data['improved']:
+            print(f"Iteration {event.iteration}: {data['violation']} sum violations left")
+    elif event.kind == 'incumbent_found':
+        print(f"Valid solution found with {data['cells']} cells")
+    elif event.kind == 'finished':
+        status = data['status']
+        if status == 'invalid':
+            print(f"Solution failed validation for reasons other than connectivity: {data['rule']}")
+        elif status == 'infeasible':
+            print("No solution exists for this puzzle")
+        elif status == 'not_solved':
+            print(f"Solver status: {data['backend_status']}")
+        elif status == 'iteration_limit':
+            print(f"No valid solution found after {event.iteration} iterations")
+        elif status == 'time_limit':
+            print(f"Time limit reached with {data['violation']} sum violations left")
+        elif status == 'stopped':
+            print("Solve stopped by a progress listener")
@@ -1,6 +1,10 @@
-from typing import Set, Tuple, Optional, List, Union
+from typing import Deque, Dict, Set, Tuple, Optional, List, Union, Iterator
+from collections import deque
+from concurrent.futures import Future
+from itertools import islice, repeat
 import random
-from .puzzle import SnakePuzzle
+import time
+from .puzzle import BaseSnakePuzzle, SnakePuzzle, get_grid_adjacency
 
 
 class SnakePuzzleGenerator:
@@ -11,21 +15,45 @@ class SnakePuzzleGenerator:
     snake paths and deriving constraints from them.
     """
     
-    def __init__(self, seed: Optional[int] = None):
+    ENGINES = ('walk', 'bitboard', 'markov')
+    
+    # Reptation moves attempted per grid cell by the 'markov' engine
+    MARKOV_MOVES_PER_CELL = 20
+    
+    def __init__(self, seed: Optional[int] = None, engine: str = 'bitboard'):
         """
         Initialize the puzzle generator.
         
         Args:
             seed: Optional random seed for reproducible generation
+            engine: Path growth engine: 'walk' checks each move against a set of
+                    path cells, 'bitboard' keeps row-wise bitmasks of occupied and
+                    blocked cells so each move check is O(1). Both consume the
+                    random stream identically and generate the same puzzles.
+                    'markov' starts from a dense serpentine path and randomizes it
+                    with local moves, so it reaches fills close to the maximum.
+                    
+        Raises:
+            ValueError: If the engine is unknown
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown generation engine '{engine}'")
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self.engine = engine
+        # Each generator owns its random stream, so generators never interfere with
+        # each other or with the global random module
+        self._rng = random.Random(seed)
+        self._generation_stats: Dict[str, float] = {}
+        # Path growth attempts made by the current generate or generate_unique call
+        self._path_attempts = 0
     
     def generate(self, rows: int, cols: int, fill_percentage: float = 0.3) -> Tuple[SnakePuzzle, Set[Tuple[int, int]]]:
         """
         Generate a random Snake puzzle using organic path growth.
         
+        The number of path growth attempts and the elapsed time are available from
+        get_generation_stats afterwards, also when generation fails.
+        
         Args:
             rows: Number of rows in the puzzle (must be > 0)
             cols: Number of columns in the puzzle (must be > 0) 
@@ -38,15 +66,191 @@ class SnakePuzzleGenerator:
             ValueError: If parameters are invalid
             RuntimeError: If puzzle generation fails after maximum attempts
         """
-        if rows <= 0 or cols <= 0:
-            raise ValueError("Rows and columns must be positive")
-        if not (0.0 < fill_percentage <= 1.0):
-            raise ValueError("Fill percentage must be between 0.0 and 1.0")
+        self._validate_parameters(rows, cols, fill_percentage)
         
         # Reset seed for consistent generation if provided
         if self.seed is not None:
-            random.seed(self.seed)
+            self._rng.seed(self.seed)
+        
+        start_time = time.perf_counter()
+        self._path_attempts = 0
+        try:
+            return self._generate_puzzle(rows, cols, fill_percentage)
+        finally:
+            self._generation_stats = {
+                'path_attempts': self._path_attempts,
+                'elapsed_seconds': time.perf_counter() - start_time,
+            }
+    
+    def generate_unique(self, rows: int, cols: int, fill_percentage: float = 0.3,
+                        max_attempts: int = 100, max_iterations: int = 100,
+                        solver_type: str = 'SCIP') -> Tuple[SnakePuzzle, Set[Tuple[int, int]]]:
+        """
+        Generate a random Snake puzzle that is proven to have exactly one solution.
+        
+        For each candidate, the generated path is excluded from a single solver model
+        with a no-good cut and the model is solved again (adding connectivity cuts to the
+        same model as needed). The candidate is rejected as soon as another solution
+        is found; it is accepted once the model is proven infeasible.
+        
+        Statistics, including the throughput in unique puzzles per second, are
+        available from get_generation_stats afterwards, also when generation fails.
+        
+        Args:
+            rows: Number of rows in the puzzle (must be > 0)
+            cols: Number of columns in the puzzle (must be > 0)
+            fill_percentage: Target percentage of cells to fill (0.0 to 1.0)
+            max_attempts: Maximum number of candidate puzzles to try
+            max_iterations: Maximum number of cutting plane iterations per uniqueness check
+            solver_type: The solver type used for the uniqueness check
+            
+        Returns:
+            A tuple of (SnakePuzzle instance, its unique solution as set of coordinates)
+            
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If no unique puzzle is found after max_attempts candidates
+        """
+        from .solver import SnakeSolver
+        
+        self._validate_parameters(rows, cols, fill_percentage)
+        
+        if self.seed is not None:
+            self._rng.seed(self.seed)
+        
+        start_time = time.perf_counter()
+        self._path_attempts = 0
+        candidates = 0
+        rejected = 0
+        result = None
+        
+        try:
+            for attempt in range(max_attempts):
+                candidates += 1
+                puzzle, snake_path = self._generate_puzzle(rows, cols, fill_percentage)
+                
+                solver = SnakeSolver(puzzle, solver_type=solver_type)
+                solver.exclude_solution(snake_path)
+                solver.solve(max_iterations=max_iterations)
+                
+                if solver.get_solve_status() == 'infeasible':
+                    result = (puzzle, snake_path)
+                    break
+                
+                # Another solution exists (or uniqueness could not be proven) - reject early
+                rejected += 1
+        finally:
+            elapsed = time.perf_counter() - start_time
+            unique = 1 if result is not None else 0
+            self._generation_stats = {
+                'candidates': candidates,
+                'rejected': rejected,
+                'path_attempts': self._path_attempts,
+                'unique': unique,
+                'elapsed_seconds': elapsed,
+                'unique_per_second': unique / elapsed if elapsed > 0 else 0.0,
+            }
+        
+        if result is None:
+            raise RuntimeError(f"Failed to generate a unique puzzle after {max_attempts} attempts")
+        return result
+    
+    def minimize_clues(self, puzzle: BaseSnakePuzzle, solution: Set[Tuple[int, int]],
+                       order: str = 'greedy', max_iterations: int = 100,
+                       solver_type: str = 'SCIP') -> BaseSnakePuzzle:
+        """
+        Remove row and column clues while the puzzle keeps its unique solution.
+        
+        A single solver model is built with the known solution excluded by a no-good
+        cut. Each clue is removed in turn by relaxing the bounds of its constraint,
+        and the model is solved again. The removal is kept if the model stays
+        infeasible (no other solution exists) and undone otherwise. Connectivity
+        cuts learned along the way stay in the model, so later checks do not start
+        from scratch. Each kept removal needs a full infeasibility proof,
+        so minimizing a 15x15 puzzle still takes minutes.
+        
+        Args:
+            puzzle: Puzzle with a unique solution
+            solution: Its solution as set of coordinates
+            order: 'greedy' tries the least informative clues first (sums furthest
+                   from 0 and from the full line length), 'random' shuffles the clues
+                   using the generator's random stream
+            max_iterations: Maximum number of cutting plane iterations per uniqueness check
+            solver_type: The solver type used for the uniqueness checks
+            
+        Returns:
+            A new puzzle of the same type with the removed clues set to None
+            
+        Raises:
+            ValueError: If the order is unknown or the puzzle does not have solution
+                        as its unique solution
+        """
+        from .solver import SnakeSolver
         
+        if order not in ('greedy', 'random'):
+            raise ValueError(f"Unknown clue order '{order}'")
+        if not puzzle.is_valid_solution(solution):
+            raise ValueError("Solution is not a valid solution of the puzzle")
+        
+        solver = SnakeSolver(puzzle, solver_type=solver_type)
+        solver.exclude_solution(solution)
+        solver.solve(max_iterations=max_iterations)
+        if solver.get_solve_status() != 'infeasible':
+            raise ValueError("Puzzle does not have a unique solution")
+        
+        clues = [('row', index, value) for index, value in enumerate(puzzle.row_sums) if value is not None]
+        clues += [('col', index, value) for index, value in enumerate(puzzle.col_sums) if value is not None]
+        if order == 'random':
+            self._rng.shuffle(clues)
+        else:
+            # A sum of 0 or of the full line length fixes every cell of the line, while
+            # sums near half the line length carry the least information
+            def information(clue: Tuple[str, int, int]) -> float:
+                length = puzzle.cols if clue[0] == 'row' else puzzle.rows
+                return abs(clue[2] - length / 2) / length
+            clues.sort(key=information)
+        
+        # Other solutions found along the way. A clue has to be kept without solving
+        # again if one of them satisfies all remaining clues.
+        witnesses: List[Set[Tuple[int, int]]] = []
+        
+        for kind, index, value in clues:
+            set_sum = solver.set_row_sum if kind == 'row' else solver.set_col_sum
+            set_sum(index, None)
+            if any(solver.puzzle.is_valid_solution(witness) for witness in witnesses):
+                set_sum(index, value)
+                continue
+            
+            witness = solver.solve(max_iterations=max_iterations)
+            if solver.get_solve_status() != 'infeasible':
+                # Another solution appeared (or uniqueness could not be proven) - keep the clue
+                if witness is not None:
+                    witnesses.append(witness)
+                set_sum(index, value)
+        
+        return solver.puzzle
+    
+    def get_generation_stats(self) -> Dict[str, float]:
+        """
+        Get statistics from the last generate or generate_unique call.
+        
+        Returns:
+            Dictionary with the number of path growth attempts and elapsed seconds.
+            After generate_unique also the number of candidates tried and rejected,
+            the number of unique puzzles found and unique puzzles per second
+        """
+        return self._generation_stats.copy()
+    
+    def _validate_parameters(self, rows: int, cols: int, fill_percentage: float) -> None:
+        """Validate generation parameters."""
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Rows and columns must be positive")
+        if not (0.0 < fill_percentage <= 1.0):
+            raise ValueError("Fill percentage must be between 0.0 and 1.0")
+    
+    def _generate_puzzle(self, rows: int, cols: int,
+                         fill_percentage: float) -> Tuple[SnakePuzzle, Set[Tuple[int, int]]]:
+        """Generate one puzzle from the current state of the random stream."""
         # Calculate realistic target length based on snake constraints
         target_length = max(2, int(rows * cols * fill_percentage))
         
@@ -54,7 +258,13 @@ class SnakePuzzleGenerator:
         max_attempts = 50
         
         for attempt in range(max_attempts):
-            result = self._generate_snake_path(rows, cols, target_length)
+            self._path_attempts += 1
+            if self.engine == 'markov':
+                result = self._generate_snake_path_markov(rows, cols, target_length)
+            elif self.engine == 'bitboard':
+                result = self._generate_snake_path_bitboard(rows, cols, target_length)
+            else:
+                result = self._generate_snake_path(rows, cols, target_length)
             if result is not None:
                 snake_path, start_cell, end_cell = result
                 break
@@ -78,6 +288,119 @@ class SnakePuzzleGenerator:
         else:
             raise RuntimeError("Generated path is not a valid solution")
     
+    def generate_many(self, n: int, rows: int, cols: int, fill_percentage: float = 0.3,
+                      workers: int = 1) -> List[Tuple[SnakePuzzle, Set[Tuple[int, int]]]]:
+        """
+        Generate several independent random Snake puzzles, optionally in parallel.
+        
+        Each puzzle is generated from its own random stream, spawned from the
+        generator seed with numpy's SeedSequence. The result is therefore
+        reproducible for a given seed and independent of the number of workers.
+        
+        Args:
+            n: Number of puzzles to generate
+            rows: Number of rows in each puzzle (must be > 0)
+            cols: Number of columns in each puzzle (must be > 0)
+            fill_percentage: Target percentage of cells to fill (0.0 to 1.0)
+            workers: Number of worker processes (1 generates in the current process)
+            
+        Returns:
+            List of (SnakePuzzle instance, solution path as set of coordinates) tuples
+            
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If generation of any puzzle fails after maximum attempts
+        """
+        if n < 0:
+            raise ValueError("Number of puzzles must be non-negative")
+        if workers <= 0:
+            raise ValueError("Number of workers must be positive")
+        
+        seeds = _spawn_seeds(self.seed, n)
+        args = (seeds, repeat(rows), repeat(cols), repeat(fill_percentage), repeat(self.engine))
+        
+        if workers == 1 or n <= 1:
+            return list(map(_generate_from_seed, *args))
+        
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, n // (workers * 4))
+            return list(executor.map(_generate_from_seed, *args, chunksize=chunksize))
+    
+    def iter_generate(self, rows: int, cols: int, fill_percentage: float = 0.3,
+                      n: Optional[int] = None, prefetch: int = 0, workers: int = 1,
+                      background: str = 'process') -> Iterator[Tuple[SnakePuzzle, Set[Tuple[int, int]]]]:
+        """
+        Lazily generate random Snake puzzles, one at a time.
+        
+        Puzzles come from the same per-puzzle random streams as generate_many, so
+        the first n puzzles are identical to generate_many(n, ...) for the same seed.
+        
+        With prefetch > 0, up to prefetch puzzles are generated ahead of the consumer
+        in the background, overlapping generation with downstream work. Generation
+        pauses once prefetch puzzles are waiting (backpressure), so memory stays
+        bounded however slowly the puzzles are consumed. Errors raised while
+        generating are re-raised when the failing puzzle is reached. Closing the
+        iterator early cancels pending work.
+        
+        Args:
+            rows: Number of rows in each puzzle (must be > 0)
+            cols: Number of columns in each puzzle (must be > 0)
+            fill_percentage: Target percentage of cells to fill (0.0 to 1.0)
+            n: Number of puzzles to generate (None for an infinite stream)
+            prefetch: Maximum number of puzzles generated ahead (0 generates each
+                      puzzle on demand in the calling thread)
+            workers: Number of background workers used when prefetching
+            background: 'process' (generation runs in parallel with the consumer)
+                        or 'thread' (no pickling, but shares the interpreter lock)
+            
+        Yields:
+            (SnakePuzzle instance, solution path as set of coordinates) tuples
+            
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If generation of a puzzle fails after maximum attempts
+        """
+        if n is not None and n < 0:
+            raise ValueError("Number of puzzles must be non-negative")
+        if prefetch < 0:
+            raise ValueError("Prefetch must be non-negative")
+        if workers <= 0:
+            raise ValueError("Number of workers must be positive")
+        if background not in ('process', 'thread'):
+            raise ValueError(f"Unknown background mode '{background}'")
+        self._validate_parameters(rows, cols, fill_percentage)
+        
+        return self._iter_generate(rows, cols, fill_percentage, n, prefetch, workers, background)
+    
+    def _iter_generate(self, rows: int, cols: int, fill_percentage: float, n: Optional[int],
+                       prefetch: int, workers: int,
+                       background: str) -> Iterator[Tuple[SnakePuzzle, Set[Tuple[int, int]]]]:
+        """Generator body of iter_generate, so parameter errors are raised on the call."""
+        seeds = _iter_seeds(self.seed)
+        if n is not None:
+            seeds = islice(seeds, n)
+        
+        if prefetch == 0:
+            for seed in seeds:
+                yield _generate_from_seed(seed, rows, cols, fill_percentage, self.engine)
+            return
+        
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        executor_class = ProcessPoolExecutor if background == 'process' else ThreadPoolExecutor
+        executor = executor_class(max_workers=workers)
+        pending: Deque[Future] = deque()
+        try:
+            for seed in seeds:
+                pending.append(executor.submit(_generate_from_seed, seed, rows, cols, fill_percentage, self.engine))
+                if len(pending) > prefetch:
+                    # prefetch puzzles stay in flight while the consumer works on this one
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def _generate_snake_path(self, rows: int, cols: int, 
                                 target_length: int) -> Optional[Tuple[Set[Tuple[int, int]], Tuple[int, int], Tuple[int, int]]]:
         """
@@ -98,7 +421,7 @@ class SnakePuzzleGenerator:
         for attempt in range(max_attempts):
             
             # Start with a random cell
-            start_pos = (random.randint(0, rows - 1), random.randint(0, cols - 1))
+            start_pos = (self._rng.randint(0, rows - 1), self._rng.randint(0, cols - 1))
             path = [start_pos]
             path_set = {start_pos}
             
@@ -150,7 +473,7 @@ class SnakePuzzleGenerator:
                 
                 if valid_moves:
                     # Grow the path
-                    next_pos = random.choice(valid_moves)
+                    next_pos = self._rng.choice(valid_moves)
                     path.append(next_pos)
                     path_set.add(next_pos)
                     stuck_count = 0  # Reset stuck counter
@@ -160,7 +483,7 @@ class SnakePuzzleGenerator:
                         break
                     
                     # Remove 1-2 recent cells
-                    backtrack_amount = min(random.randint(1, 2), len(path) - 1)
+                    backtrack_amount = min(self._rng.randint(1, 2), len(path) - 1)
                     for _ in range(backtrack_amount):
                         if len(path) > 1:
                             removed = path.pop()
@@ -175,6 +498,225 @@ class SnakePuzzleGenerator:
         
         return None  # Failed to generate valid path
 
+    def _generate_snake_path_bitboard(self, rows: int, cols: int,
+                                      target_length: int) -> Optional[Tuple[Set[Tuple[int, int]], Tuple[int, int], Tuple[int, int]]]:
+        """
+        Generate a valid snake path like _generate_snake_path, using bitboards.
+        
+        A move from the head of the path is valid exactly when the new cell is not
+        occupied and does not touch (orthogonally or diagonally) any path cell other
+        than the last two. Row-wise integer bitmasks keep the occupied cells and the
+        cells blocked by that rule, so each move check is a single bit test. When a
+        cell is pushed, the cell two steps behind it starts blocking its 3x3
+        neighbourhood; the three affected rows are saved on a stack and restored
+        when the cell is popped again.
+        
+        Random numbers are drawn in the same order as _generate_snake_path, so both
+        engines produce the same path for the same random state.
+        
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+            target_length: Desired path length
+            
+        Returns:
+            Tuple of (path_set, start_cell, end_cell) if successful, None if failed
+        """
+        max_attempts = 30
+        
+        for attempt in range(max_attempts):
+            start_pos = (self._rng.randint(0, rows - 1), self._rng.randint(0, cols - 1))
+            path = [start_pos]
+            
+            # Rows are offset by one so the 3x3 neighbourhood of border cells needs no bounds checks
+            occupied = [0] * (rows + 2)
+            blocked = [0] * (rows + 2)
+            occupied[start_pos[0] + 1] |= 1 << start_pos[1]
+            saved_rows: List[Optional[Tuple[int, int, int, int]]] = [None]
+            
+            max_steps = target_length * 4
+            steps = 0
+            stuck_count = 0
+            max_stuck = 5
+            
+            while len(path) < target_length and steps < max_steps and stuck_count < max_stuck:
+                steps += 1
+                r, c = path[-1]
+                
+                valid_moves = []
+                for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    if 0 <= nr < rows and 0 <= nc < cols and not (occupied[nr + 1] | blocked[nr + 1]) >> nc & 1:
+                        valid_moves.append((nr, nc))
+                
+                if valid_moves:
+                    next_pos = self._rng.choice(valid_moves)
+                    path.append(next_pos)
+                    occupied[next_pos[0] + 1] |= 1 << next_pos[1]
+                    if len(path) >= 3:
+                        # The cell two steps behind the new head now blocks its neighbourhood
+                        qr, qc = path[-3]
+                        saved_rows.append((qr, blocked[qr], blocked[qr + 1], blocked[qr + 2]))
+                        neighbourhood = (7 << qc) >> 1
+                        blocked[qr] |= neighbourhood
+                        blocked[qr + 1] |= neighbourhood
+                        blocked[qr + 2] |= neighbourhood
+                    else:
+                        saved_rows.append(None)
+                    stuck_count = 0
+                else:
+                    if len(path) <= 1:
+                        break
+                    
+                    backtrack_amount = min(self._rng.randint(1, 2), len(path) - 1)
+                    for _ in range(backtrack_amount):
+                        if len(path) > 1:
+                            removed = path.pop()
+                            occupied[removed[0] + 1] &= ~(1 << removed[1])
+                            saved = saved_rows.pop()
+                            if saved is not None:
+                                qr, blocked[qr], blocked[qr + 1], blocked[qr + 2] = saved
+                    
+                    stuck_count += 1
+            
+            if len(path) >= target_length:
+                return set(path), path[0], path[-1]
+        
+        return None
+
+    def _generate_snake_path_markov(self, rows: int, cols: int,
+                                    target_length: int) -> Optional[Tuple[Set[Tuple[int, int]], Tuple[int, int], Tuple[int, int]]]:
+        """
+        Generate a valid snake path with a path-mutation Markov chain.
+        
+        The chain starts from a random window of target_length cells of a serpentine
+        path (full rows or columns joined by single connector cells), which is the
+        densest non-touching path the grid allows. It then applies two kinds of
+        length-preserving moves, each accepted only if the result is still a valid
+        non-touching path:
+        
+        - reptation: an end of the path advances to a neighbouring cell while the
+          other end retracts by one cell. The same end keeps advancing until a move
+          is rejected, so the path slides along its length.
+        - corner flip: a cell where the path turns moves to the opposite corner of
+          the 2x2 block it forms with its two path neighbours.
+        
+        Backbite moves, which reconnect the head to an arbitrary neighbouring path
+        cell, cannot be used because they always create a forbidden contact.
+        
+        The path is a linked list over flat cell indices, and a count of path cells
+        in the 3x3 neighbourhood of every cell makes each acceptance check O(1).
+        The number of attempted moves is proportional to the grid area.
+        
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+            target_length: Desired path length
+            
+        Returns:
+            Tuple of (path_set, start_cell, end_cell), or None if target_length
+            exceeds the longest serpentine path of the grid
+        """
+        serpentine = _serpentine_order(rows, cols)
+        if target_length > len(serpentine):
+            return None
+        
+        offset = self._rng.randint(0, len(serpentine) - target_length)
+        cells = serpentine[offset:offset + target_length]
+        
+        adjacency = get_grid_adjacency(rows, cols)
+        orthogonal = adjacency.orthogonal
+        neighbourhood = [frozenset((cell,) + adjacency.orthogonal[cell] + adjacency.diagonal[cell])
+                         for cell in range(rows * cols)]
+        
+        # Linked list of path cells, the list of cells (for sampling) and the position of each cell in it
+        previous = [-1] * (rows * cols)
+        following = [-1] * (rows * cols)
+        for before, after in zip(cells, cells[1:]):
+            following[before] = after
+            previous[after] = before
+        first, last = cells[0], cells[-1]
+        position = {cell: index for index, cell in enumerate(cells)}
+        
+        occupied = [False] * (rows * cols)
+        nearby = [0] * (rows * cols)
+        for cell in cells:
+            occupied[cell] = True
+            for near in neighbourhood[cell]:
+                nearby[near] += 1
+        
+        def move_cell(old: int, new: int) -> None:
+            occupied[old] = False
+            for near in neighbourhood[old]:
+                nearby[near] -= 1
+            occupied[new] = True
+            for near in neighbourhood[new]:
+                nearby[near] += 1
+            index = position.pop(old)
+            cells[index] = new
+            position[new] = index
+        
+        forward = True
+        for move in range(self.MARKOV_MOVES_PER_CELL * rows * cols):
+            if target_length > 2 and self._rng.random() < 0.5:
+                # Corner flip of a random interior cell
+                cell = self._rng.choice(cells)
+                before, after = previous[cell], following[cell]
+                if before < 0 or after < 0:
+                    continue
+                row, col = divmod(cell, cols)
+                before_row, before_col = divmod(before, cols)
+                after_row, after_col = divmod(after, cols)
+                if before_row == after_row or before_col == after_col:
+                    continue
+                flipped = (before_row + after_row - row) * cols + (before_col + after_col - col)
+                if occupied[flipped]:
+                    continue
+                # Only the flipped cell, its two path neighbours and their outer neighbours may be nearby
+                allowed = [cell, before, after, previous[before], following[after]]
+                if nearby[flipped] != sum(1 for near in allowed if near >= 0 and near in neighbourhood[flipped]):
+                    continue
+                
+                previous[flipped], following[flipped] = before, after
+                following[before] = flipped
+                previous[after] = flipped
+                previous[cell] = following[cell] = -1
+                move_cell(cell, flipped)
+                continue
+            
+            # Reptation: advance the end at last or, reversed, the end at first
+            if forward:
+                head, behind, tail = last, previous[last], first
+            else:
+                head, behind, tail = first, following[first], last
+            new_head = self._rng.choice(orthogonal[head])
+            
+            # Path cells around the new head, ignoring the two cells behind it and the retracting tail
+            touching = nearby[new_head] - 1 - (behind in neighbourhood[new_head])
+            if tail != behind and tail in neighbourhood[new_head]:
+                touching -= 1
+            if touching or (occupied[new_head] and new_head != tail):
+                # Rejected: continue from a randomly chosen end
+                forward = self._rng.random() < 0.5
+                continue
+            
+            if forward:
+                first = following[tail]
+                previous[first] = -1
+                following[tail] = -1
+                following[head], previous[new_head], following[new_head] = new_head, head, -1
+                last = new_head
+            else:
+                last = previous[tail]
+                following[last] = -1
+                previous[tail] = -1
+                previous[head], following[new_head], previous[new_head] = new_head, head, -1
+                first = new_head
+            if new_head != tail:
+                move_cell(tail, new_head)
+        
+        positions = adjacency.positions
+        return {positions[cell] for cell in cells}, positions[first], positions[last]
+
     def _would_create_diagonal_touching(self, existing_path: Set[Tuple[int, int]], 
                                       new_pos: Tuple[int, int]) -> bool:
         """
@@ -207,3 +749,47 @@ class SnakePuzzleGenerator:
                     return True
         
         return False
+
+
+def _serpentine_order(rows: int, cols: int) -> List[int]:
+    """
+    Flat cell indices of the longest serpentine path, in path order.
+    
+    Every other row (or column, whichever gives the longer path) is filled
+    completely, and consecutive lines are joined by a single connector cell at
+    alternating ends.
+    """
+    def lines_order(lines: int, length: int) -> List[Tuple[int, int]]:
+        order = []
+        for line in range(0, lines, 2):
+            cells = [(line, position) for position in range(length)]
+            order.extend(cells if line % 4 == 0 else reversed(cells))
+            if line + 2 < lines:
+                order.append((line + 1, length - 1 if line % 4 == 0 else 0))
+        return order
+    
+    by_rows = lines_order(rows, cols)
+    by_cols = lines_order(cols, rows)
+    if len(by_cols) > len(by_rows):
+        return [row * cols + col for col, row in by_cols]
+    return [row * cols + col for row, col in by_rows]
+
+
+def _spawn_seeds(seed: Optional[int], n: int) -> List[int]:
+    """Derive n independent stream seeds from a generator seed (fresh entropy if None)."""
+    return list(islice(_iter_seeds(seed), n))
+
+
+def _iter_seeds(seed: Optional[int]) -> Iterator[int]:
+    """Derive an endless sequence of independent stream seeds from a generator seed."""
+    import numpy as np
+    sequence = np.random.SeedSequence(seed)
+    while True:
+        child, = sequence.spawn(1)
+        yield int.from_bytes(child.generate_state(4).tobytes(), 'little')
+
+
+def _generate_from_seed(seed: int, rows: int, cols: int, fill_percentage: float,
+                        engine: str) -> Tuple[SnakePuzzle, Set[Tuple[int, int]]]:
+    """Generate one puzzle from its own stream seed. Module level so it can run in worker processes."""
+    return SnakePuzzleGenerator(seed=seed, engine=engine).generate(rows, cols, fill_percentage)
@@ -0,0 +1,277 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .puzzle import BaseSnakePuzzle, ValidationResult
+
+
+class IncrementalValidator:
+    """
+    Board state that keeps its validation up to date as single cells are toggled.
+
+    Intended for interactive play, where the board is checked after every move.
+    Instead of rescanning the whole solution like SnakePuzzle.validate_solution,
+    the validator keeps row and column counts, the number of filled neighbours of
+    every cell, the set of mismatching lines, the cells with a wrong degree, the
+    diagonally touching pairs and a union-find over the filled cells. Toggling a
+    cell updates them in O(1) amortized time.
+
+    Removing a cell cannot be undone in a union-find, so it only marks the
+    components as stale. They are rebuilt in O(|S|) when connectivity is next
+    needed, which is only once every other rule is satisfied.
+    """
+
+    def __init__(self, puzzle: BaseSnakePuzzle, solution: Optional[Iterable[Tuple[int, int]]] = None):
+        """
+        Initialize an empty board, or one with the given cells filled.
+
+        Args:
+            puzzle: The SnakePuzzle instance being played
+            solution: Optional (row, col) positions to fill initially
+
+        Raises:
+            ValueError: If puzzle is not a SnakePuzzle or a position is out of bounds
+        """
+        if not isinstance(puzzle, BaseSnakePuzzle):
+            raise ValueError("Puzzle must be a SnakePuzzle instance")
+
+        self.puzzle = puzzle
+        self._adjacency = puzzle.adjacency
+        rows, cols = puzzle.rows, puzzle.cols
+        num_cells = rows * cols
+
+        self._start = self._adjacency.index(puzzle.start_cell)
+        self._end = self._adjacency.index(puzzle.end_cell)
+        self._filled = bytearray(num_cells)
+        self._cells: Set[int] = set()
+        self._row_counts = [0] * rows
+        self._col_counts = [0] * cols
+        # Number of filled orthogonal neighbours of every cell, filled or not
+        self._degrees = [0] * num_cells
+
+        # Lines whose count differs from their sum (all non-zero clues on an empty board)
+        self._wrong_rows = {row for row, required_sum in enumerate(puzzle.row_sums) if required_sum}
+        self._wrong_cols = {col for col, required_sum in enumerate(puzzle.col_sums) if required_sum}
+        # Filled cells whose degree is not 1 (start and end) or 2 (other cells)
+        self._wrong_degree: Set[int] = set()
+        # Filled diagonal pairs (smaller index first) without a filled shared neighbour
+        self._touching: Set[Tuple[int, int]] = set()
+
+        # Union-find over the filled cells, rebuilt lazily after removals
+        self._parent = list(range(num_cells))
+        self._size = [1] * num_cells
+        self._stale = False
+
+        if solution is not None:
+            for position in solution:
+                self.set_cell(position, True)
+
+    def toggle(self, position: Tuple[int, int]) -> bool:
+        """
+        Toggle one cell.
+
+        Args:
+            position: (row, col) position of the cell
+
+        Returns:
+            True if the cell is now filled, False if it is now empty
+
+        Raises:
+            ValueError: If the position is out of bounds
+        """
+        filled = not self.is_filled(position)
+        self.set_cell(position, filled)
+        return filled
+
+    def set_cell(self, position: Tuple[int, int], filled: bool) -> None:
+        """
+        Fill or empty one cell.
+
+        Args:
+            position: (row, col) position of the cell
+            filled: True to fill the cell, False to empty it
+
+        Raises:
+            ValueError: If the position is out of bounds
+        """
+        cell = self._index(position)
+        if bool(self._filled[cell]) == filled:
+            return
+
+        row, col = position
+        delta = 1 if filled else -1
+        self._filled[cell] = filled
+        if filled:
+            self._cells.add(cell)
+        else:
+            self._cells.discard(cell)
+        self._row_counts[row] += delta
+        self._col_counts[col] += delta
+        self._update_line(self._wrong_rows, row, self._row_counts[row], self.puzzle.row_sums[row])
+        self._update_line(self._wrong_cols, col, self._col_counts[col], self.puzzle.col_sums[col])
+
+        orthogonal = self._adjacency.orthogonal
+        for neighbor in orthogonal[cell]:
+            self._degrees[neighbor] += delta
+            self._update_degree(neighbor)
+        self._update_degree(cell)
+        self._update_touching(row, col)
+
+        if filled:
+            if not self._stale:
+                self._parent[cell] = cell
+                self._size[cell] = 1
+                for neighbor in orthogonal[cell]:
+                    if self._filled[neighbor]:
+                        self._union(cell, neighbor)
+        else:
+            self._stale = True
+
+    def is_filled(self, position: Tuple[int, int]) -> bool:
+        """Check if a cell is filled."""
+        return bool(self._filled[self._index(position)])
+
+    @property
+    def solution(self) -> Set[Tuple[int, int]]:
+        """The filled cells as a set of (row, col) tuples."""
+        positions = self._adjacency.positions
+        return {positions[cell] for cell in self._cells}
+
+    def is_solved(self) -> bool:
+        """
+        Check if the board is a valid solution.
+
+        Runs in O(1) unless only connectivity is left to check after cells were
+        removed, in which case the components are rebuilt once.
+
+        Returns:
+            True if the filled cells satisfy all puzzle constraints
+        """
+        if not (self._filled[self._start] and self._filled[self._end]):
+            return False
+        if self._wrong_rows or self._wrong_cols or self._touching or self._wrong_degree:
+            return False
+        return self._size[self._find(self._start)] == len(self._cells)
+
+    def validate(self) -> ValidationResult:
+        """
+        Report the first violated rule, in the same order as SnakePuzzle.validate_solution.
+
+        Components are only computed when every other rule is satisfied, as with
+        validate_solution(early_exit=True).
+
+        Returns:
+            ValidationResult with the first violated rule and the cells involved
+        """
+        if not self._cells:
+            return ValidationResult(False, 'empty')
+
+        positions = self._adjacency.positions
+        missing = {positions[cell] for cell in (self._start, self._end) if not self._filled[cell]}
+        if missing:
+            return ValidationResult(False, 'missing_endpoint', missing)
+
+        if self._wrong_rows:
+            return ValidationResult(False, 'row_sum', self._line_cells(self._wrong_rows, by_row=True))
+        if self._wrong_cols:
+            return ValidationResult(False, 'col_sum', self._line_cells(self._wrong_cols, by_row=False))
+        if self._touching:
+            return ValidationResult(False, 'diagonal_touching',
+                                    {positions[cell] for pair in self._touching for cell in pair})
+        if self._wrong_degree:
+            return ValidationResult(False, 'degree', {positions[cell] for cell in self._wrong_degree})
+
+        components = self._components()
+        if len(components) > 1:
+            return ValidationResult(False, 'disconnected', set().union(*components[1:]), components)
+        return ValidationResult(True, components=components)
+
+    def _index(self, position: Tuple[int, int]) -> int:
+        """Flat index of a position, checking the bounds."""
+        row, col = position
+        if not self.puzzle.is_within_bounds(row, col):
+            raise ValueError(f"Position {position} is out of bounds")
+        return row * self.puzzle.cols + col
+
+    @staticmethod
+    def _update_line(wrong_lines: Set[int], line: int, count: int, required_sum: Optional[int]) -> None:
+        """Record whether a labelled line matches its sum."""
+        if required_sum is None or count == required_sum:
+            wrong_lines.discard(line)
+        else:
+            wrong_lines.add(line)
+
+    def _update_degree(self, cell: int) -> None:
+        """Record whether a cell has the required number of filled neighbours."""
+        required = 1 if cell == self._start or cell == self._end else 2
+        if self._filled[cell] and self._degrees[cell] != required:
+            self._wrong_degree.add(cell)
+        else:
+            self._wrong_degree.discard(cell)
+
+    def _update_touching(self, row: int, col: int) -> None:
+        """Recheck both diagonal pairs of the (up to) four 2x2 blocks containing a cell."""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        filled = self._filled
+        for top in (row - 1, row):
+            for left in (col - 1, col):
+                if not (0 <= top < rows - 1 and 0 <= left < cols - 1):
+                    continue
+                top_left = top * cols + left
+                top_right = top_left + 1
+                bottom_left = top_left + cols
+                bottom_right = bottom_left + 1
+                for pair, shared in (((top_left, bottom_right), (top_right, bottom_left)),
+                                     ((top_right, bottom_left), (top_left, bottom_right))):
+                    if filled[pair[0]] and filled[pair[1]] and not filled[shared[0]] and not filled[shared[1]]:
+                        self._touching.add(pair)
+                    else:
+                        self._touching.discard(pair)
+
+    def _line_cells(self, lines: Set[int], by_row: bool) -> Set[Tuple[int, int]]:
+        """Filled cells of the given rows or columns."""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        filled = self._filled
+        if by_row:
+            return {(row, col) for row in lines for col in range(cols) if filled[row * cols + col]}
+        return {(row, col) for col in lines for row in range(rows) if filled[row * cols + col]}
+
+    def _find(self, cell: int) -> int:
+        """Root of a filled cell's component, rebuilding stale components first."""
+        if self._stale:
+            self._rebuild()
+        parent = self._parent
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    def _union(self, first: int, second: int) -> None:
+        """Merge the components of two filled cells, by size."""
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return
+        if self._size[first] < self._size[second]:
+            first, second = second, first
+        self._parent[second] = first
+        self._size[first] += self._size[second]
+
+    def _rebuild(self) -> None:
+        """Recompute the union-find from the filled cells after removals."""
+        self._stale = False
+        orthogonal = self._adjacency.orthogonal
+        for cell in self._cells:
+            self._parent[cell] = cell
+            self._size[cell] = 1
+        for cell in self._cells:
+            for neighbor in orthogonal[cell]:
+                if neighbor > cell and self._filled[neighbor]:
+                    self._union(cell, neighbor)
+
+    def _components(self) -> List[Set[Tuple[int, int]]]:
+        """Connected components of the filled cells, the one containing the start cell first."""
+        positions = self._adjacency.positions
+        groups: Dict[int, Set[Tuple[int, int]]] = {}
+        for cell in self._cells:
+            groups.setdefault(self._find(cell), set()).add(positions[cell])
+        start_root = self._find(self._start)
+        return [groups[start_root]] + [group for root, group in groups.items() if root != start_root]
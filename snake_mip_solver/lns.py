@@ -0,0 +1,481 @@
+from .puzzle import BaseSnakePuzzle, Solution, SOLUTION_FORMATS
+from .events import ProgressCallback, ProgressEmitter, print_progress
+from ortools.linear_solver import pywraplp
+from typing import Dict, List, Optional, Set, Tuple
+import random
+import time
+
+
+# Window as (top, left, height, width)
+Window = Tuple[int, int, int, int]
+
+
+class LNSSolver:
+    """
+    Large-neighbourhood search solver for very large Snake puzzles.
+
+    Instead of one model of the whole grid, the search keeps a valid snake from the
+    start cell to the end cell that may violate the row and column sums. It starts
+    from an L-shaped path and repeatedly frees a square window of cells, keeping
+    every cell outside it fixed, and re-solves only that window as a small MIP that
+    minimizes the sum violations of the lines crossing it. A flow from the snake
+    outside the window keeps loops from closing inside it, and loops closed through
+    cells outside it are removed with connectivity cuts, as in SnakeSolver. The new
+    window contents are kept unless they increase the violation.
+
+    Windows are placed where violated lines can be fixed, and grow when several
+    rounds bring no improvement. Memory use is bounded by the window size, not the
+    grid size. The search is a heuristic: it stops once all sums are met, but
+    cannot prove that a puzzle has no solution.
+    """
+
+    # Rounds without improvement before the window grows
+    STALL_ROUNDS = 20
+
+    # Connectivity cut rounds per window before it is given up
+    MAX_WINDOW_CUT_ROUNDS = 20
+
+    def __init__(self, puzzle: BaseSnakePuzzle, window_size: int = 6, max_window_size: int = 10,
+                 solver_type: str = 'SCIP', seed: Optional[int] = None):
+        """
+        Initialize the solver with a puzzle.
+
+        Args:
+            puzzle: The SnakePuzzle instance to solve
+            window_size: Side length of the freed window
+            max_window_size: Side length the window grows to while the search stalls
+            solver_type: The solver type used for the window models (default: 'SCIP')
+            seed: Optional random seed for reproducible window choices
+
+        Raises:
+            ValueError: If puzzle is invalid, the window sizes are invalid or solver creation fails
+        """
+        if not isinstance(puzzle, BaseSnakePuzzle):
+            raise ValueError("Puzzle must be a SnakePuzzle instance")
+        if window_size < 2 or max_window_size < window_size:
+            raise ValueError("Window size must be at least 2 and at most max_window_size")
+        if not pywraplp.Solver.CreateSolver(solver_type):
+            raise ValueError(f"Could not create solver of type '{solver_type}'")
+
+        self.puzzle = puzzle
+        self.window_size = window_size
+        self.max_window_size = max_window_size
+        self.solver_type = solver_type
+        self._rng = random.Random(seed)
+        self._adjacency = puzzle.adjacency
+        self._endpoints = {self._adjacency.index(puzzle.start_cell), self._adjacency.index(puzzle.end_cell)}
+
+        # Current snake: filled flag per flat cell index and filled cells per line
+        self._filled = bytearray(puzzle.rows * puzzle.cols)
+        self._row_counts = [0] * puzzle.rows
+        self._col_counts = [0] * puzzle.cols
+
+        self._solve_stats: Dict[str, int] = {
+            'iterations': 0,
+            'windows_accepted': 0,
+            'windows_improved': 0,
+            'cutting_planes_added': 0,
+            'initial_violation': 0,
+            'violation': 0
+        }
+        self._solve_status: Optional[str] = None
+
+    def solve(self, verbose: bool = False, max_iterations: int = 1000, time_limit: Optional[float] = None,
+              window_time_limit: float = 2.0, result_format: str = 'set',
+              callback: Optional[ProgressCallback] = None) -> Optional[Solution]:
+        """
+        Search for a solution by re-solving one window per iteration.
+
+        Progress is reported as ProgressEvent objects: 'solve_started', a
+        'window_solved' event per iteration with the remaining sum violation, and
+        'finished'.
+
+        Args:
+            verbose: If True, print progress whenever the violation decreases
+            max_iterations: Maximum number of windows to solve
+            time_limit: Optional limit on the total search time in seconds
+            window_time_limit: Time limit for each window model in seconds
+            result_format: Representation of the returned solution, one of SOLUTION_FORMATS
+            callback: Called with every progress event. Returning False stops the
+                      search with status 'stopped'
+
+        Returns:
+            The snake in the requested format once all sums are met, or None
+            (see get_current_solution for the best snake found)
+
+        Raises:
+            ValueError: If the result format is unknown
+        """
+        if result_format not in SOLUTION_FORMATS:
+            raise ValueError(f"Unknown result format '{result_format}'")
+
+        listeners: List[ProgressCallback] = []
+        if verbose:
+            listeners.append(print_progress)
+        if callback is not None:
+            listeners.append(callback)
+        events = ProgressEmitter(listeners)
+
+        self._set_initial_path()
+        violation = self.get_violation()
+        self._solve_stats = {
+            'iterations': 0,
+            'windows_accepted': 0,
+            'windows_improved': 0,
+            'cutting_planes_added': 0,
+            'initial_violation': violation,
+            'violation': violation
+        }
+        start_time = time.perf_counter()
+        iteration = 0
+
+        if events and not events.emit('solve_started', 0, info=self.get_solver_info(),
+                                      max_iterations=max_iterations):
+            return self._finish_solve(events, iteration, 'stopped')
+
+        size = self.window_size
+        stalled = 0
+        status = 'iteration_limit'
+        for iteration in range(1, max_iterations + 1):
+            if violation == 0:
+                break
+            if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+                status = 'time_limit'
+                break
+            self._solve_stats['iterations'] = iteration
+
+            window = self._choose_window(size)
+            accepted = self._solve_window(window, window_time_limit)
+            new_violation = self.get_violation()
+            improved = new_violation < violation
+            self._solve_stats['windows_accepted'] += accepted
+            self._solve_stats['windows_improved'] += improved
+            self._solve_stats['violation'] = new_violation
+            violation = new_violation
+
+            if not events.emit('window_solved', iteration, window=window, accepted=accepted,
+                               improved=improved, violation=violation):
+                return self._finish_solve(events, iteration, 'stopped')
+
+            # Grow the window while the search stalls, shrink it back on progress
+            if improved:
+                size = self.window_size
+                stalled = 0
+            else:
+                stalled += 1
+                if stalled >= self.STALL_ROUNDS:
+                    size = min(size + 2, self.max_window_size)
+                    stalled = 0
+
+        if violation != 0:
+            return self._finish_solve(events, iteration, status)
+
+        solution = self.get_current_solution()
+        result = self.puzzle.validate_solution(solution)
+        if not result.is_valid:
+            return self._finish_solve(events, iteration, 'invalid', rule=result.rule)
+        events.emit('incumbent_found', iteration, cells=len(solution))
+        self._finish_solve(events, iteration, 'solved')
+        if result_format == 'set':
+            return solution
+        return self.puzzle.format_solution(solution, result_format)
+
+    def get_current_solution(self) -> Set[Tuple[int, int]]:
+        """
+        Get the current snake of the search.
+
+        The snake always connects the start and end cells without touching itself,
+        but only satisfies the row and column sums once get_violation() is 0.
+
+        Returns:
+            Set of (row, col) tuples
+        """
+        positions = self._adjacency.positions
+        return {positions[cell] for cell, filled in enumerate(self._filled) if filled}
+
+    def get_violation(self) -> int:
+        """
+        Get the remaining sum violation of the current snake.
+
+        Returns:
+            Sum of |filled cells - required sum| over all labelled rows and columns
+        """
+        return (sum(abs(count - required) for count, required in zip(self._row_counts, self.puzzle.row_sums)
+                    if required is not None) +
+                sum(abs(count - required) for count, required in zip(self._col_counts, self.puzzle.col_sums)
+                    if required is not None))
+
+    def get_solver_info(self) -> Dict[str, str]:
+        """Get information about the solver and problem size."""
+        return {
+            "solver_type": self.solver_type,
+            "method": "large-neighbourhood search",
+            "window_size": f"{self.window_size} to {self.max_window_size}",
+            "puzzle_size": f"{self.puzzle.rows}x{self.puzzle.cols}",
+            "start_cell": str(self.puzzle.start_cell),
+            "end_cell": str(self.puzzle.end_cell)
+        }
+
+    def get_solve_stats(self) -> Dict[str, int]:
+        """
+        Get statistics from the last solve attempt.
+
+        Returns:
+            Dictionary with the number of iterations, accepted and improving windows,
+            cutting planes added, and the initial and remaining sum violation
+        """
+        return self._solve_stats.copy()
+
+    def get_solve_status(self) -> Optional[str]:
+        """
+        Get the outcome of the last solve attempt.
+
+        Returns:
+            'solved', 'iteration_limit', 'time_limit', 'stopped', 'invalid', or None
+            before the first solve
+        """
+        return self._solve_status
+
+    def _finish_solve(self, events: ProgressEmitter, iteration: int, status: str, **data) -> None:
+        """Record the outcome of a search and report it with a 'finished' event."""
+        self._solve_status = status
+        events.emit('finished', iteration, status=status, violation=self.get_violation(), **data)
+
+    def _set_initial_path(self) -> None:
+        """Start from the L-shaped path between the endpoints with the smaller violation."""
+        (start_row, start_col), (end_row, end_col) = self.puzzle.start_cell, self.puzzle.end_cell
+        row_step = 1 if end_row >= start_row else -1
+        col_step = 1 if end_col >= start_col else -1
+        vertical = [(row, start_col) for row in range(start_row, end_row + row_step, row_step)]
+        vertical += [(end_row, col) for col in range(start_col + col_step, end_col + col_step, col_step)]
+        horizontal = [(start_row, col) for col in range(start_col, end_col + col_step, col_step)]
+        horizontal += [(row, end_col) for row in range(start_row + row_step, end_row + row_step, row_step)]
+
+        best = None
+        for path in (vertical, horizontal):
+            self._set_cells(path)
+            violation = self.get_violation()
+            if best is None or violation < best[0]:
+                best = (violation, path)
+        self._set_cells(best[1])  # type: ignore
+
+    def _set_cells(self, path: List[Tuple[int, int]]) -> None:
+        """Replace the current snake by the given cells."""
+        cols = self.puzzle.cols
+        self._filled = bytearray(self.puzzle.rows * cols)
+        self._row_counts = [0] * self.puzzle.rows
+        self._col_counts = [0] * cols
+        for row, col in path:
+            self._filled[row * cols + col] = 1
+            self._row_counts[row] += 1
+            self._col_counts[col] += 1
+
+    def _choose_window(self, size: int) -> Window:
+        """
+        Choose a window that overlaps the snake, usually where it can fix violated lines.
+
+        Only windows containing or touching the snake can change it. Preferred are
+        windows centred where a violated row crosses a violated column needing a
+        change in the same direction, then windows reaching from the snake cell
+        nearest to a violated line towards it, and otherwise around a random
+        snake cell.
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        height, width = min(size, rows), min(size, cols)
+        rng = self._rng
+        snake = [cell for cell, filled in enumerate(self._filled) if filled]
+        row_errors = {row: count - required for row, (count, required)
+                      in enumerate(zip(self._row_counts, self.puzzle.row_sums))
+                      if required is not None and count != required}
+        col_errors = {col: count - required for col, (count, required)
+                      in enumerate(zip(self._col_counts, self.puzzle.col_sums))
+                      if required is not None and count != required}
+
+        def clamp(center_row: int, center_col: int) -> Window:
+            top = min(max(center_row - height // 2, 0), rows - height)
+            left = min(max(center_col - width // 2, 0), cols - width)
+            return top, left, height, width
+
+        strategy = rng.random()
+        if row_errors and col_errors and strategy < 0.5:
+            row = rng.choice(list(row_errors))
+            crossing = [col for col, error in col_errors.items() if (error > 0) == (row_errors[row] > 0)]
+            if crossing:
+                window = clamp(row, rng.choice(crossing))
+                top, left = window[0], window[1]
+                # Include the ring around the window, whose snake cells the window can reroute
+                if any(self._filled[r * cols + c]
+                       for r in range(max(top - 1, 0), min(top + height + 1, rows))
+                       for c in range(max(left - 1, 0), min(left + width + 1, cols))):
+                    return window
+
+        if (row_errors or col_errors) and strategy < 0.8:
+            line, is_row = rng.choice([(row, True) for row in row_errors] + [(col, False) for col in col_errors])
+            coordinate = (lambda cell: cell // cols) if is_row else (lambda cell: cell % cols)
+            distance = min(abs(coordinate(cell) - line) for cell in snake)
+            anchor = rng.choice([cell for cell in snake if abs(coordinate(cell) - line) == distance])
+            center_row, center_col = divmod(anchor, cols)
+            # Move the centre towards the line, keeping the anchor inside the window
+            shift = max(min(line - coordinate(anchor), size // 2 - 1), -(size // 2 - 1))
+            if is_row:
+                center_row += shift
+            else:
+                center_col += shift
+            return clamp(center_row, center_col)
+
+        return clamp(*divmod(rng.choice(snake), cols))
+
+    def _solve_window(self, window: Window, time_limit: float) -> bool:
+        """
+        Re-solve the cells of one window with all other cells fixed.
+
+        Returns:
+            True if the new window contents were kept
+        """
+        top, left, height, width = window
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        orthogonal = self._adjacency.orthogonal
+        filled = self._filled
+
+        solver = pywraplp.Solver.CreateSolver(self.solver_type)
+        solver.SetTimeLimit(int(time_limit * 1000))
+        cells = [row * cols + col for row in range(top, top + height) for col in range(left, left + width)]
+        variables = {cell: solver.BoolVar(f"x_{cell}") for cell in cells}
+
+        def value(cell: int):
+            return variables[cell] if cell in variables else filled[cell]
+
+        # Path constraints of the window cells and of the cells next to the window
+        affected = set(cells)
+        for cell in cells:
+            affected.update(orthogonal[cell])
+        for cell in sorted(affected):
+            neighbor_terms = [variables[neighbor] for neighbor in orthogonal[cell] if neighbor in variables]
+            fixed = sum(filled[neighbor] for neighbor in orthogonal[cell] if neighbor not in variables)
+            if cell in self._endpoints:
+                if cell in variables:
+                    solver.Add(variables[cell] == 1)
+                solver.Add(sum(neighbor_terms) + fixed == 1)  # type: ignore
+            elif cell in variables:
+                neighbor_sum = sum(neighbor_terms) + fixed
+                solver.Add(neighbor_sum >= 2 * variables[cell])  # type: ignore
+                solver.Add(neighbor_sum <= 4 - 2 * variables[cell])  # type: ignore
+            elif filled[cell]:
+                solver.Add(sum(neighbor_terms) + fixed == 2)  # type: ignore
+
+        # Diagonal touching and 2x2 block constraints of the blocks overlapping the window
+        for row in range(max(top - 1, 0), min(top + height, rows - 1)):
+            for col in range(max(left - 1, 0), min(left + width, cols - 1)):
+                top_left = row * cols + col
+                block = (top_left, top_left + 1, top_left + cols, top_left + cols + 1)
+                if not any(cell in variables for cell in block):
+                    continue
+                a, b, c, d = (value(cell) for cell in block)
+                solver.Add(a + d <= b + c + 1)  # type: ignore
+                solver.Add(b + c <= a + d + 1)  # type: ignore
+                solver.Add(a + b + c + d <= 3)  # type: ignore
+
+        # Single-commodity flow: every filled window cell receives one unit, entering
+        # the window from filled cells outside it (or the start cell), so no loop can
+        # be closed inside the window
+        capacity = len(cells)
+        start = self._adjacency.index(self.puzzle.start_cell)
+        inflow: Dict[int, list] = {cell: [] for cell in cells}
+        outflow: Dict[int, list] = {cell: [] for cell in cells}
+        for cell in cells:
+            if cell == start or any(filled[neighbor] for neighbor in orthogonal[cell] if neighbor not in variables):
+                source = solver.IntVar(0, capacity, f"s_{cell}")
+                solver.Add(source <= capacity * variables[cell])  # type: ignore
+                inflow[cell].append(source)
+            for neighbor in orthogonal[cell]:
+                if neighbor in variables:
+                    arc = solver.IntVar(0, capacity, f"f_{cell}_{neighbor}")
+                    solver.Add(arc <= capacity * variables[cell])  # type: ignore
+                    solver.Add(arc <= capacity * variables[neighbor])  # type: ignore
+                    outflow[cell].append(arc)
+                    inflow[neighbor].append(arc)
+        for cell in cells:
+            solver.Add(sum(inflow[cell]) - sum(outflow[cell]) == variables[cell])  # type: ignore
+
+        # Minimize the violation of the lines crossing the window
+        deviations = []
+        for lines, counts, sums, line_of in (
+                (range(top, top + height), self._row_counts, self.puzzle.row_sums, lambda cell: cell // cols),
+                (range(left, left + width), self._col_counts, self.puzzle.col_sums, lambda cell: cell % cols)):
+            for line in lines:
+                required = sums[line]
+                if required is None:
+                    continue
+                line_cells = [cell for cell in cells if line_of(cell) == line]
+                outside = counts[line] - sum(filled[cell] for cell in line_cells)
+                excess = sum(variables[cell] for cell in line_cells) + outside - required
+                deviation = solver.IntVar(0, max(rows, cols), f"d_{len(deviations)}")
+                solver.Add(deviation >= excess)  # type: ignore
+                solver.Add(deviation >= -excess)  # type: ignore
+                deviations.append(deviation)
+        if not deviations:
+            return False
+        # Random tie-breaking weights (below 0.5 in total, so the violation is still
+        # minimized first) move the snake between windows of equal violation
+        scale = 0.5 / len(cells)
+        tie_break = sum(self._rng.uniform(-scale, scale) * variables[cell] for cell in cells)
+        solver.Minimize(sum(deviations) + tie_break)  # type: ignore
+
+        old_violation = self.get_violation()
+        for _ in range(self.MAX_WINDOW_CUT_ROUNDS):
+            status = solver.Solve()
+            if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+                return False
+            candidate = bytearray(filled)
+            for cell, variable in variables.items():
+                candidate[cell] = variable.solution_value() > 0.5
+
+            strays = self._stray_components(candidate)
+            if not strays:
+                break
+            # Loops can only be closed through the window, so the cuts are on its cells
+            for component in strays:
+                component_vars = [variables[cell] for cell in component if cell in variables]
+                if component_vars:
+                    solver.Add(sum(component_vars) <= len(component_vars) - 1)  # type: ignore
+                    self._solve_stats['cutting_planes_added'] += 1
+        else:
+            return False
+
+        previous = (self._filled, self._row_counts, self._col_counts)
+        self._filled = candidate
+        self._row_counts = list(self._row_counts)
+        self._col_counts = list(self._col_counts)
+        for cell in cells:
+            delta = candidate[cell] - filled[cell]
+            if delta:
+                self._row_counts[cell // cols] += delta
+                self._col_counts[cell % cols] += delta
+        if self.get_violation() > old_violation:
+            self._filled, self._row_counts, self._col_counts = previous
+            return False
+        return True
+
+    def _stray_components(self, filled: bytearray) -> List[Set[int]]:
+        """Components of the filled cells that are not connected to the start cell."""
+        orthogonal = self._adjacency.orthogonal
+        start = self._adjacency.index(self.puzzle.start_cell)
+        remaining = {cell for cell, value in enumerate(filled) if value}
+        components = []
+        root = start
+        while remaining:
+            component = {root}
+            stack = [root]
+            remaining.discard(root)
+            while stack:
+                cell = stack.pop()
+                for neighbor in orthogonal[cell]:
+                    if neighbor in remaining:
+                        remaining.discard(neighbor)
+                        component.add(neighbor)
+                        stack.append(neighbor)
+            if root != start:
+                components.append(component)
+            if remaining:
+                root = next(iter(remaining))
+        return components
@@ -0,0 +1,336 @@
+from typing import Any, Dict, List, Sequence, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import bisect
+import math
+import os
+import threading
+import time
+from .puzzle import BaseSnakePuzzle
+
+
+# Histogram bucket upper bounds
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ITERATION_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Metric:
+    """A counter or histogram with a fixed set of label names."""
+
+    def __init__(self, name: str, kind: str, help_text: str, label_names: Sequence[str],
+                 buckets: Sequence[float] = ()):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # Counter: value per label values. Histogram: [counts per bucket, sum, count]
+        self.samples: Dict[Tuple[str, ...], Any] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        self.samples[labels] = self.samples.get(labels, 0) + amount
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        sample = self.samples.get(labels)
+        if sample is None:
+            sample = self.samples[labels] = [[0] * len(self.buckets), 0, 0]
+        bucket = bisect.bisect_left(self.buckets, value)
+        if bucket < len(self.buckets):
+            sample[0][bucket] += 1
+        sample[1] += value
+        sample[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for labels, sample in sorted(self.samples.items()):
+            pairs = list(zip(self.label_names, labels))
+            if self.kind == 'counter':
+                lines.append(f"{self.name}{_format_labels(pairs)} {_format_value(sample)}")
+                continue
+            bucket_counts, total, count = sample
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+
+class SnakeMetrics:
+    """
+    Prometheus metrics for the solver and the generator in long-lived workers.
+
+    Records model build and solve durations, cutting plane iterations, cuts added,
+    solve outcomes and generation attempts and failures, labelled with the grid
+    size (e.g. grid="10x10"). Timeouts and infeasible puzzles are counted by the
+    status label of snake_solver_solves_total ('not_solved' is a backend time
+    limit), so their rates follow from the counter.
+
+    Solvers and generators are used through the wrappers (build_solver, solve,
+    generate, generate_unique), or their outcome is reported with the record_*
+    methods. The metrics are rendered in the Prometheus text format, served on a
+    local HTTP endpoint or written to a file for the node_exporter textfile
+    collector. All methods are thread-safe.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of metrics."""
+        self._lock = threading.Lock()
+        self._build_seconds = _Metric(
+            'snake_solver_build_seconds', 'histogram',
+            'Time spent building the solver model.', ('grid',), SECONDS_BUCKETS)
+        self._solve_seconds = _Metric(
+            'snake_solver_solve_seconds', 'histogram',
+            'Time spent in SnakeSolver.solve.', ('grid',), SECONDS_BUCKETS)
+        self._iterations = _Metric(
+            'snake_solver_iterations', 'histogram',
+            'Cutting plane iterations per solve.', ('grid',), ITERATION_BUCKETS)
+        self._cuts = _Metric(
+            'snake_solver_cuts_added_total', 'counter',
+            'Connectivity cuts added by solves.', ('grid',))
+        self._solves = _Metric(
+            'snake_solver_solves_total', 'counter',
+            'Solves by outcome (not_solved: backend time limit).', ('grid', 'status'))
+        self._generation_seconds = _Metric(
+            'snake_generator_seconds', 'histogram',
+            'Time spent generating a puzzle.', ('grid', 'mode'), SECONDS_BUCKETS)
+        self._attempts = _Metric(
+            'snake_generator_attempts_total', 'counter',
+            'Path growth attempts made by the generator.', ('grid', 'mode'))
+        self._candidates = _Metric(
+            'snake_generator_candidates_total', 'counter',
+            'Candidate puzzles checked for uniqueness.', ('grid',))
+        self._rejected = _Metric(
+            'snake_generator_rejected_total', 'counter',
+            'Candidate puzzles rejected as not unique.', ('grid',))
+        self._failures = _Metric(
+            'snake_generator_failures_total', 'counter',
+            'Generation calls that failed.', ('grid', 'mode'))
+        self._metrics = [self._build_seconds, self._solve_seconds, self._iterations, self._cuts,
+                         self._solves, self._generation_seconds, self._attempts, self._candidates,
+                         self._rejected, self._failures]
+
+    def build_solver(self, puzzle: BaseSnakePuzzle, **kwargs):
+        """
+        Create a SnakeSolver and record the model build time.
+
+        Args:
+            puzzle: The SnakePuzzle instance to solve
+            **kwargs: Passed on to SnakeSolver (solver_type, builder)
+
+        Returns:
+            The new SnakeSolver
+        """
+        from .solver import SnakeSolver
+
+        start_time = time.perf_counter()
+        solver = SnakeSolver(puzzle, **kwargs)
+        self.record_build(puzzle, time.perf_counter() - start_time)
+        return solver
+
+    def solve(self, solver, **kwargs):
+        """
+        Solve with a SnakeSolver and record the duration and outcome.
+
+        Args:
+            solver: The SnakeSolver to solve with
+            **kwargs: Passed on to SnakeSolver.solve
+
+        Returns:
+            The result of SnakeSolver.solve
+        """
+        start_time = time.perf_counter()
+        solution = solver.solve(**kwargs)
+        self.record_solve(solver, time.perf_counter() - start_time)
+        return solution
+
+    def generate(self, generator, rows: int, cols: int, fill_percentage: float = 0.3):
+        """
+        Generate a puzzle with SnakePuzzleGenerator.generate and record the attempts.
+
+        Args:
+            generator: The SnakePuzzleGenerator to generate with
+            rows: Number of rows in the puzzle
+            cols: Number of columns in the puzzle
+            fill_percentage: Target percentage of cells to fill
+
+        Returns:
+            The result of SnakePuzzleGenerator.generate
+
+        Raises:
+            RuntimeError: If generation fails (recorded as a failure)
+        """
+        return self._generate(generator.generate, generator, 'random', rows, cols, fill_percentage)
+
+    def generate_unique(self, generator, rows: int, cols: int, fill_percentage: float = 0.3, **kwargs):
+        """
+        Generate a unique puzzle with SnakePuzzleGenerator.generate_unique and record the attempts.
+
+        Args:
+            generator: The SnakePuzzleGenerator to generate with
+            rows: Number of rows in the puzzle
+            cols: Number of columns in the puzzle
+            fill_percentage: Target percentage of cells to fill
+            **kwargs: Passed on to generate_unique (max_attempts, max_iterations, solver_type)
+
+        Returns:
+            The result of SnakePuzzleGenerator.generate_unique
+
+        Raises:
+            RuntimeError: If no unique puzzle is found (recorded as a failure)
+        """
+        return self._generate(generator.generate_unique, generator, 'unique', rows, cols,
+                              fill_percentage, **kwargs)
+
+    def record_build(self, puzzle: BaseSnakePuzzle, seconds: float) -> None:
+        """
+        Record the time taken to build a solver model.
+
+        Args:
+            puzzle: The puzzle the model was built for
+            seconds: Build duration
+        """
+        with self._lock:
+            self._build_seconds.observe((_grid_label(puzzle.rows, puzzle.cols),), seconds)
+
+    def record_solve(self, solver, seconds: float) -> None:
+        """
+        Record the outcome of a solver's last solve.
+
+        Args:
+            solver: The SnakeSolver that was solved
+            seconds: Solve duration
+        """
+        grid = _grid_label(solver.puzzle.rows, solver.puzzle.cols)
+        stats = solver.get_solve_stats()
+        status = solver.get_solve_status() or 'not_solved'
+        with self._lock:
+            self._solve_seconds.observe((grid,), seconds)
+            self._iterations.observe((grid,), stats['iterations'])
+            self._cuts.inc((grid,), stats['cutting_planes_added'])
+            self._solves.inc((grid, status))
+
+    def record_generation(self, rows: int, cols: int, mode: str, seconds: float,
+                          stats: Dict[str, float], failed: bool = False) -> None:
+        """
+        Record one generation call.
+
+        Args:
+            rows: Number of rows of the generated puzzle
+            cols: Number of columns of the generated puzzle
+            mode: 'random' for generate, 'unique' for generate_unique
+            seconds: Generation duration
+            stats: The generator's get_generation_stats after the call
+            failed: True if the call raised an error
+        """
+        grid = _grid_label(rows, cols)
+        with self._lock:
+            self._generation_seconds.observe((grid, mode), seconds)
+            self._attempts.inc((grid, mode), stats.get('path_attempts', 0))
+            if 'candidates' in stats:
+                self._candidates.inc((grid,), stats['candidates'])
+                self._rejected.inc((grid,), stats['rejected'])
+            if failed:
+                self._failures.inc((grid, mode))
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics text, ending with a newline
+        """
+        with self._lock:
+            lines = [line for metric in self._metrics for line in metric.render()]
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str) -> None:
+        """
+        Write the metrics to a file, e.g. for the node_exporter textfile collector.
+
+        The file is replaced atomically, so a scraper never reads a partial file.
+
+        Args:
+            path: Destination file path (conventionally ending in .prom)
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+    def start_http_server(self, port: int, addr: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serve the metrics over HTTP from a daemon thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port, see server.server_address)
+            addr: Address to bind, local only by default
+
+        Returns:
+            The running server. Call shutdown() and server_close() to stop it.
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Keep scrapes out of the worker's stderr
+                pass
+
+        server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name='snake-metrics', daemon=True)
+        thread.start()
+        return server
+
+    def _generate(self, generate, generator, mode: str, rows: int, cols: int,
+                  fill_percentage: float, **kwargs):
+        """Run a generation method, recording its duration, attempts and failure."""
+        start_time = time.perf_counter()
+        try:
+            result = generate(rows, cols, fill_percentage, **kwargs)
+        except RuntimeError:
+            self.record_generation(rows, cols, mode, time.perf_counter() - start_time,
+                                   generator.get_generation_stats(), failed=True)
+            raise
+        self.record_generation(rows, cols, mode, time.perf_counter() - start_time,
+                               generator.get_generation_stats())
+        return result
+
+
+def _grid_label(rows: int, cols: int) -> str:
+    """Grid size label value, e.g. '10x12'."""
+    return f"{rows}x{cols}"
+
+
+def _format_labels(pairs: List[Tuple[str, str]]) -> str:
+    """Format label pairs as {name="value",...}, escaping the values."""
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, writing whole numbers without a fraction."""
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return repr(value)
+    return str(value)
@@ -1,117 +1,458 @@
-from typing import List, Set, Tuple, Optional, Union
+from typing import Any, List, Sequence, Set, Tuple, Optional, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
+from array import array
+import hashlib
 
 
-class SnakePuzzle:
+@dataclass
+class ValidationResult:
     """
-    Represents a Snake puzzle.
+    Outcome of validating a solution against a SnakePuzzle.
     
-    Rules of Snake:
-    - The snake's body can be filled in horizontally and vertically and must connect the given start and end cells
-    - The body must never touch itself, not even diagonally
-    - The numbers outside the playing grid tell you how many cells must be filled in for a row or column (may be blank)
+    Evaluates to True in a boolean context when the solution is valid.
+    
+    Attributes:
+        is_valid: True if the solution satisfies all puzzle constraints
+        rule: First violated rule, one of 'empty', 'missing_endpoint', 'out_of_bounds',
+              'row_sum', 'col_sum', 'diagonal_touching', 'degree', 'disconnected' or
+              'path_order' (None if valid)
+        cells: Cells involved in the violation, e.g. the cells of mismatching rows,
+               the diagonally touching pairs or the cells not connected to the start
+        components: Orthogonally connected components of the solution, or an empty
+                    list if validation stopped before they were computed
     """
+    is_valid: bool
+    rule: Optional[str] = None
+    cells: Set[Tuple[int, int]] = field(default_factory=set)
+    components: List[Set[Tuple[int, int]]] = field(default_factory=list)
     
-    def __init__(self, 
-                 row_sums: List[Union[int, None]],
-                 col_sums: List[Union[int, None]],
-                 start_cell: Tuple[int, int],
-                 end_cell: Tuple[int, int]):
-        """
-        Initialize a Snake puzzle.
-        
-        Args:
-            row_sums: List of required sums for each row (None for unlabelled rows)
-            col_sums: List of required sums for each column (None for unlabelled columns)
-            start_cell: (row, col) position where the snake starts
-            end_cell: (row, col) position where the snake ends
-                
-        Raises:
-            ValueError: If puzzle configuration is invalid
-        """
-        # Deduce grid dimensions from constraint lists
-        rows = len(row_sums)
-        cols = len(col_sums)
-        
-        # Validate inputs
-        if rows <= 0:
-            raise ValueError("Number of rows must be positive")
-        if cols <= 0:
-            raise ValueError("Number of columns must be positive")
-        
-        # Validate start and end cells
-        if not (0 <= start_cell[0] < rows and 0 <= start_cell[1] < cols):
-            raise ValueError(f"Start cell {start_cell} is out of bounds")
-        if not (0 <= end_cell[0] < rows and 0 <= end_cell[1] < cols):
-            raise ValueError(f"End cell {end_cell} is out of bounds")
-        if start_cell == end_cell:
-            raise ValueError("Start cell and end cell cannot be the same")
-        
-        # Store puzzle configuration
+    def __bool__(self) -> bool:
+        return self.is_valid
+
+
+class GridAdjacency:
+    """
+    Precomputed neighbour tables for one grid shape.
+    
+    Cells are identified by their flat index row * cols + col. Each table is a tuple
+    indexed by flat cell index, so neighbour lookups in hot loops are a single
+    tuple access without allocating new sets. Instances are created once per
+    (rows, cols) by get_grid_adjacency and shared by all puzzles of that shape.
+    
+    Attributes:
+        positions: (row, col) position of each flat index
+        orthogonal: Orthogonal neighbour indices of each cell
+        diagonal: Diagonal neighbour indices of each cell
+        diagonal_links: For each cell, (diagonal, shared_1, shared_2) triples where
+                        shared_1 and shared_2 are the two cells orthogonally adjacent
+                        to both the cell and the diagonal neighbour
+    """
+    
+    __slots__ = ('rows', 'cols', 'positions', 'orthogonal', 'diagonal', 'diagonal_links')
+    
+    def __init__(self, rows: int, cols: int):
         self.rows = rows
         self.cols = cols
-        self.row_sums = row_sums.copy()
-        self.col_sums = col_sums.copy()
-        self.start_cell = start_cell
-        self.end_cell = end_cell
+        self.positions = tuple((row, col) for row in range(rows) for col in range(cols))
         
-        # Offset patterns for different types of tile relationships
-        self._orthogonal_offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        self._diagonal_offsets = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        orthogonal = []
+        diagonal = []
+        diagonal_links = []
+        for row, col in self.positions:
+            orthogonal.append(tuple(
+                (row + dr) * cols + (col + dc)
+                for dr, dc in SnakePuzzle._orthogonal_offsets
+                if 0 <= row + dr < rows and 0 <= col + dc < cols
+            ))
+            links = tuple(
+                ((row + dr) * cols + (col + dc), (row + dr) * cols + col, row * cols + (col + dc))
+                for dr, dc in SnakePuzzle._diagonal_offsets
+                if 0 <= row + dr < rows and 0 <= col + dc < cols
+            )
+            diagonal.append(tuple(link[0] for link in links))
+            diagonal_links.append(links)
         
-        # Validate puzzle configuration
-        self._validate_puzzle()
+        self.orthogonal = tuple(orthogonal)
+        self.diagonal = tuple(diagonal)
+        self.diagonal_links = tuple(diagonal_links)
     
-    def is_valid_solution(self, solution: Set[Tuple[int, int]]) -> bool:
+    def index(self, position: Tuple[int, int]) -> int:
+        """Get the flat index of a (row, col) position."""
+        return position[0] * self.cols + position[1]
+
+
+# The 8 grid symmetries as (flip_rows, flip_cols, transpose), applied in that order.
+# The identity comes first.
+Transform = Tuple[bool, bool, bool]
+SYMMETRIES: Tuple[Transform, ...] = tuple(
+    (flip_rows, flip_cols, transpose)
+    for transpose in (False, True) for flip_rows in (False, True) for flip_cols in (False, True)
+)
+
+
+# Supported solution representations:
+# - 'set': set of (row, col) tuples
+# - 'bitmask': int with bit row * cols + col set for each filled cell
+# - 'grid': NumPy boolean array of shape (rows, cols)
+# - 'path': list of (row, col) tuples ordered from the start cell to the end cell
+SOLUTION_FORMATS = ('set', 'bitmask', 'grid', 'path')
+
+# A solution in any of the SOLUTION_FORMATS
+Solution = Union[Set[Tuple[int, int]], int, List[Tuple[int, int]], Any]
+
+
+@lru_cache(maxsize=None)
+def get_grid_adjacency(rows: int, cols: int) -> GridAdjacency:
+    """Get the shared neighbour tables for a grid shape, building them on first use."""
+    return GridAdjacency(rows, cols)
+
+
+class BaseSnakePuzzle:
+    """
+    Behaviour shared by SnakePuzzle and FrozenSnakePuzzle.
+    
+    Subclasses store the rows, cols, row_sums, col_sums, start_cell and end_cell
+    attributes; everything else (validation, formats, symmetries, visualization)
+    only reads them. Use isinstance(puzzle, BaseSnakePuzzle) to accept either kind.
+    """
+    
+    # Offset patterns for different types of tile relationships, shared by all instances
+    _orthogonal_offsets = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    _diagonal_offsets = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+    
+    __slots__ = ()
+    
+    rows: int
+    cols: int
+    row_sums: Sequence[Optional[int]]
+    col_sums: Sequence[Optional[int]]
+    start_cell: Tuple[int, int]
+    end_cell: Tuple[int, int]
+    
+    def is_valid_solution(self, solution: Solution, ordered: bool = False) -> bool:
         """
         Check if the given solution satisfies all puzzle constraints.
 
         Args:
-            solution: Set of positions (row, col) representing the filled cells of the snake
+            solution: Filled cells of the snake in any of the SOLUTION_FORMATS
+            ordered: If True, a list or tuple must also be in path order (see validate_solution)
 
         Returns:
             True if the solution is valid, False otherwise
         """
+        return self.validate_solution(solution, early_exit=True, ordered=ordered).is_valid
+    
+    def validate_solution(self, solution: Solution, early_exit: bool = False,
+                          ordered: bool = False) -> ValidationResult:
+        """
+        Validate a solution and report why it fails.
+        
+        Runs in O(|S| + rows + cols) time without recursion: one pass builds the row
+        and column counts, a second pass checks cell degrees and diagonal touching,
+        and an iterative search finds the connected components.
+        
+        A list or tuple is taken as unordered cells unless ordered is True, in which
+        case it is checked as a path: if the cells form a valid snake, they must also
+        be listed once each, from the start cell to the end cell.
+        
+        Args:
+            solution: Filled cells of the snake in any of the SOLUTION_FORMATS
+            early_exit: If True, stop at the first problem encountered (e.g. a row count
+                        exceeding its sum during the counting pass) and skip the
+                        component search unless it is needed. If False, complete every
+                        pass, report the first violated rule in the order listed in
+                        ValidationResult and always return the components
+            ordered: If True, a list or tuple solution must also be in path order
+            
+        Returns:
+            ValidationResult with the first violated rule, the cells involved and the
+            connected components of the solution
+        """
+        path = solution if ordered and isinstance(solution, (list, tuple)) else None
+        solution = self._solution_positions(solution)
         if not solution:
-            return False
+            return ValidationResult(False, 'empty')
             
         # Check that start and end cells are included
-        if self.start_cell not in solution:
-            return False
-        if self.end_cell not in solution:
-            return False
-            
-        # Check that all positions are within bounds
+        missing = {cell for cell in (self.start_cell, self.end_cell) if cell not in solution}
+        if missing:
+            return ValidationResult(False, 'missing_endpoint', missing)
+        
+        rows, cols = self.rows, self.cols
+        row_sums, col_sums = self.row_sums, self.col_sums
+        row_counts = [0] * rows
+        col_counts = [0] * cols
+        cells = set()
+        
+        # Single pass: bounds, flat indices and row/column counts
+        out_of_bounds = set()
         for row, col in solution:
-            if not (0 <= row < self.rows and 0 <= col < self.cols):
-                return False
-        
-        # Check row sums
-        for row_idx, expected_sum in enumerate(self.row_sums):
-            if expected_sum is not None:
-                actual_sum = sum(1 for r, c in solution if r == row_idx)
-                if actual_sum != expected_sum:
-                    return False
-        
-        # Check column sums
-        for col_idx, expected_sum in enumerate(self.col_sums):
-            if expected_sum is not None:
-                actual_sum = sum(1 for r, c in solution if c == col_idx)
-                if actual_sum != expected_sum:
-                    return False
-        
-        # Check that snake doesn't touch itself diagonally
-        if not self._check_no_diagonal_touching(solution):
-            return False
+            if not (0 <= row < rows and 0 <= col < cols):
+                if early_exit:
+                    return ValidationResult(False, 'out_of_bounds', {(row, col)})
+                out_of_bounds.add((row, col))
+                continue
+            cells.add(row * cols + col)
+            row_counts[row] += 1
+            col_counts[col] += 1
+            if early_exit:
+                if row_sums[row] is not None and row_counts[row] > row_sums[row]:  # type: ignore
+                    return ValidationResult(False, 'row_sum', {cell for cell in solution if cell[0] == row})
+                if col_sums[col] is not None and col_counts[col] > col_sums[col]:  # type: ignore
+                    return ValidationResult(False, 'col_sum', {cell for cell in solution if cell[1] == col})
+        
+        if out_of_bounds:
+            return ValidationResult(False, 'out_of_bounds', out_of_bounds)
+        
+        adjacency = self.adjacency
+        positions = adjacency.positions
+        
+        # Check row and column sums
+        wrong_rows = {row for row, (actual_sum, expected_sum) in enumerate(zip(row_counts, row_sums))
+                      if expected_sum is not None and actual_sum != expected_sum}
+        wrong_cols = {col for col, (actual_sum, expected_sum) in enumerate(zip(col_counts, col_sums))
+                      if expected_sum is not None and actual_sum != expected_sum}
+        if early_exit and wrong_rows:
+            return ValidationResult(False, 'row_sum', {cell for cell in solution if cell[0] in wrong_rows})
+        if early_exit and wrong_cols:
+            return ValidationResult(False, 'col_sum', {cell for cell in solution if cell[1] in wrong_cols})
+        
+        # Check diagonal touching and degrees: start and end cells have exactly 1
+        # orthogonal neighbour, all other cells exactly 2
+        orthogonal = adjacency.orthogonal
+        diagonal_links = adjacency.diagonal_links
+        start = adjacency.index(self.start_cell)
+        end = adjacency.index(self.end_cell)
+        touching = set()
+        wrong_degree = set()
+        
+        for cell in cells:
+            for diagonal, shared_1, shared_2 in diagonal_links[cell]:
+                # Diagonal cells may only both be filled if they are connected by an orthogonal cell
+                if diagonal in cells and shared_1 not in cells and shared_2 not in cells:
+                    if early_exit:
+                        return ValidationResult(False, 'diagonal_touching', {positions[cell], positions[diagonal]})
+                    touching.update((positions[cell], positions[diagonal]))
             
-        # Check that snake forms a connected path from start to end
-        if not self._check_snake_path(solution):
-            return False
+            degree = 0
+            for neighbor in orthogonal[cell]:
+                if neighbor in cells:
+                    degree += 1
+            if degree != (1 if cell == start or cell == end else 2):
+                if early_exit:
+                    return ValidationResult(False, 'degree', {positions[cell]})
+                wrong_degree.add(positions[cell])
+        
+        # Find connected components with an iterative search, starting from the start cell
+        components = []
+        unvisited = set(cells)
+        stack = [start]
+        while stack or unvisited:
+            if not stack:
+                stack.append(next(iter(unvisited)))
+            component = set()
+            while stack:
+                current = stack.pop()
+                if current in unvisited:
+                    unvisited.remove(current)
+                    component.add(positions[current])
+                    for neighbor in orthogonal[current]:
+                        if neighbor in unvisited:
+                            stack.append(neighbor)
+            components.append(component)
+        
+        if wrong_rows:
+            return ValidationResult(False, 'row_sum', {cell for cell in solution if cell[0] in wrong_rows}, components)
+        if wrong_cols:
+            return ValidationResult(False, 'col_sum', {cell for cell in solution if cell[1] in wrong_cols}, components)
+        if touching:
+            return ValidationResult(False, 'diagonal_touching', touching, components)
+        if wrong_degree:
+            return ValidationResult(False, 'degree', wrong_degree, components)
+        if len(components) > 1:
+            # Cells not connected to the start cell
+            return ValidationResult(False, 'disconnected', set().union(*components[1:]), components)
+        
+        if path is not None:
+            # The cells form a valid snake, so the path order is the only thing left to check
+            ordered = self._order_path(cells)
+            if len(path) != len(ordered) or any(tuple(cell) != position for cell, position in zip(path, ordered)):
+                wrong_order = {position for cell, position in zip(path, ordered) if tuple(cell) != position}
+                return ValidationResult(False, 'path_order', wrong_order or set(solution), components)
+        
+        return ValidationResult(True, components=components)
+    
+    def format_solution(self, solution: Solution, result_format: str = 'set') -> Solution:
+        """
+        Convert a solution between the SOLUTION_FORMATS.
+        
+        Args:
+            solution: Filled cells of the snake in any of the SOLUTION_FORMATS
+            result_format: One of SOLUTION_FORMATS
+            
+        Returns:
+            The solution in the requested format
             
-        return True
+        Raises:
+            ValueError: If the format is unknown, or 'path' is requested for cells that
+                        do not form a single path from the start cell to the end cell
+        """
+        if result_format not in SOLUTION_FORMATS:
+            raise ValueError(f"Unknown result format '{result_format}'")
+        
+        cols = self.cols
+        if result_format == 'bitmask':
+            if isinstance(solution, int):
+                return solution
+            return sum(1 << (row * cols + col) for row, col in self._solution_positions(solution))
+        
+        positions = self._solution_positions(solution)
+        if result_format == 'set':
+            return positions
+        if result_format == 'grid':
+            import numpy as np
+            grid = np.zeros((self.rows, cols), dtype=bool)
+            if positions:
+                grid[tuple(zip(*positions))] = True
+            return grid
+        path = self._order_path({row * cols + col for row, col in positions})
+        if len(set(path)) != len(positions) or path[-1] != self.end_cell:
+            raise ValueError("Solution is not a single path from the start cell to the end cell")
+        return path
     
-    def __repr__(self) -> str:
-        return f"SnakePuzzle(rows={self.rows}, cols={self.cols}, start={self.start_cell}, end={self.end_cell})"
+    def _solution_positions(self, solution: Solution) -> Set[Tuple[int, int]]:
+        """Get the (row, col) positions of a solution given in any of the SOLUTION_FORMATS."""
+        if isinstance(solution, set):
+            return solution
+        if isinstance(solution, int) and not isinstance(solution, bool):
+            if solution < 0:
+                raise ValueError("Solution bitmask must be non-negative")
+            positions = set()
+            cols = self.cols
+            while solution:
+                lowest = solution & -solution
+                positions.add(divmod(lowest.bit_length() - 1, cols))
+                solution ^= lowest
+            return positions
+        if hasattr(solution, 'shape') and hasattr(solution, 'nonzero'):
+            # NumPy grid, detected without importing NumPy
+            if tuple(solution.shape) != (self.rows, self.cols):
+                raise ValueError(f"Solution grid shape {tuple(solution.shape)} does not match "
+                                 f"the puzzle size {(self.rows, self.cols)}")
+            filled_rows, filled_cols = solution.nonzero()
+            return set(zip(filled_rows.tolist(), filled_cols.tolist()))
+        return {tuple(position) for position in solution}  # type: ignore
+    
+    def _order_path(self, cells: Set[int]) -> List[Tuple[int, int]]:
+        """Order the flat cell indices of a valid snake from the start cell to the end cell."""
+        adjacency = self.adjacency
+        orthogonal = adjacency.orthogonal
+        positions = adjacency.positions
+        previous = -1
+        current = adjacency.index(self.start_cell)
+        path = [positions[current]]
+        while len(path) < len(cells):
+            for neighbor in orthogonal[current]:
+                if neighbor != previous and neighbor in cells:
+                    previous, current = current, neighbor
+                    break
+            else:
+                break
+            path.append(positions[current])
+        return path
+    
+    @property
+    def adjacency(self) -> GridAdjacency:
+        """Shared neighbour tables for this puzzle's grid shape."""
+        return get_grid_adjacency(self.rows, self.cols)
+    
+    def transform_position(self, position: Tuple[int, int], transform: Transform) -> Tuple[int, int]:
+        """
+        Map a position of this puzzle's grid through a grid symmetry.
         
+        Args:
+            position: (row, col) position in this puzzle
+            transform: (flip_rows, flip_cols, transpose), one of SYMMETRIES
+            
+        Returns:
+            The (row, col) position in the transformed grid
+        """
+        flip_rows, flip_cols, transpose = transform
+        row, col = position
+        if flip_rows:
+            row = self.rows - 1 - row
+        if flip_cols:
+            col = self.cols - 1 - col
+        return (col, row) if transpose else (row, col)
+    
+    def transformed(self, transform: Transform) -> 'BaseSnakePuzzle':
+        """
+        Get the puzzle mapped through a grid symmetry.
+        
+        Args:
+            transform: (flip_rows, flip_cols, transpose), one of SYMMETRIES
+            
+        Returns:
+            New puzzle of the same type whose solutions are the transformed solutions of this puzzle
+        """
+        row_sums, col_sums = self._transformed_sums(transform)
+        return type(self)(list(row_sums), list(col_sums),
+                          self.transform_position(self.start_cell, transform),
+                          self.transform_position(self.end_cell, transform))
+    
+    def canonical_form(self) -> Tuple[tuple, Transform]:
+        """
+        Get a key that is identical for all puzzles equal up to symmetry.
+        
+        The key is the smallest description of the puzzle over the 8 rotations and
+        reflections of the grid. Start and end cells are unordered, since swapping
+        them only reverses the solution path.
+        
+        Returns:
+            Tuple of (canonical key, transform that maps this puzzle to the canonical one)
+        """
+        best = None
+        for transform in SYMMETRIES:
+            row_sums, col_sums = self._transformed_sums(transform)
+            endpoints = sorted((self.transform_position(self.start_cell, transform),
+                                self.transform_position(self.end_cell, transform)))
+            # Unlabelled lines are encoded as -1 so keys stay comparable
+            key = (len(row_sums), len(col_sums),
+                   tuple(-1 if value is None else value for value in row_sums),
+                   tuple(-1 if value is None else value for value in col_sums),
+                   endpoints[0], endpoints[1])
+            if best is None or key < best[0]:
+                best = (key, transform)
+        return best  # type: ignore
+    
+    def canonical_key(self) -> tuple:
+        """Get the hashable canonical key of the puzzle (see canonical_form)."""
+        return self.canonical_form()[0]
+    
+    def fingerprint(self) -> str:
+        """
+        Get a stable fingerprint of the puzzle that is invariant under grid symmetries.
+        
+        Unlike hash(), the fingerprint is identical across processes and runs, so it
+        can be stored alongside a puzzle corpus.
+        
+        Returns:
+            Hexadecimal digest of the canonical key
+        """
+        return hashlib.blake2b(repr(self.canonical_key()).encode(), digest_size=16).hexdigest()
+    
+    def _transformed_sums(self, transform: Transform) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+        """Row and column sums of the puzzle mapped through a grid symmetry."""
+        flip_rows, flip_cols, transpose = transform
+        row_sums = self.row_sums[::-1] if flip_rows else list(self.row_sums)
+        col_sums = self.col_sums[::-1] if flip_cols else list(self.col_sums)
+        return (col_sums, row_sums) if transpose else (row_sums, col_sums)
+    
+    def freeze(self) -> 'FrozenSnakePuzzle':
+        """Get an immutable, hashable copy of the puzzle."""
+        return FrozenSnakePuzzle(self.row_sums, self.col_sums, self.start_cell, self.end_cell)
+    
     def _validate_puzzle(self) -> None:
         """Validate that the puzzle configuration is valid."""
         # Check that row sums are reasonable
@@ -161,94 +502,6 @@ class SnakePuzzle:
                 tiles.add(tile)
         return tiles
     
-    def _check_no_diagonal_touching(self, solution: Set[Tuple[int, int]]) -> bool:
-        """
-        Check that no two cells in the solution touch diagonally.
-        
-        Args:
-            solution: Set of filled positions
-            
-        Returns:
-            True if no diagonal touching, False otherwise
-        """
-        for position in solution:
-            row, col = position
-            # Check all 4 diagonal neighbors using the offset pattern
-            diagonal_neighbors = self.get_tiles_by_offsets(position, self._diagonal_offsets)
-            
-            for diagonal_pos in diagonal_neighbors:
-                if diagonal_pos in solution:
-                    # Check if they are connected by orthogonal cells
-                    # If there are orthogonal connections, diagonal touching is allowed
-                    orthogonal_neighbors = self.get_tiles_by_offsets(position, self._orthogonal_offsets)
-                    diagonal_orthogonal_neighbors = self.get_tiles_by_offsets(diagonal_pos, self._orthogonal_offsets)
-                    
-                    # Check if there's an orthogonal path connecting the two diagonal cells
-                    shared_orthogonal = orthogonal_neighbors.intersection(diagonal_orthogonal_neighbors)
-                    orthogonal_connections = shared_orthogonal.intersection(solution)
-                    
-                    # If diagonal cells touch but no orthogonal connection exists, it's invalid
-                    if not orthogonal_connections:
-                        return False
-        
-        return True
-    
-    def _check_snake_path(self, solution: Set[Tuple[int, int]]) -> bool:
-        """
-        Check that the solution forms a valid snake path from start to end.
-        A valid snake path means:
-        1. All cells are connected orthogonally
-        2. The path forms a single continuous line (no branches)
-        3. Start and end cells have exactly 1 neighbor each
-        4. All other cells have exactly 2 neighbors each
-        
-        Args:
-            solution: Set of filled positions
-            
-        Returns:
-            True if valid snake path, False otherwise
-        """
-        if not solution:
-            return False
-            
-        # Count neighbors for each cell
-        neighbor_count = {}
-        for position in solution:
-            orthogonal_neighbors = self.get_tiles_by_offsets(position, self._orthogonal_offsets)
-            count = len(orthogonal_neighbors.intersection(solution))
-            neighbor_count[position] = count
-        
-        # Check start and end cells have exactly 1 neighbor
-        if neighbor_count.get(self.start_cell, 0) != 1:
-            return False
-        if neighbor_count.get(self.end_cell, 0) != 1:
-            return False
-            
-        # Check all other cells have exactly 2 neighbors (forming a path)
-        for cell, count in neighbor_count.items():
-            if cell not in (self.start_cell, self.end_cell):
-                if count != 2:
-                    return False
-        
-        # Check connectivity from start to end using DFS
-        visited = set()
-        
-        def dfs(current):
-            if current in visited:
-                return
-            visited.add(current)
-            
-            orthogonal_neighbors = self.get_tiles_by_offsets(current, self._orthogonal_offsets)
-            for neighbor in orthogonal_neighbors:
-                if neighbor in solution and neighbor not in visited:
-                    dfs(neighbor)
-        
-        # Start DFS from start_cell
-        dfs(self.start_cell)
-        
-        # All cells should be reachable from start
-        return len(visited) == len(solution) and self.end_cell in visited
-    
     def get_grid_size(self) -> Tuple[int, int]:
         """Get the grid dimensions."""
         return (self.rows, self.cols)
@@ -341,4 +594,165 @@ class SnakePuzzle:
             
             lines.append(' '.join(row_parts))
         
-        return '\n'.join(lines)
\ No newline at end of file
+        return '\n'.join(lines)
+
+
+class SnakePuzzle(BaseSnakePuzzle):
+    """
+    Represents a Snake puzzle.
+    
+    Rules of Snake:
+    - The snake's body can be filled in horizontally and vertically and must connect the given start and end cells
+    - The body must never touch itself, not even diagonally
+    - The numbers outside the playing grid tell you how many cells must be filled in for a row or column (may be blank)
+    """
+    
+    __slots__ = ('rows', 'cols', 'row_sums', 'col_sums', 'start_cell', 'end_cell')
+    
+    def __init__(self, 
+                 row_sums: List[Union[int, None]],
+                 col_sums: List[Union[int, None]],
+                 start_cell: Tuple[int, int],
+                 end_cell: Tuple[int, int]):
+        """
+        Initialize a Snake puzzle.
+        
+        Args:
+            row_sums: List of required sums for each row (None for unlabelled rows)
+            col_sums: List of required sums for each column (None for unlabelled columns)
+            start_cell: (row, col) position where the snake starts
+            end_cell: (row, col) position where the snake ends
+                
+        Raises:
+            ValueError: If puzzle configuration is invalid
+        """
+        # Deduce grid dimensions from constraint lists
+        rows = len(row_sums)
+        cols = len(col_sums)
+        
+        # Validate inputs
+        if rows <= 0:
+            raise ValueError("Number of rows must be positive")
+        if cols <= 0:
+            raise ValueError("Number of columns must be positive")
+        
+        # Validate start and end cells
+        if not (0 <= start_cell[0] < rows and 0 <= start_cell[1] < cols):
+            raise ValueError(f"Start cell {start_cell} is out of bounds")
+        if not (0 <= end_cell[0] < rows and 0 <= end_cell[1] < cols):
+            raise ValueError(f"End cell {end_cell} is out of bounds")
+        if start_cell == end_cell:
+            raise ValueError("Start cell and end cell cannot be the same")
+        
+        # Store puzzle configuration
+        self.rows = rows
+        self.cols = cols
+        self.row_sums = row_sums.copy()
+        self.col_sums = col_sums.copy()
+        self.start_cell = start_cell
+        self.end_cell = end_cell
+        
+        # Validate puzzle configuration
+        self._validate_puzzle()
+    
+    def __repr__(self) -> str:
+        return f"SnakePuzzle(rows={self.rows}, cols={self.cols}, start={self.start_cell}, end={self.end_cell})"
+
+
+class FrozenSnakePuzzle(BaseSnakePuzzle):
+    """
+    Immutable, hashable Snake puzzle with compact storage.
+    
+    Behaves like SnakePuzzle, but attributes cannot be changed after creation and
+    row_sums and col_sums are tuples. Frozen puzzles with the same sums and start
+    and end cells are equal and have the same hash, so they can be used as dict
+    keys and in sets. A frozen puzzle never equals a mutable SnakePuzzle, which
+    compares by identity.
+    
+    All fields are packed into a single bytes object (or an array of 16-bit values
+    for grids with 255 or more rows or columns) and unpacked on access, which
+    keeps large in-memory corpora small.
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self,
+                 row_sums: Sequence[Union[int, None]],
+                 col_sums: Sequence[Union[int, None]],
+                 start_cell: Tuple[int, int],
+                 end_cell: Tuple[int, int]):
+        """
+        Initialize a frozen Snake puzzle.
+        
+        Args:
+            row_sums: Required sums for each row (None for unlabelled rows)
+            col_sums: Required sums for each column (None for unlabelled columns)
+            start_cell: (row, col) position where the snake starts
+            end_cell: (row, col) position where the snake ends
+                
+        Raises:
+            ValueError: If puzzle configuration is invalid
+        """
+        # Validate through a regular puzzle, then pack the fields
+        puzzle = SnakePuzzle(list(row_sums), list(col_sums), tuple(start_cell), tuple(end_cell))  # type: ignore
+        values = [puzzle.rows, puzzle.cols, *puzzle.start_cell, *puzzle.end_cell, *puzzle.row_sums, *puzzle.col_sums]
+        if max(puzzle.rows, puzzle.cols) < 0xFF:
+            data: Union[bytes, array] = bytes(0xFF if value is None else value for value in values)
+        else:
+            data = array('H', (0xFFFF if value is None else value for value in values))
+        object.__setattr__(self, '_data', data)
+    
+    @property
+    def rows(self) -> int:  # type: ignore[override]
+        return self._data[0]
+    
+    @property
+    def cols(self) -> int:  # type: ignore[override]
+        return self._data[1]
+    
+    @property
+    def start_cell(self) -> Tuple[int, int]:  # type: ignore[override]
+        return (self._data[2], self._data[3])
+    
+    @property
+    def end_cell(self) -> Tuple[int, int]:  # type: ignore[override]
+        return (self._data[4], self._data[5])
+    
+    @property
+    def row_sums(self) -> Tuple[Optional[int], ...]:  # type: ignore[override]
+        return self._unpack_sums(6, 6 + self._data[0])
+    
+    @property
+    def col_sums(self) -> Tuple[Optional[int], ...]:  # type: ignore[override]
+        return self._unpack_sums(6 + self._data[0], len(self._data))
+    
+    def _unpack_sums(self, begin: int, end: int) -> Tuple[Optional[int], ...]:
+        missing = 0xFF if isinstance(self._data, bytes) else 0xFFFF
+        return tuple(None if value == missing else value for value in self._data[begin:end])
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"FrozenSnakePuzzle is immutable, cannot set '{name}'")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"FrozenSnakePuzzle is immutable, cannot delete '{name}'")
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenSnakePuzzle):
+            return NotImplemented
+        # Equal configurations are always packed the same way
+        return self._data == other._data
+    
+    def __hash__(self) -> int:
+        # bytes objects cache their own hash
+        data = self._data
+        return hash(data if isinstance(data, bytes) else data.tobytes())
+    
+    def __reduce__(self):
+        return (FrozenSnakePuzzle, (self.row_sums, self.col_sums, self.start_cell, self.end_cell))
+    
+    def freeze(self) -> 'FrozenSnakePuzzle':
+        """Frozen puzzles are already immutable, so this returns the puzzle itself."""
+        return self
+    
+    def __repr__(self) -> str:
+        return f"FrozenSnakePuzzle(rows={self.rows}, cols={self.cols}, start={self.start_cell}, end={self.end_cell})"
@@ -0,0 +1,377 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from .puzzle import BaseSnakePuzzle
+
+
+# Cell states of the deduction grid
+UNKNOWN = -1
+EMPTY = 0
+FILLED = 1
+
+# Difficulty tiers, from the easiest to the hardest
+TIERS = ('Easy', 'Medium', 'Hard', 'Evil')
+
+
+class _Contradiction(Exception):
+    """Raised when a grid state cannot be completed to a valid solution."""
+
+
+@dataclass
+class DifficultyRating:
+    """
+    Outcome of rating a SnakePuzzle with the deduction engine.
+
+    Attributes:
+        tier: One of 'Easy', 'Medium', 'Hard' or 'Evil', determined by the hardest
+              technique needed ('Evil' if the puzzle cannot be solved by deduction)
+        solved: True if the deductions determined every cell
+        rounds: Number of deduction rounds. Each round applies the easiest technique
+                that makes progress to the whole grid
+        techniques: Number of rounds in which each technique was applied
+        hardest: Name of the hardest technique needed (None if no deduction was needed)
+        score: Rounds weighted by technique level, for ordering puzzles within a tier
+        solution: The deduced solution (None if not solved)
+    """
+    tier: str
+    solved: bool
+    rounds: int = 0
+    techniques: Dict[str, int] = field(default_factory=dict)
+    hardest: Optional[str] = None
+    score: int = 0
+    solution: Optional[set] = None
+
+
+class DifficultyRater:
+    """
+    Deterministic difficulty rater for Snake puzzles.
+
+    Solves the puzzle with human-style deductions instead of a MIP solve. The
+    techniques, with their level (1 = Easy to 4 = Evil):
+
+    - line_sum (1): a row or column whose sum is reached is emptied, one that needs
+      all its open cells is filled
+    - endpoint_forcing (1): the start and end cells have exactly one filled neighbour
+    - path_continuation (1): other filled cells have exactly two filled neighbours
+    - dead_end (2): an open cell that could not get two filled neighbours, or would
+      get more than two, is empty
+    - reachability (2): an open cell that cannot be reached from the start cell
+      through non-empty cells is empty
+    - loop_avoidance (2): an open cell that would close a loop, or join the start
+      and end segments while other filled cells remain, is empty
+    - diagonal_exclusion (2): two filled diagonal neighbours need exactly one of their
+      two shared orthogonal neighbours, and a 2x2 block holds at most three cells
+    - contradiction (3): assuming a value for an open cell and propagating the
+      level 1 techniques leads to a contradiction, so the cell takes the other value
+    - deep_contradiction (4): as contradiction, propagating all level 1 and 2 techniques
+    """
+
+    def __init__(self, puzzle: BaseSnakePuzzle):
+        """
+        Initialize the rater with a puzzle.
+
+        Args:
+            puzzle: The SnakePuzzle instance to rate
+
+        Raises:
+            ValueError: If puzzle is not a SnakePuzzle
+        """
+        if not isinstance(puzzle, BaseSnakePuzzle):
+            raise ValueError("Puzzle must be a SnakePuzzle instance")
+
+        self.puzzle = puzzle
+        adjacency = puzzle.adjacency
+        self._positions = adjacency.positions
+        self._orthogonal = adjacency.orthogonal
+        self._diagonal_links = adjacency.diagonal_links
+        self._endpoints = (adjacency.index(puzzle.start_cell), adjacency.index(puzzle.end_cell))
+
+        rows, cols = puzzle.rows, puzzle.cols
+        self._lines: List[Tuple[int, List[int]]] = []
+        for row, required_sum in enumerate(puzzle.row_sums):
+            if required_sum is not None:
+                self._lines.append((required_sum, [row * cols + col for col in range(cols)]))
+        for col, required_sum in enumerate(puzzle.col_sums):
+            if required_sum is not None:
+                self._lines.append((required_sum, [row * cols + col for row in range(rows)]))
+        
+        # Labelled lines through each cell, for local propagation
+        self._cell_lines: List[List[int]] = [[] for _ in self._positions]
+        for line, (_, cells) in enumerate(self._lines):
+            for cell in cells:
+                self._cell_lines[cell].append(line)
+
+        # Techniques in order of increasing difficulty, with their level
+        self._techniques: List[Tuple[str, int, Callable[[List[int]], Dict[int, int]]]] = [
+            ('line_sum', 1, self._line_sum),
+            ('endpoint_forcing', 1, self._endpoint_forcing),
+            ('path_continuation', 1, self._path_continuation),
+            ('dead_end', 2, self._dead_end),
+            ('reachability', 2, self._reachability),
+            ('loop_avoidance', 2, self._loop_avoidance),
+            ('diagonal_exclusion', 2, self._diagonal_exclusion),
+            ('contradiction', 3, lambda state: self._contradiction(state, max_level=1)),
+            ('deep_contradiction', 4, lambda state: self._contradiction(state, max_level=2)),
+        ]
+
+    def rate(self) -> DifficultyRating:
+        """
+        Rate the puzzle.
+
+        Returns:
+            DifficultyRating with the tier, the number of rounds and the techniques used
+
+        Raises:
+            ValueError: If the deductions prove that the puzzle has no solution
+        """
+        state = [UNKNOWN] * len(self._positions)
+        for cell in self._endpoints:
+            state[cell] = FILLED
+
+        rounds = 0
+        score = 0
+        level = 0
+        hardest = None
+        techniques: Dict[str, int] = {}
+
+        try:
+            while UNKNOWN in state:
+                for name, technique_level, technique in self._techniques:
+                    deductions = technique(state)
+                    if deductions:
+                        break
+                else:
+                    # No technique makes progress
+                    return DifficultyRating(TIERS[-1], False, rounds, techniques, hardest, score)
+
+                for cell, value in deductions.items():
+                    state[cell] = value
+                rounds += 1
+                score += technique_level
+                techniques[name] = techniques.get(name, 0) + 1
+                if technique_level > level:
+                    level, hardest = technique_level, name
+
+            self._check_complete(state)
+        except _Contradiction:
+            raise ValueError("Puzzle has no solution")
+
+        solution = {self._positions[cell] for cell, value in enumerate(state) if value == FILLED}
+        return DifficultyRating(TIERS[max(level, 1) - 1], True, rounds, techniques, hardest, score, solution)
+
+    def _propagate(self, state: List[int], max_level: int, changed: List[int]) -> None:
+        """
+        Apply techniques up to max_level (1 or 2) until none makes progress.
+        
+        The level 1 techniques only depend on the lines and neighbours of a cell, so
+        they are propagated locally from the changed cells. Raises _Contradiction if
+        one is found.
+        """
+        queue = list(changed)
+        while True:
+            self._propagate_local(state, queue)
+            if max_level < 2:
+                return
+            for name, level, technique in self._techniques:
+                if level == 2:
+                    deductions = technique(state)
+                    if deductions:
+                        for cell, value in deductions.items():
+                            state[cell] = value
+                        queue = list(deductions)
+                        break
+            else:
+                return
+
+    def _propagate_local(self, state: List[int], queue: List[int]) -> None:
+        """Apply line_sum, endpoint_forcing and path_continuation around each changed cell."""
+        while queue:
+            cell = queue.pop()
+            deductions: Dict[int, int] = {}
+            for line in self._cell_lines[cell]:
+                self._check_line(state, line, deductions)
+            for neighbour in (cell,) + self._orthogonal[cell]:
+                if state[neighbour] == FILLED:
+                    self._force_degree(state, neighbour, 1 if neighbour in self._endpoints else 2, deductions)
+            for deduced, value in deductions.items():
+                if state[deduced] == UNKNOWN:
+                    state[deduced] = value
+                    queue.append(deduced)
+
+    def _check_complete(self, state: List[int]) -> None:
+        """Raise _Contradiction if a fully determined grid is not a valid solution."""
+        solution = {self._positions[cell] for cell, value in enumerate(state) if value == FILLED}
+        if not self.puzzle.is_valid_solution(solution):
+            raise _Contradiction()
+
+    @staticmethod
+    def _set(deductions: Dict[int, int], cell: int, value: int) -> None:
+        """Record a deduction, raising _Contradiction if the cell was already deduced otherwise."""
+        if deductions.setdefault(cell, value) != value:
+            raise _Contradiction()
+
+    def _line_sum(self, state: List[int]) -> Dict[int, int]:
+        deductions: Dict[int, int] = {}
+        for line in range(len(self._lines)):
+            self._check_line(state, line, deductions)
+        return deductions
+
+    def _check_line(self, state: List[int], line: int, deductions: Dict[int, int]) -> None:
+        """Deduce the open cells of a labelled line whose sum is reached or needs all open cells."""
+        required_sum, cells = self._lines[line]
+        values = [state[cell] for cell in cells]
+        filled = values.count(FILLED)
+        unknown = values.count(UNKNOWN)
+        if filled > required_sum or filled + unknown < required_sum:
+            raise _Contradiction()
+        if unknown and (filled == required_sum or filled + unknown == required_sum):
+            value = EMPTY if filled == required_sum else FILLED
+            for cell in cells:
+                if state[cell] == UNKNOWN:
+                    self._set(deductions, cell, value)
+
+    def _force_degree(self, state: List[int], cell: int, degree: int, deductions: Dict[int, int]) -> None:
+        """Deduce the open neighbours of a filled cell that needs exactly degree filled neighbours."""
+        filled = 0
+        unknown = []
+        for neighbour in self._orthogonal[cell]:
+            value = state[neighbour]
+            if value == FILLED:
+                filled += 1
+            elif value == UNKNOWN:
+                unknown.append(neighbour)
+        if filled > degree or filled + len(unknown) < degree:
+            raise _Contradiction()
+        if unknown and filled == degree:
+            for neighbour in unknown:
+                self._set(deductions, neighbour, EMPTY)
+        elif unknown and filled + len(unknown) == degree:
+            for neighbour in unknown:
+                self._set(deductions, neighbour, FILLED)
+
+    def _endpoint_forcing(self, state: List[int]) -> Dict[int, int]:
+        deductions: Dict[int, int] = {}
+        for cell in self._endpoints:
+            self._force_degree(state, cell, 1, deductions)
+        return deductions
+
+    def _path_continuation(self, state: List[int]) -> Dict[int, int]:
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if value == FILLED and cell not in self._endpoints:
+                self._force_degree(state, cell, 2, deductions)
+        return deductions
+
+    def _dead_end(self, state: List[int]) -> Dict[int, int]:
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if value == UNKNOWN:
+                open_neighbours = 0
+                filled = 0
+                for neighbour in self._orthogonal[cell]:
+                    neighbour_value = state[neighbour]
+                    if neighbour_value != EMPTY:
+                        open_neighbours += 1
+                        if neighbour_value == FILLED:
+                            filled += 1
+                if open_neighbours < 2 or filled > 2:
+                    deductions[cell] = EMPTY
+        return deductions
+
+    def _reachability(self, state: List[int]) -> Dict[int, int]:
+        start = self._endpoints[0]
+        reached = {start}
+        stack = [start]
+        while stack:
+            cell = stack.pop()
+            for neighbour in self._orthogonal[cell]:
+                if neighbour not in reached and state[neighbour] != EMPTY:
+                    reached.add(neighbour)
+                    stack.append(neighbour)
+
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if cell not in reached:
+                if value == FILLED:
+                    raise _Contradiction()
+                if value == UNKNOWN:
+                    deductions[cell] = EMPTY
+        return deductions
+
+    def _diagonal_exclusion(self, state: List[int]) -> Dict[int, int]:
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if value != FILLED:
+                continue
+            for diagonal, shared_1, shared_2 in self._diagonal_links[cell]:
+                diagonal_value = state[diagonal]
+                first, second = state[shared_1], state[shared_2]
+                if diagonal_value == FILLED:
+                    # Exactly one of the shared cells connects the diagonal pair
+                    if first == second != UNKNOWN:
+                        raise _Contradiction()
+                    if first != UNKNOWN and second == UNKNOWN:
+                        self._set(deductions, shared_2, 1 - first)
+                    elif second != UNKNOWN and first == UNKNOWN:
+                        self._set(deductions, shared_1, 1 - second)
+                elif diagonal_value == UNKNOWN and first == second != UNKNOWN:
+                    # Neither shared cell can connect the diagonal (both empty),
+                    # or filling it would complete a 2x2 block (both filled)
+                    self._set(deductions, diagonal, EMPTY)
+        return deductions
+
+    def _loop_avoidance(self, state: List[int]) -> Dict[int, int]:
+        # Label the segments of orthogonally connected filled cells
+        segment = [-1] * len(state)
+        segments = 0
+        for cell, value in enumerate(state):
+            if value == FILLED and segment[cell] < 0:
+                segment[cell] = segments
+                stack = [cell]
+                while stack:
+                    current = stack.pop()
+                    for neighbour in self._orthogonal[current]:
+                        if state[neighbour] == FILLED and segment[neighbour] < 0:
+                            segment[neighbour] = segments
+                            stack.append(neighbour)
+                segments += 1
+
+        start_segment, end_segment = segment[self._endpoints[0]], segment[self._endpoints[1]]
+        if start_segment == end_segment:
+            # The path is complete, every remaining open cell would touch it or be disconnected
+            if segments > 1:
+                raise _Contradiction()
+            return {cell: EMPTY for cell, value in enumerate(state) if value == UNKNOWN}
+
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if value != UNKNOWN:
+                continue
+            joined = set()
+            for neighbour in self._orthogonal[cell]:
+                if state[neighbour] == FILLED:
+                    if segment[neighbour] in joined:
+                        deductions[cell] = EMPTY
+                        break
+                    joined.add(segment[neighbour])
+            else:
+                if segments > 2 and start_segment in joined and end_segment in joined:
+                    deductions[cell] = EMPTY
+        return deductions
+
+    def _contradiction(self, state: List[int], max_level: int) -> Dict[int, int]:
+        # Every open cell is tried against the same state, so one round collects all
+        # contradictions that are visible at this point
+        deductions: Dict[int, int] = {}
+        for cell, value in enumerate(state):
+            if value != UNKNOWN:
+                continue
+            for assumption in (FILLED, EMPTY):
+                trial = state.copy()
+                trial[cell] = assumption
+                try:
+                    self._propagate(trial, max_level, [cell])
+                    if UNKNOWN not in trial:
+                        self._check_complete(trial)
+                except _Contradiction:
+                    self._set(deductions, cell, 1 - assumption)
+        return deductions
@@ -1,6 +1,8 @@
-from .puzzle import SnakePuzzle
-from ortools.linear_solver import pywraplp
-from typing import Dict, Tuple, Optional, Set, List
+from .puzzle import BaseSnakePuzzle, Solution, SOLUTION_FORMATS
+from .events import ProgressCallback, ProgressEmitter, print_progress
+from ortools.linear_solver import pywraplp, linear_solver_pb2
+from typing import Dict, FrozenSet, Iterable, Tuple, Optional, Set, List, Union
+import numpy as np
 
 
 class SnakeSolver:
@@ -11,20 +13,25 @@ class SnakeSolver:
     problem.
     """
 
-    def __init__(self, puzzle: SnakePuzzle, solver_type: str = 'SCIP'):
+    def __init__(self, puzzle: BaseSnakePuzzle, solver_type: str = 'SCIP', builder: str = 'expression'):
         """
         Initialize the solver with a puzzle.
         
         Args:
             puzzle: The SnakePuzzle instance to solve
             solver_type: The solver type to use (default: 'SCIP')
+            builder: How the model is built: 'expression' adds each constraint as a
+                     linear expression, 'array' assembles the identical model from
+                     precomputed index and coefficient arrays (faster on large grids)
             
         Raises:
-            ValueError: If puzzle is invalid or solver creation fails
+            ValueError: If puzzle is invalid, the builder is unknown or solver creation fails
         """
         
-        if not isinstance(puzzle, SnakePuzzle):
+        if not isinstance(puzzle, BaseSnakePuzzle):
             raise ValueError("Puzzle must be a SnakePuzzle instance")
+        if builder not in ('expression', 'array'):
+            raise ValueError(f"Unknown model builder '{builder}'")
         
         self.puzzle = puzzle
         self.solver = pywraplp.Solver.CreateSolver(solver_type)
@@ -34,14 +41,30 @@ class SnakeSolver:
         self._solve_stats: Dict[str, int] = {
             'iterations': 0,
             'cutting_planes_added': 0,
-            'disconnected_solutions_found': 0
+            'disconnected_solutions_found': 0,
+            'pool_solutions': 0
         }        
+        self._solve_status: Optional[str] = None
         
         # Setup the mathematical model
         self.variables: Dict[Tuple[int, int], pywraplp.Variable] = {}
+        # Row and column sum constraints by index, so clues can be changed on the built model
+        self._row_constraints: Dict[int, pywraplp.Constraint] = {}
+        self._col_constraints: Dict[int, pywraplp.Constraint] = {}
+        # Start and end fixings, and each cell's path constraints (one row for an
+        # endpoint, two otherwise), so the endpoints can be moved on the built model
+        self._endpoint_constraints: List[pywraplp.Constraint] = []
+        self._path_constraints: Dict[Tuple[int, int], List[pywraplp.Constraint]] = {}
+        # Component of each connectivity cut in the model, learned or preloaded
+        self._cut_components: Dict[FrozenSet[Tuple[int, int]], None] = {}
+        # No-good cuts from exclude_solution, only valid while the endpoints stay fixed
+        self._exclusion_constraints: List[pywraplp.Constraint] = []
 
-        self._add_variables()
-        self._add_constraints()
+        if builder == 'array':
+            self._build_model_from_arrays()
+        else:
+            self._add_variables()
+            self._add_constraints()
 
     def _add_variables(self) -> None:
         """
@@ -73,10 +96,10 @@ class SnakeSolver:
         These cells must be included in the solution.
         """
         # Fix start cell
-        self.solver.Add(self.variables[self.puzzle.start_cell] == 1)
+        self._endpoint_constraints.append(self.solver.Add(self.variables[self.puzzle.start_cell] == 1))
         
         # Fix end cell
-        self.solver.Add(self.variables[self.puzzle.end_cell] == 1)
+        self._endpoint_constraints.append(self.solver.Add(self.variables[self.puzzle.end_cell] == 1))
     
     def _add_snake_path_constraints(self) -> None:
         """
@@ -84,31 +107,30 @@ class SnakeSolver:
         - Start and end cells: must have exactly 1 adjacent activated neighbor
         - Other cells: when activated, must have exactly 2 adjacent activated neighbors; when not activated, any number
         """
-        for row in range(self.puzzle.rows):
-            for col in range(self.puzzle.cols):
-                position = (row, col)
-                
-                # Get adjacent cells
-                adjacent_positions = self.puzzle.get_tiles_by_offsets(position, self.puzzle._orthogonal_offsets)
-                adjacent_vars = [self.variables[adj_pos] for adj_pos in adjacent_positions]
-                neighbor_sum = sum(adjacent_vars) # type: ignore
-                
-                if position == self.puzzle.start_cell or position == self.puzzle.end_cell:
-                    # Start and end cells: must have exactly 1 neighbor
-                    self.solver.Add(neighbor_sum == 1)
-                else:
-                    # Other cells: if activated (x_ij = 1), must have exactly 2 neighbors, if not activated (x_ij = 0) then no limit
-                    # Enforced using two constraints as follows:
-                    self.solver.Add(neighbor_sum >= 2 * self.variables[position])  # type: ignore
-                    self.solver.Add(neighbor_sum <= 4 - 2 * self.variables[position])  # type: ignore
+        adjacency = self.puzzle.adjacency
+        for cell, position in enumerate(adjacency.positions):
+            # Get adjacent cells
+            adjacent_vars = [self.variables[adjacency.positions[adj]] for adj in adjacency.orthogonal[cell]]
+            neighbor_sum = sum(adjacent_vars) # type: ignore
+            
+            if position == self.puzzle.start_cell or position == self.puzzle.end_cell:
+                # Start and end cells: must have exactly 1 neighbor
+                self._path_constraints[position] = [self.solver.Add(neighbor_sum == 1)]
+            else:
+                # Other cells: if activated (x_ij = 1), must have exactly 2 neighbors, if not activated (x_ij = 0) then no limit
+                # Enforced using two constraints as follows:
+                self._path_constraints[position] = [
+                    self.solver.Add(neighbor_sum >= 2 * self.variables[position]),  # type: ignore
+                    self.solver.Add(neighbor_sum <= 4 - 2 * self.variables[position]),  # type: ignore
+                ]
 
-                    # Depending on the value of x_ij, these two constraints evaluate to:
-                    #   x_ij = 1:
-                    #       neighbor_sum >= 2
-                    #       neighbor_sum <= 2
-                    #   x_ij = 0
-                    #       neighbor_sum >= 0
-                    #       neighbor_sum <= 4
+                # Depending on the value of x_ij, these two constraints evaluate to:
+                #   x_ij = 1:
+                #       neighbor_sum >= 2
+                #       neighbor_sum <= 2
+                #   x_ij = 0
+                #       neighbor_sum >= 0
+                #       neighbor_sum <= 4
     
     def _add_row_sum_constraints(self) -> None:
         """
@@ -117,7 +139,7 @@ class SnakeSolver:
         for row_idx, required_sum in enumerate(self.puzzle.row_sums):
             if required_sum is not None:
                 row_vars = [self.variables[(row_idx, col)] for col in range(self.puzzle.cols)]
-                self.solver.Add(sum(row_vars) == required_sum) # type: ignore
+                self._row_constraints[row_idx] = self.solver.Add(sum(row_vars) == required_sum) # type: ignore
     
     def _add_col_sum_constraints(self) -> None:
         """
@@ -126,7 +148,7 @@ class SnakeSolver:
         for col_idx, required_sum in enumerate(self.puzzle.col_sums):
             if required_sum is not None:
                 col_vars = [self.variables[(row, col_idx)] for row in range(self.puzzle.rows)]
-                self.solver.Add(sum(col_vars) == required_sum) # type: ignore
+                self._col_constraints[col_idx] = self.solver.Add(sum(col_vars) == required_sum) # type: ignore
     
     def _add_diagonal_touching_constraints(self) -> None:
         """
@@ -135,23 +157,15 @@ class SnakeSolver:
         
         Only checks upper diagonals to avoid duplicate constraints.
         """
-        for row in range(self.puzzle.rows):
-            for col in range(self.puzzle.cols):
-                position = (row, col)
-                
-                # Only check upper-left and upper-right diagonals to avoid duplicates
-                # This covers all diagonal pairs exactly once
-                for diag_offset in [(-1, -1), (-1, 1)]:
-                    diag_pos = self.puzzle.get_tile_by_offset(position, diag_offset)
-                    if diag_pos is not None:
-                        # Get the two orthogonal cells that could connect the diagonal pair
-                        dr, dc = diag_offset
-                        ortho_pos1 = self.puzzle.get_tile_by_offset(position, (dr, 0))  # vertical connection
-                        ortho_pos2 = self.puzzle.get_tile_by_offset(position, (0, dc))  # horizontal connection
-                        
-                        if ortho_pos1 is not None and ortho_pos2 is not None:
-                            # x_ij + x_diagonal <= x_ortho1 + x_ortho2 + 1
-                            self.solver.Add(self.variables[position] + self.variables[diag_pos] <= self.variables[ortho_pos1] + self.variables[ortho_pos2] + 1) # type: ignore
+        adjacency = self.puzzle.adjacency
+        for cell, position in enumerate(adjacency.positions):
+            # Only check upper-left and upper-right diagonals (lower flat index) to avoid duplicates
+            # This covers all diagonal pairs exactly once
+            for diagonal, vertical, horizontal in adjacency.diagonal_links[cell]:
+                if diagonal < cell:
+                    # The vertical and horizontal cells are the two orthogonal cells that could connect the diagonal pair
+                    # x_ij + x_diagonal <= x_ortho1 + x_ortho2 + 1
+                    self.solver.Add(self.variables[position] + self.variables[adjacency.positions[diagonal]] <= self.variables[adjacency.positions[vertical]] + self.variables[adjacency.positions[horizontal]] + 1) # type: ignore
 
     def _add_no_2x2_block_constraints(self) -> None:
         """
@@ -172,116 +186,537 @@ class SnakeSolver:
                 grid_vars = [self.variables[pos] for pos in positions]
                 self.solver.Add(sum(grid_vars) <= 3) # type: ignore
 
-    def solve(self, verbose: bool = False, max_iterations: int = 10) -> Optional[set]:
+    def _build_model_from_arrays(self) -> None:
+        """
+        Build the complete model from precomputed index and coefficient arrays.
+        
+        Produces the same variables and constraints, in the same order, as
+        _add_variables and _add_constraints. The rows are computed with NumPy and
+        assembled into an MPModelProto that is loaded into the backend in one call,
+        instead of creating temporary expression objects for every term.
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        index = np.arange(rows * cols).reshape(rows, cols)
+        infinity = float('inf')
+        
+        model = linear_solver_pb2.MPModelProto()
+        for row in range(rows):
+            for col in range(cols):
+                model.variable.add(lower_bound=0, upper_bound=1, is_integer=True, name=f"x_{row}_{col}")
+        
+        # Start and end cells: x_ij == 1
+        endpoints = np.array([[index[self.puzzle.start_cell]], [index[self.puzzle.end_cell]]])
+        _append_constraint_rows(model, endpoints, 1, 1, 1)
+        
+        # Row and column sums
+        for row_idx, required_sum in enumerate(self.puzzle.row_sums):
+            if required_sum is not None:
+                _append_constraint_rows(model, index[row_idx:row_idx + 1, :], 1, required_sum, required_sum)
+        for col_idx, required_sum in enumerate(self.puzzle.col_sums):
+            if required_sum is not None:
+                _append_constraint_rows(model, index[:, col_idx].reshape(1, rows), 1, required_sum, required_sum)
+        
+        # Snake path: each cell has one row [up, down, left, right, self] (-1 marks missing neighbours).
+        # Endpoints get a single equality row without self; other cells get the >= and <= rows.
+        padded = np.pad(index, 1, constant_values=-1)
+        neighbours = np.stack([padded[:-2, 1:-1], padded[2:, 1:-1], padded[1:-1, :-2], padded[1:-1, 2:]], axis=-1)
+        path_rows = np.concatenate([neighbours.reshape(-1, 4), index.reshape(-1, 1)], axis=1)
+        is_endpoint = np.zeros(rows * cols, dtype=bool)
+        is_endpoint[endpoints.ravel()] = True
+        
+        endpoint_rows = path_rows.copy()
+        endpoint_rows[:, 4] = -1
+        candidates = np.concatenate([endpoint_rows[is_endpoint], path_rows[~is_endpoint], path_rows[~is_endpoint]])
+        self_coefficients = np.concatenate([
+            np.ones(is_endpoint.sum()), np.full((~is_endpoint).sum(), -2.0), np.full((~is_endpoint).sum(), 2.0)
+        ])
+        lower_bounds = np.concatenate([
+            np.ones(is_endpoint.sum()), np.zeros((~is_endpoint).sum()), np.full((~is_endpoint).sum(), -infinity)
+        ])
+        upper_bounds = np.concatenate([
+            np.ones(is_endpoint.sum()), np.full((~is_endpoint).sum(), infinity), np.full((~is_endpoint).sum(), 4.0)
+        ])
+        cells = np.arange(rows * cols)
+        order = np.argsort(np.concatenate([
+            cells[is_endpoint] * 2, cells[~is_endpoint] * 2, cells[~is_endpoint] * 2 + 1
+        ]), kind='stable')
+        coefficients = np.ones(candidates.shape)
+        coefficients[:, 4] = self_coefficients
+        _append_constraint_rows(model, candidates[order], coefficients[order], lower_bounds[order], upper_bounds[order])
+        
+        # Diagonal touching: x_ij + x_diagonal - x_ortho1 - x_ortho2 <= 1 for the upper-left
+        # and upper-right diagonals of each cell, interleaved per cell as in the expression builder
+        upper_left = np.full((rows, cols, 4), -1)
+        upper_left[1:, 1:] = np.stack([index[1:, 1:], index[:-1, :-1], index[:-1, 1:], index[1:, :-1]], axis=-1)
+        upper_right = np.full((rows, cols, 4), -1)
+        upper_right[1:, :-1] = np.stack([index[1:, :-1], index[:-1, 1:], index[:-1, :-1], index[1:, 1:]], axis=-1)
+        diagonal_rows = np.stack([upper_left, upper_right], axis=2).reshape(-1, 4)
+        diagonal_rows = diagonal_rows[diagonal_rows[:, 0] >= 0]
+        _append_constraint_rows(model, diagonal_rows, np.array([1.0, 1.0, -1.0, -1.0]), -infinity, 1)
+        
+        # No 2x2 blocks: sum of each 2x2 sub-grid <= 3
+        block_rows = np.stack([index[:-1, :-1], index[:-1, 1:], index[1:, :-1], index[1:, 1:]], axis=-1).reshape(-1, 4)
+        _append_constraint_rows(model, block_rows, 1, -infinity, 3)
+        
+        error = self.solver.LoadModelFromProtoKeepNames(model)
+        if error:
+            raise RuntimeError(f"Failed to load model: {error}")
+        
+        variables = self.solver.variables()
+        for row in range(rows):
+            for col in range(cols):
+                self.variables[(row, col)] = variables[row * cols + col]
+        
+        # Endpoint, sum and path constraints come first, in this order
+        constraints = iter(self.solver.constraints())
+        self._endpoint_constraints = [next(constraints), next(constraints)]
+        for row_idx, required_sum in enumerate(self.puzzle.row_sums):
+            if required_sum is not None:
+                self._row_constraints[row_idx] = next(constraints)
+        for col_idx, required_sum in enumerate(self.puzzle.col_sums):
+            if required_sum is not None:
+                self._col_constraints[col_idx] = next(constraints)
+        for cell, position in enumerate(self.variables):
+            self._path_constraints[position] = [next(constraints) for _ in range(1 if is_endpoint[cell] else 2)]
+
+    def solve(self, verbose: bool = False, max_iterations: int = 10,
+              result_format: str = 'set', callback: Optional[ProgressCallback] = None) -> Optional[Solution]:
         """
         Solve the puzzle using iterative connectivity enforcement.
         
+        Each round reads every solution in the backend's solution pool. A valid
+        one is returned; otherwise the stray components of all disconnected pool
+        solutions are cut together before the next round.
+        
+        Progress is reported as ProgressEvent objects (see EVENT_KINDS) to the callback,
+        to the verbose printer and to the 'snake_mip_solver' logger at DEBUG level.
+        When nobody is listening, no events are created.
+        
         Args:
             verbose: If True, print solver information
             max_iterations: Maximum number of iterations for cutting plane method
+            result_format: Representation of the returned solution, one of
+                           SOLUTION_FORMATS: 'set' of (row, col) tuples, 'bitmask' int,
+                           NumPy boolean 'grid' or 'path' list ordered from start to end
+            callback: Called with every progress event. Returning False stops the
+                      solve at that point with status 'stopped'
             
         Returns:
-            Set of (row, col) tuples representing the snake path, or None if no solution
+            The snake in the requested format, or None if no solution
+            
+        Raises:
+            ValueError: If the result format is unknown
         """
+        if result_format not in SOLUTION_FORMATS:
+            raise ValueError(f"Unknown result format '{result_format}'")
+        
+        listeners: List[ProgressCallback] = []
         if verbose:
-            print("Solving Snake puzzle...")
-            info = self.get_solver_info()
-            for key, value in info.items():
-                print(f"  {key}: {value}")
+            listeners.append(print_progress)
+        if callback is not None:
+            listeners.append(callback)
+        events = ProgressEmitter(listeners)
         
         # Reset solve statistics
         self._solve_stats = {
             'iterations': 0,
             'cutting_planes_added': 0,
-            'disconnected_solutions_found': 0
+            'disconnected_solutions_found': 0,
+            'pool_solutions': 0
         }
+        self._solve_status = 'iteration_limit'
+        iteration = 0
+        
+        if events and not events.emit('solve_started', 0, info=self.get_solver_info(),
+                                      max_iterations=max_iterations):
+            return self._finish_solve(events, iteration, 'stopped')
         
-        for iteration in range(max_iterations):
-            self._solve_stats['iterations'] = iteration + 1
+        for iteration in range(1, max_iterations + 1):
+            self._solve_stats['iterations'] = iteration
             
-            if verbose and iteration > 0:
-                print(f"Iteration {iteration + 1}")
+            if not events.emit('iteration_started', iteration):
+                return self._finish_solve(events, iteration, 'stopped')
             
             status = self.solver.Solve()
             
+            if events and not events.emit('backend_status', iteration, status=status,
+                                          name=_backend_status_name(status)):
+                return self._finish_solve(events, iteration, 'stopped')
+            
             if status == pywraplp.Solver.OPTIMAL:
-                # Extract solution: cells where x_ij = 1
-                solution = set()
-                for position, variable in self.variables.items():
-                    if variable.solution_value() == 1:
-                        solution.add(position)
+                # Every solution in the backend's pool satisfies the model, so each
+                # disconnected one yields valid cuts
+                pool = self._read_solution_pool()
+                self._solve_stats['pool_solutions'] += len(pool)
+                results = [self.puzzle.validate_solution(solution) for solution in pool]
                 
                 # Check connectivity using puzzle validation
-                if self.puzzle.is_valid_solution(solution):
-                    if verbose:
-                        print(f"Valid solution found with {len(solution)} cells")
-                    return solution
-                else:
-                    # Solution is invalid - check if it's due to disconnected components
-                    disconnected_components = self._find_disconnected_components(solution)
+                for solution, result in zip(pool, results):
+                    if result.is_valid:
+                        events.emit('incumbent_found', iteration, cells=len(solution))
+                        self._finish_solve(events, iteration, 'solved')
+                        if result_format == 'set':
+                            return solution
+                        return self.puzzle.format_solution(solution, result_format)
+                
+                # No valid solution - check if it's due to disconnected components
+                disconnected_components = results[0].components
+                if len(disconnected_components) > 1:
+                    # We have disconnected components - add cutting plane constraints
+                    # for the returned solution and every disconnected pool solution
+                    pool_components = [result.components for result in results if len(result.components) > 1]
+                    self._solve_stats['disconnected_solutions_found'] += len(pool_components)
+                    
+                    if events and not events.emit('components_found', iteration,
+                                                  count=len(disconnected_components),
+                                                  sizes=[len(c) for c in disconnected_components],
+                                                  solutions=len(pool_components)):
+                        return self._finish_solve(events, iteration, 'stopped')
                     
-                    if len(disconnected_components) > 1:
-                        # We have disconnected components - add cutting plane constraints
-                        self._solve_stats['disconnected_solutions_found'] += 1
-                        
-                        if verbose:
-                            print(f"Found disconnected solution with {len(disconnected_components)} components, adding cutting plane constraint")
-                        
-                        constraints_added = self._add_cutting_plane_constraints(disconnected_components)
-                        self._solve_stats['cutting_planes_added'] += constraints_added
-                    else:
-                        # Solution is invalid for other reasons (not disconnected components)
-                        if verbose:
-                            print("Solution failed validation for reasons other than connectivity")
-                        return None
+                    # Pool solutions often share stray components, which are cut once
+                    constraints_added = sum(self._add_cutting_plane_constraints(components)
+                                            for components in pool_components)
+                    self._solve_stats['cutting_planes_added'] += constraints_added
+                    
+                    if not events.emit('cuts_added', iteration, count=constraints_added,
+                                       total=self._solve_stats['cutting_planes_added']):
+                        return self._finish_solve(events, iteration, 'stopped')
+                else:
+                    # Solution is invalid for other reasons (not disconnected components)
+                    return self._finish_solve(events, iteration, 'invalid', rule=results[0].rule)
                     
             elif status == pywraplp.Solver.FEASIBLE:
                 # This should not happen since the problem doesn't have an objective function.
                 raise RuntimeError("Unexpected FEASIBLE status for constraint satisfaction problem")
             elif status == pywraplp.Solver.INFEASIBLE:
-                if verbose:
-                    print("No solution exists for this puzzle")
-                return None
+                return self._finish_solve(events, iteration, 'infeasible')
             else:
-                if verbose:
-                    print(f"Solver status: {status}")
-                return None
+                return self._finish_solve(events, iteration, 'not_solved', backend_status=status)
         
-        if verbose:
-            print(f"No valid solution found after {max_iterations} iterations")
-        return None
+        return self._finish_solve(events, iteration, 'iteration_limit')
     
-    def _find_disconnected_components(self, solution: Set[Tuple[int, int]]) -> List[Set[Tuple[int, int]]]:
-        """Find all disconnected components in the solution."""
-        unvisited = solution.copy()
-        components = []
+    def _finish_solve(self, events: ProgressEmitter, iteration: int, status: str, **data) -> None:
+        """Record the outcome of a solve and report it with a 'finished' event."""
+        self._solve_status = status
+        events.emit('finished', iteration, status=status, **data)
+    
+    def get_learned_cuts(self) -> List[Set[Tuple[int, int]]]:
+        """
+        Get the connectivity cuts in the model, learned by solves or preloaded.
+        
+        Each cut is the cell set of a closed loop that a solution may not contain
+        completely. No snake contains a closed loop, so the cuts stay valid for any
+        puzzle on a grid of the same shape, whatever its clues and endpoints. The
+        no-good cuts of exclude_solution are not included.
+        
+        Returns:
+            List of cuts as sets of (row, col) tuples, in the order they were added
+        """
+        return [set(component) for component in self._cut_components]
+    
+    def add_cuts(self, cuts: Iterable[Iterable[Tuple[int, int]]]) -> int:
+        """
+        Preload connectivity cuts, e.g. learned by an earlier solver (see get_learned_cuts).
+        
+        Cuts already in the model are skipped. Later solves do not need to learn the
+        preloaded cuts again, so they converge in fewer iterations.
         
-        while unvisited:
-            # Start DFS from any unvisited node
-            start = next(iter(unvisited))
-            component = set()
-            stack = [start]
+        Args:
+            cuts: Cuts as collections of (row, col) positions
             
-            while stack:
-                current = stack.pop()
-                if current in unvisited:
-                    unvisited.remove(current)
-                    component.add(current)
-                    
-                    # Add orthogonal neighbors to stack
-                    adjacent_positions = self.puzzle.get_tiles_by_offsets(current, self.puzzle._orthogonal_offsets)
-                    for neighbor in adjacent_positions:
-                        if neighbor in unvisited:
-                            stack.append(neighbor)
+        Returns:
+            Number of cuts added
             
+        Raises:
+            ValueError: If a position is out of bounds or a cut is not a set of closed
+                        loops (every cell needs exactly two orthogonal neighbours in the cut)
+        """
+        components = []
+        for cut in cuts:
+            component = frozenset(tuple(position) for position in cut)
+            for row, col in component:
+                if not self.puzzle.is_within_bounds(row, col):
+                    raise ValueError(f"Position {(row, col)} is out of bounds")
+                neighbors = sum((row + dr, col + dc) in component for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+                if neighbors != 2:
+                    raise ValueError(f"Cut cell {(row, col)} has {neighbors} neighbours in the cut, expected 2")
             components.append(component)
+        return sum(self._add_cut(component) for component in components)
+    
+    def exclude_solution(self, solution: Set[Tuple[int, int]]) -> None:
+        """
+        Add a no-good cut that excludes a known solution from future solves.
+        
+        The cut sum(x_ij for (i,j) in solution) <= |solution| - 1 only needs the cells of
+        the solution: a valid snake path can never be a strict superset of another valid
+        snake path between the same endpoints, so no other solution is cut off.
+        Because this only holds for fixed endpoints, the cuts are dropped when the
+        start or end cell is moved.
+        
+        Args:
+            solution: Set of (row, col) tuples of a valid solution
+        """
+        solution_vars = [self.variables[pos] for pos in solution]
+        self._exclusion_constraints.append(
+            self.solver.Add(sum(solution_vars) <= len(solution) - 1))  # type: ignore
+    
+    def set_row_sum(self, row: int, required_sum: Optional[int]) -> None:
+        """
+        Change the required sum of a row on the existing model.
+        
+        Only the bounds of the row constraint are changed (None relaxes them), so
+        the no-good and connectivity cuts already added stay in the model and the
+        next solve does not start from scratch. self.puzzle is replaced by a puzzle
+        with the updated row sums.
+        
+        Args:
+            row: Row index
+            required_sum: New required sum, or None to remove the clue
+            
+        Raises:
+            ValueError: If the row index or the sum is invalid
+        """
+        if not (0 <= row < self.puzzle.rows):
+            raise ValueError(f"Row {row} is out of bounds")
+        row_sums = list(self.puzzle.row_sums)
+        row_sums[row] = required_sum
+        self.puzzle = type(self.puzzle)(row_sums, list(self.puzzle.col_sums), self.puzzle.start_cell, self.puzzle.end_cell)
+        
+        if row not in self._row_constraints:
+            row_vars = [self.variables[(row, col)] for col in range(self.puzzle.cols)]
+            self._row_constraints[row] = self.solver.Add(sum(row_vars) >= 0)  # type: ignore
+        self._set_sum_bounds(self._row_constraints[row], required_sum)
+    
+    def set_col_sum(self, col: int, required_sum: Optional[int]) -> None:
+        """
+        Change the required sum of a column on the existing model.
+        
+        See set_row_sum.
+        
+        Args:
+            col: Column index
+            required_sum: New required sum, or None to remove the clue
+            
+        Raises:
+            ValueError: If the column index or the sum is invalid
+        """
+        if not (0 <= col < self.puzzle.cols):
+            raise ValueError(f"Column {col} is out of bounds")
+        col_sums = list(self.puzzle.col_sums)
+        col_sums[col] = required_sum
+        self.puzzle = type(self.puzzle)(list(self.puzzle.row_sums), col_sums, self.puzzle.start_cell, self.puzzle.end_cell)
         
-        return components
+        if col not in self._col_constraints:
+            col_vars = [self.variables[(row, col)] for row in range(self.puzzle.rows)]
+            self._col_constraints[col] = self.solver.Add(sum(col_vars) >= 0)  # type: ignore
+        self._set_sum_bounds(self._col_constraints[col], required_sum)
+    
+    def set_start_cell(self, position: Tuple[int, int]) -> None:
+        """
+        Move the start cell on the existing model.
+        
+        The endpoint fixing and the path constraints of the old and new start cells
+        are rewritten in place. Connectivity cuts stay valid: each one excludes a
+        closed loop of cells, which no snake can contain whatever its endpoints.
+        Solutions excluded with exclude_solution are allowed again, as those cuts
+        are only valid between fixed endpoints.
+        self.puzzle is replaced by a puzzle with the new start cell.
+        
+        Args:
+            position: New (row, col) start cell
+            
+        Raises:
+            ValueError: If the position is out of bounds or equal to the end cell
+        """
+        self._move_endpoint(0, position)
+    
+    def set_end_cell(self, position: Tuple[int, int]) -> None:
+        """
+        Move the end cell on the existing model.
+        
+        See set_start_cell.
+        
+        Args:
+            position: New (row, col) end cell
+            
+        Raises:
+            ValueError: If the position is out of bounds or equal to the start cell
+        """
+        self._move_endpoint(1, position)
+    
+    def fix_cell(self, position: Tuple[int, int], filled: Optional[bool]) -> None:
+        """
+        Fix a cell to filled or empty for the following solves, by changing its variable bounds.
+        
+        Args:
+            position: (row, col) position of the cell
+            filled: True to require the cell, False to forbid it, None to free it again
+            
+        Raises:
+            ValueError: If the position is out of bounds
+        """
+        if position not in self.variables:
+            raise ValueError(f"Position {position} is out of bounds")
+        if filled is None:
+            self.variables[position].SetBounds(0, 1)
+        else:
+            self.variables[position].SetBounds(int(filled), int(filled))
+    
+    def _move_endpoint(self, which: int, position: Tuple[int, int]) -> None:
+        """Move the start (which=0) or end (which=1) cell on the existing model."""
+        old_position = (self.puzzle.start_cell, self.puzzle.end_cell)[which]
+        endpoints = [self.puzzle.start_cell, self.puzzle.end_cell]
+        endpoints[which] = position
+        self.puzzle = type(self.puzzle)(list(self.puzzle.row_sums), list(self.puzzle.col_sums), *endpoints)
+        if position == old_position:
+            return
+        
+        # A no-good cut can exclude a valid snake between the new endpoints
+        infinity = self.solver.infinity()
+        for constraint in self._exclusion_constraints:
+            constraint.SetBounds(-infinity, infinity)
+        self._exclusion_constraints.clear()
+        
+        fixing = self._endpoint_constraints[which]
+        fixing.SetCoefficient(self.variables[old_position], 0)
+        fixing.SetCoefficient(self.variables[position], 1)
+        self._set_path_role(old_position, is_endpoint=False)
+        self._set_path_role(position, is_endpoint=True)
+    
+    def _set_path_role(self, position: Tuple[int, int], is_endpoint: bool) -> None:
+        """
+        Rewrite the path constraints of a cell for an endpoint (exactly 1 neighbour)
+        or another cell (exactly 2 neighbours when filled).
+        """
+        constraints = self._path_constraints[position]
+        variable = self.variables[position]
+        infinity = self.solver.infinity()
+        if is_endpoint:
+            # neighbor_sum == 1, with a second row (if any) relaxed
+            constraints[0].SetCoefficient(variable, 0)
+            constraints[0].SetBounds(1, 1)
+            for constraint in constraints[1:]:
+                constraint.SetBounds(-infinity, infinity)
+            return
+        
+        # neighbor_sum - 2 * x_ij >= 0 and neighbor_sum + 2 * x_ij <= 4
+        constraints[0].SetCoefficient(variable, -2)
+        constraints[0].SetBounds(0, infinity)
+        if len(constraints) == 1:
+            adjacency = self.puzzle.adjacency
+            upper = self.solver.Constraint(-infinity, 4)
+            for neighbor in adjacency.orthogonal[adjacency.index(position)]:
+                upper.SetCoefficient(self.variables[adjacency.positions[neighbor]], 1)
+            upper.SetCoefficient(variable, 2)
+            constraints.append(upper)
+        else:
+            constraints[1].SetBounds(-infinity, 4)
+    
+    def _set_sum_bounds(self, constraint: pywraplp.Constraint, required_sum: Optional[int]) -> None:
+        """Make a sum constraint an equality, or free it when required_sum is None."""
+        if required_sum is None:
+            constraint.SetBounds(-self.solver.infinity(), self.solver.infinity())
+        else:
+            constraint.SetBounds(required_sum, required_sum)
+    
+    def find_solutions(self, max_solutions: int = 2, max_iterations: int = 100) -> List[Set[Tuple[int, int]]]:
+        """
+        Find up to max_solutions distinct solutions on the same model.
+        
+        Each solution found is excluded with a no-good cut before solving again, and
+        the connectivity cuts learned along the way are kept. Use get_solve_status
+        afterwards: 'infeasible' means all solutions were found.
+        
+        Args:
+            max_solutions: Maximum number of solutions to find
+            max_iterations: Maximum number of cutting plane iterations per solve
+            
+        Returns:
+            List of solutions, each a set of (row, col) tuples
+        """
+        solutions = []
+        while len(solutions) < max_solutions:
+            solution = self.solve(max_iterations=max_iterations)
+            if solution is None:
+                break
+            solutions.append(solution)
+            self.exclude_solution(solution)
+        return solutions
+    
+    def get_backbone(self, solutions: Optional[List[Set[Tuple[int, int]]]] = None,
+                     max_iterations: int = 100) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        """
+        Find the cells that are filled in every solution and those that are empty in every solution.
+        
+        Candidates start as the cells on which all known solutions agree. Each remaining
+        candidate is tested on the same model by fixing its variable bounds to the
+        opposite value and solving: infeasibility proves the cell forced, while a new
+        solution removes every candidate it disagrees with. Connectivity cuts learned
+        along the way are kept, so later tests get cheaper. Cells fixed with fix_cell
+        count as forced and keep their bounds.
+        
+        Args:
+            solutions: Known solutions to start from (one is found if not given)
+            max_iterations: Maximum number of cutting plane iterations per solve
+            
+        Returns:
+            Tuple of (forced filled cells, forced empty cells)
+            
+        Raises:
+            ValueError: If the puzzle has no solution
+            RuntimeError: If a candidate could not be decided within the limits
+        """
+        if not solutions:
+            solution = self.solve(max_iterations=max_iterations)
+            if solution is None:
+                if self._solve_status == 'infeasible':
+                    raise ValueError("Puzzle has no solution")
+                raise RuntimeError(f"Could not find a solution (status: {self._solve_status})")
+            solutions = [solution]
+        
+        filled_candidates = set.intersection(*map(set, solutions))
+        empty_candidates = set(self.variables) - set.union(*map(set, solutions))
+        # Start and end cells are fixed by the model
+        forced_filled = {self.puzzle.start_cell, self.puzzle.end_cell}
+        forced_empty: Set[Tuple[int, int]] = set()
+        filled_candidates -= forced_filled
+        
+        for candidates, forced, value in ((filled_candidates, forced_filled, 0),
+                                          (empty_candidates, forced_empty, 1)):
+            # Cells pinned with fix_cell are forced without a test
+            for position in list(candidates):
+                variable = self.variables[position]
+                if variable.lb() == variable.ub():
+                    candidates.discard(position)
+                    forced.add(position)
+            while candidates:
+                position = candidates.pop()
+                variable = self.variables[position]
+                bounds = (variable.lb(), variable.ub())
+                variable.SetBounds(value, value)
+                try:
+                    solution = self.solve(max_iterations=max_iterations)
+                finally:
+                    variable.SetBounds(*bounds)
+                
+                if solution is not None:
+                    # A solution that disagrees with these candidates: none of them are forced
+                    filled_candidates &= solution
+                    empty_candidates -= solution
+                elif self._solve_status == 'infeasible':
+                    forced.add(position)
+                else:
+                    raise RuntimeError(f"Could not decide cell {position} (status: {self._solve_status})")
+        
+        return forced_filled, forced_empty
     
     def _add_cutting_plane_constraints(self, components: List[Set[Tuple[int, int]]]) -> int:
         """
         Add constraints to prevent the current disconnected solution.
         
+        Components that are already cut (by an earlier pool solution or a preloaded
+        cut) are skipped.
+        
         Args:
             components: List of disconnected components found in the solution
             
@@ -302,17 +737,44 @@ class SnakeSolver:
         # For each invalid component (doesn't contain both start and end),
         # add a constraint that prevents all cells in that component from being activated simultaneously
         constraints_added = 0
+        invalid_components = 0
         for component in components:
             if component != valid_component and len(component) > 0:
-                # Add constraint: sum of variables in this component <= |component| - 1
-                component_vars = [self.variables[pos] for pos in component]
-                self.solver.Add(sum(component_vars) <= len(component) - 1)  # type: ignore
-                constraints_added += 1
+                invalid_components += 1
+                constraints_added += self._add_cut(frozenset(component))
         
-        if constraints_added == 0:
+        if invalid_components == 0:
             raise RuntimeError("Expected to add cutting plane constraints but none were added")
         
         return constraints_added
+    
+    def _add_cut(self, component: FrozenSet[Tuple[int, int]]) -> int:
+        """Add the cut sum(x_ij for (i,j) in component) <= |component| - 1 unless it exists, returning 1 if added."""
+        if component in self._cut_components:
+            return 0
+        # Add constraint: sum of variables in this component <= |component| - 1
+        component_vars = [self.variables[pos] for pos in component]
+        self.solver.Add(sum(component_vars) <= len(component) - 1)  # type: ignore
+        self._cut_components[component] = None
+        return 1
+    
+    def _read_solution_pool(self) -> List[Set[Tuple[int, int]]]:
+        """
+        Read every solution the backend returned from its last solve.
+        
+        The returned solution comes first. Backends without a solution pool, or
+        with a single solution in it, yield a list of one solution. Afterwards the
+        variables hold the values of the last solution read.
+        
+        Returns:
+            List of solutions as sets of (row, col) tuples
+        """
+        pool = []
+        while True:
+            pool.append({position for position, variable in self.variables.items()
+                         if variable.solution_value() > 0.5})
+            if not self.solver.NextSolution():
+                return pool
 
     def get_solver_info(self) -> Dict[str, str]:
         """Get information about the solver and problem size."""
@@ -333,3 +795,47 @@ class SnakeSolver:
             Dictionary with solving statistics including iterations, cutting planes added, etc.
         """
         return self._solve_stats.copy()
+    
+    def get_solve_status(self) -> Optional[str]:
+        """
+        Get the outcome of the last solve attempt.
+        
+        Returns:
+            'solved', 'infeasible' (proven to have no further solution), 'iteration_limit',
+            'invalid', 'not_solved' (e.g. backend time limit), or None before the first solve
+        """
+        return self._solve_status
+
+
+def _append_constraint_rows(model: 'linear_solver_pb2.MPModelProto', var_index: np.ndarray,
+                            coefficients: Union[float, np.ndarray],
+                            lower_bounds: Union[float, np.ndarray],
+                            upper_bounds: Union[float, np.ndarray]) -> None:
+    """
+    Append one linear constraint per row of var_index to the model proto.
+    
+    Negative entries in var_index are padding and are dropped. Terms are sorted by
+    variable index, matching the order used by the backend when exporting a model.
+    Coefficients and bounds are broadcast against the rows.
+    """
+    var_index = np.asarray(var_index)
+    coefficients = np.broadcast_to(coefficients, var_index.shape)
+    order = np.argsort(var_index, axis=1, kind='stable')
+    var_index = np.take_along_axis(var_index, order, axis=1)
+    coefficients = np.take_along_axis(coefficients, order, axis=1)
+    padding = (var_index < 0).sum(axis=1)
+    lower_bounds = np.broadcast_to(lower_bounds, (len(var_index),))
+    upper_bounds = np.broadcast_to(upper_bounds, (len(var_index),))
+    
+    for indices, coefs, skip, lower, upper in zip(var_index.tolist(), coefficients.tolist(), padding.tolist(),
+                                                  lower_bounds.tolist(), upper_bounds.tolist()):
+        model.constraint.add(lower_bound=lower, upper_bound=upper,
+                             var_index=indices[skip:], coefficient=coefs[skip:])
+
+
+def _backend_status_name(status: int) -> str:
+    """Name of a pywraplp result status, e.g. 'OPTIMAL'."""
+    for name in ('OPTIMAL', 'FEASIBLE', 'INFEASIBLE', 'UNBOUNDED', 'ABNORMAL', 'MODEL_INVALID', 'NOT_SOLVED'):
+        if getattr(pywraplp.Solver, name) == status:
+            return name
+    return str(status)
@@ -0,0 +1,115 @@
+import json
+from snake_mip_solver import benchmark
+
+
+SMALL_CONFIG = {
+    "engines": {"SCIP": {"solver_type": "SCIP"}},
+    "sizes": [(5, 5)],
+    "fill_percentages": [0.3],
+    "seeds": [0, 1],
+    "max_iterations": 10,
+    "time_limit": 5.0,
+}
+
+
+class TestBenchmark:
+    """Test cases for the benchmark harness."""
+
+    def test_build_corpus_is_reproducible(self):
+        """Test that the corpus is identical across runs."""
+        corpus1 = benchmark.build_corpus([(5, 5)], [0.3], [0, 1])
+        corpus2 = benchmark.build_corpus([(5, 5)], [0.3], [0, 1])
+
+        assert len(corpus1) == 2
+        for entry1, entry2 in zip(corpus1, corpus2):
+            assert entry1["puzzle"].row_sums == entry2["puzzle"].row_sums
+            assert entry1["puzzle"].col_sums == entry2["puzzle"].col_sums
+            assert entry1["puzzle"].start_cell == entry2["puzzle"].start_cell
+
+    def test_build_corpus_records_generation_failure(self):
+        """Test that impossible corpus entries are recorded instead of raising."""
+        corpus = benchmark.build_corpus([(4, 4)], [1.0], [0])
+        assert corpus[0]["puzzle"] is None
+
+    def test_run_benchmark(self):
+        """Test that a small benchmark run produces runs and a summary."""
+        results = benchmark.run_benchmark(**SMALL_CONFIG)
+
+        assert len(results["runs"]) == 2
+        for run in results["runs"]:
+            assert run["engine"] == "SCIP"
+            assert run["solved"]
+            assert run["build_seconds"] >= 0
+            assert run["solve_seconds"] >= 0
+            assert run["iterations"] >= 1
+
+        entry = results["summary"]["SCIP/5x5/0.30"]
+        assert entry["runs"] == 2
+        assert entry["solved"] == 2
+
+        # Results must be JSON serializable
+        json.dumps(results)
+
+    def test_compare_with_baseline(self):
+        """Test regression detection against a baseline."""
+        baseline = {"summary": {"SCIP/5x5/0.30": {
+            "runs": 2, "solved": 2, "build_seconds": 0.1, "solve_seconds": 0.1,
+            "iterations": 1, "cutting_planes_added": 0,
+        }}}
+
+        same = {"summary": {"SCIP/5x5/0.30": dict(baseline["summary"]["SCIP/5x5/0.30"])}}
+        assert benchmark.compare_with_baseline(same, baseline) == []
+
+        slower = {"summary": {"SCIP/5x5/0.30": dict(baseline["summary"]["SCIP/5x5/0.30"], solve_seconds=0.5)}}
+        regressions = benchmark.compare_with_baseline(slower, baseline, threshold=1.5)
+        assert len(regressions) == 1
+        assert "solve_seconds" in regressions[0]
+
+        # Small absolute differences are treated as noise
+        noisy = {"summary": {"SCIP/5x5/0.30": dict(baseline["summary"]["SCIP/5x5/0.30"], build_seconds=0.105)}}
+        assert benchmark.compare_with_baseline(noisy, baseline, threshold=1.01) == []
+
+        unsolved = {"summary": {"SCIP/5x5/0.30": dict(baseline["summary"]["SCIP/5x5/0.30"], solved=1)}}
+        assert len(benchmark.compare_with_baseline(unsolved, baseline)) == 1
+
+    def test_measure_startup(self):
+        """Test that importing the package does not load OR-Tools or NumPy."""
+        startup = benchmark.measure_startup(repeats=1)
+
+        assert startup["import_seconds"] > 0
+        assert startup["loaded_modules"] == []
+
+    def test_compare_startup_with_baseline(self):
+        """Test regression detection of the import time and eagerly loaded modules."""
+        baseline = {"summary": {}, "startup": {"import_seconds": 0.1, "loaded_modules": []}}
+
+        assert benchmark.compare_with_baseline(dict(baseline), baseline) == []
+
+        slower = {"summary": {}, "startup": {"import_seconds": 0.5, "loaded_modules": []}}
+        assert benchmark.compare_with_baseline(slower, baseline) == [
+            "startup: import_seconds 0.5000s exceeds baseline 0.1000s x 1.5"]
+
+        eager = {"summary": {}, "startup": {"import_seconds": 0.1, "loaded_modules": ["ortools"]}}
+        assert benchmark.compare_with_baseline(eager, baseline) == [
+            "startup: import snake_mip_solver now loads ortools"]
+
+    def test_main_detects_regression(self, tmp_path, monkeypatch):
+        """Test that the command line entry point fails on regressions."""
+        # Fixed timings, so only the deterministic counts can differ between runs
+        time_solve = benchmark._time_solve
+        monkeypatch.setattr(benchmark, "_time_solve", lambda *args: dict(
+            time_solve(*args), build_seconds=0.01, solve_seconds=0.02))
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(dict(SMALL_CONFIG, seeds=[0])))
+        output_path = tmp_path / "results.json"
+
+        assert benchmark.main(["--config", str(config_path), "--output", str(output_path)]) == 0
+        results = benchmark.load_results(str(output_path))
+        assert results["summary"]["SCIP/5x5/0.30"]["solve_seconds"] == 0.02
+
+        # Same results as baseline: no regression
+        assert benchmark.main(["--config", str(config_path), "--baseline", str(output_path)]) == 0
+
+        # A threshold below 1 turns the deterministic iteration count into a regression
+        assert benchmark.main(["--config", str(config_path), "--baseline", str(output_path),
+                               "--threshold", "0.5"]) == 1
@@ -0,0 +1,76 @@
+import itertools
+import random
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakeSolver, SnakePuzzleGenerator, SolutionCounter, count_solutions
+
+
+def brute_force_count(puzzle):
+    """Count solutions by validating every subset of the non-endpoint cells."""
+    endpoints = {puzzle.start_cell, puzzle.end_cell}
+    cells = [(row, col) for row in range(puzzle.rows) for col in range(puzzle.cols)
+             if (row, col) not in endpoints]
+    return sum(
+        puzzle.is_valid_solution(endpoints | {cell for cell, filled in zip(cells, mask) if filled})
+        for mask in itertools.product((False, True), repeat=len(cells))
+    )
+
+
+class TestSolutionCounter:
+    """Test cases for the frontier dynamic programming solution counter."""
+
+    def test_count_matches_brute_force(self):
+        """Test the count against exhaustive enumeration on small random puzzles."""
+        rng = random.Random(7)
+        for _ in range(40):
+            rows, cols = rng.randint(1, 4), rng.randint(2, 4)
+            start, end = rng.sample([(row, col) for row in range(rows) for col in range(cols)], 2)
+            row_sums = [rng.randint(0, cols) if rng.random() < 0.3 else None for _ in range(rows)]
+            col_sums = [rng.randint(0, rows) if rng.random() < 0.3 else None for _ in range(cols)]
+            puzzle = SnakePuzzle(row_sums, col_sums, start_cell=start, end_cell=end)
+            assert count_solutions(puzzle) == brute_force_count(puzzle)
+
+    def test_count_unclued_board(self):
+        """Test counting all snakes between opposite corners of an unclued board."""
+        puzzle = SnakePuzzle([None] * 5, [None] * 5, start_cell=(0, 0), end_cell=(4, 4))
+        assert count_solutions(puzzle) == 90
+
+    def test_count_unique_puzzle(self):
+        """Test that a uniquely solvable puzzle has exactly one solution."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        assert count_solutions(puzzle) == 1
+
+        infeasible = SnakePuzzle([3, 3, 3], [3, 3, 3], start_cell=(0, 0), end_cell=(2, 2))
+        assert count_solutions(infeasible) == 0
+
+    def test_count_matches_solver_enumeration(self):
+        """Test the count against solutions enumerated with the MIP solver."""
+        puzzle, _ = SnakePuzzleGenerator(seed=3).generate(rows=8, cols=8, fill_percentage=0.4)
+        loose = SnakePuzzle([None if row % 2 else value for row, value in enumerate(puzzle.row_sums)],
+                            [None if col % 2 else value for col, value in enumerate(puzzle.col_sums)],
+                            puzzle.start_cell, puzzle.end_cell)
+        solver = SnakeSolver(loose)
+        solutions = solver.find_solutions(max_solutions=20)
+
+        assert solver.get_solve_status() == 'infeasible'
+        assert count_solutions(loose) == len(solutions) > 1
+
+    def test_count_is_invariant_under_transposition(self):
+        """Test that transposed puzzles, swept along different sides, agree."""
+        puzzle = SnakePuzzle([None, 2, None], [1, None, None, 2, None, None],
+                             start_cell=(0, 0), end_cell=(2, 5))
+        transposed = puzzle.transformed((False, False, True))
+        assert count_solutions(puzzle) == count_solutions(transposed) > 0
+
+    def test_long_narrow_board(self):
+        """Test that the frontier stays small on a long, narrow unclued board."""
+        counter = SolutionCounter(SnakePuzzle([None] * 4, [None] * 200, start_cell=(0, 0), end_cell=(3, 199)))
+        assert counter.count() > 2 ** 100
+
+        stats = counter.get_stats()
+        assert stats['cells'] == 4 * 201
+        assert stats['max_states'] < 100
+
+    def test_invalid_puzzle(self):
+        """Test that the counter requires a SnakePuzzle."""
+        with pytest.raises(ValueError, match="SnakePuzzle instance"):
+            SolutionCounter("not a puzzle")
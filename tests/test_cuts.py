@@ -0,0 +1,72 @@
+import json
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakeSolver, CutStore
+
+
+def disjoint_puzzle():
+    """Infeasible puzzle whose first solve finds a disconnected loop."""
+    return SnakePuzzle([4, 3, 3, 3, 0], [3, 0, 4, 2, 4], start_cell=(0, 0), end_cell=(2, 0))
+
+
+class TestCutStore:
+    """Test cases for persisting learned connectivity cuts."""
+
+    def test_preloaded_cuts_converge_in_one_iteration(self, tmp_path):
+        """Test that cuts saved after one solve make the next solve converge at once."""
+        path = str(tmp_path / 'cache' / 'cuts.json')
+        puzzle = disjoint_puzzle()
+        solver = SnakeSolver(puzzle)
+        assert solver.solve(max_iterations=5) is None
+        assert solver.get_solve_stats()['iterations'] == 2
+        cuts = solver.get_learned_cuts()
+        assert len(cuts) == solver.get_solve_stats()['cutting_planes_added']
+
+        store = CutStore(path)
+        assert store.record(solver) == len(cuts)
+        assert store.record(solver) == 0
+        store.save()
+
+        # A rotated copy of the puzzle finds the same cuts, in its own coordinates
+        transform = (True, False, True)
+        rotated = puzzle.transformed(transform)
+        reloaded = CutStore(path)
+        assert len(reloaded) == 1
+        assert sorted(map(sorted, reloaded.get(rotated))) == sorted(
+            sorted(puzzle.transform_position(position, transform) for position in cut) for cut in cuts)
+
+        rotated_solver = SnakeSolver(rotated)
+        assert reloaded.preload(rotated_solver) == len(cuts)
+        assert rotated_solver.solve(max_iterations=5) is None
+        assert rotated_solver.get_solve_status() == 'infeasible'
+        assert rotated_solver.get_solve_stats()['iterations'] == 1
+
+    def test_unknown_puzzle(self, tmp_path):
+        """Test that a puzzle without stored cuts preloads nothing."""
+        store = CutStore(str(tmp_path / 'cuts.json'))
+        solver = SnakeSolver(SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2)))
+        assert store.get(solver.puzzle) == []
+        assert store.preload(solver) == 0
+        assert len(store) == 0
+
+    def test_invalid_file(self, tmp_path):
+        """Test that a file that is not a cut store is rejected."""
+        path = tmp_path / 'cuts.json'
+        path.write_text(json.dumps([1, 2, 3]))
+        with pytest.raises(ValueError, match="not a cut store"):
+            CutStore(str(path))
+
+
+class TestSolverCuts:
+    """Test cases for exporting and preloading cuts on the solver."""
+
+    def test_add_cuts(self):
+        """Test that only closed loops are accepted and duplicates are skipped."""
+        solver = SnakeSolver(disjoint_puzzle())
+        loop = {(1, 2), (1, 3), (2, 2), (2, 3)}
+        assert solver.add_cuts([loop, list(loop)]) == 1
+        assert solver.get_learned_cuts() == [loop]
+
+        with pytest.raises(ValueError, match="expected 2"):
+            solver.add_cuts([{(0, 0), (0, 1)}])
+        with pytest.raises(ValueError, match="out of bounds"):
+            solver.add_cuts([{(5, 0)}])
@@ -0,0 +1,83 @@
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakePuzzleGenerator, PuzzleDeduplicator, BloomFilter
+from snake_mip_solver.puzzle import SYMMETRIES
+
+
+class TestCanonicalFingerprint:
+    """Test cases for symmetry invariant puzzle keys."""
+
+    def test_fingerprint_invariant_under_symmetries(self):
+        """Test that all rotations and reflections share one fingerprint."""
+        puzzle, path = SnakePuzzleGenerator(seed=5).generate(rows=5, cols=7, fill_percentage=0.4)
+        fingerprints = set()
+        for transform in SYMMETRIES:
+            transformed = puzzle.transformed(transform)
+            moved_path = {puzzle.transform_position(position, transform) for position in path}
+            assert transformed.is_valid_solution(moved_path)
+            assert transformed.canonical_key() == puzzle.canonical_key()
+            fingerprints.add(transformed.fingerprint())
+        assert fingerprints == {puzzle.fingerprint()}
+
+    def test_fingerprint_ignores_endpoint_order(self):
+        """Test that swapping start and end cells gives the same fingerprint."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        swapped = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(2, 2), end_cell=(0, 0))
+        assert puzzle.fingerprint() == swapped.fingerprint()
+
+    def test_different_puzzles_have_different_fingerprints(self):
+        """Test that puzzles differing in clues or endpoints are distinguished."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        hidden = SnakePuzzle([2, None, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        moved = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 1))
+        assert len({puzzle.fingerprint(), hidden.fingerprint(), moved.fingerprint()}) == 3
+
+    def test_canonical_form_transform(self):
+        """Test that the returned transform maps the puzzle to its canonical key."""
+        puzzle = SnakePuzzle([1, 2, 0, 3], [2, 1, 3], start_cell=(3, 2), end_cell=(0, 1))
+        key, transform = puzzle.canonical_form()
+        canonical = puzzle.transformed(transform)
+        assert canonical.canonical_form() == (key, (False, False, False))
+
+
+class TestPuzzleDeduplicator:
+    """Test cases for the streaming deduplication index."""
+
+    def test_exact_deduplication(self):
+        """Test that symmetric copies are reported as duplicates."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        index = PuzzleDeduplicator()
+        assert index.add(puzzle)
+        assert puzzle in index
+        for transform in SYMMETRIES:
+            assert not index.add(puzzle.transformed(transform))
+        assert len(index) == 1
+        assert index.get_stats() == {'seen': 9, 'unique': 1, 'duplicates': 8}
+
+    @pytest.mark.parametrize("bloom_capacity", [None, 1000])
+    def test_filter_stream(self, bloom_capacity):
+        """Test that filtering a generated stream drops duplicates lazily."""
+        stream = SnakePuzzleGenerator(seed=3).iter_generate(3, 3, 0.5, n=200)
+        index = PuzzleDeduplicator(bloom_capacity=bloom_capacity)
+        unique = list(index.filter(stream))
+
+        fingerprints = [puzzle.fingerprint() for puzzle, _ in unique]
+        assert len(fingerprints) == len(set(fingerprints)) == len(index)
+        assert len(unique) < 200
+        assert index.get_stats()['duplicates'] == 200 - len(unique)
+
+    def test_bloom_filter_false_positive_rate(self):
+        """Test that the Bloom filter has no false negatives and a bounded false-positive rate."""
+        bloom = BloomFilter(capacity=2000, false_positive_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"item-{i}")
+        assert all(f"item-{i}" in bloom for i in range(2000))
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 < 0.02
+
+    def test_bloom_filter_invalid_parameters(self):
+        """Test that invalid Bloom filter parameters are rejected."""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError, match="False-positive rate"):
+            BloomFilter(capacity=10, false_positive_rate=1.5)
@@ -1,6 +1,8 @@
 import pytest
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Set, Tuple
-from snake_mip_solver import SnakePuzzleGenerator
+from snake_mip_solver import SnakePuzzleGenerator, SnakeSolver
 from snake_mip_solver.puzzle import SnakePuzzle
 
 
@@ -66,6 +68,236 @@ class TestSnakePuzzleGenerator:
         assert puzzle1.start_cell == puzzle2.start_cell
         assert puzzle1.end_cell == puzzle2.end_cell
 
+    def test_generator_does_not_touch_global_random_state(self):
+        """Test that generators use their own random stream."""
+        random.seed(123)
+        expected = random.random()
+        
+        random.seed(123)
+        generator = SnakePuzzleGenerator(seed=42)
+        generator.generate(rows=6, cols=6, fill_percentage=0.3)
+        assert random.random() == expected
+
+    def test_generators_do_not_interfere_across_threads(self):
+        """Test that generators running in threads produce the same results as sequentially."""
+        seeds = [1, 2, 3, 4]
+        sequential = [SnakePuzzleGenerator(seed=seed).generate(8, 8, 0.3)[1] for seed in seeds]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = list(executor.map(lambda seed: SnakePuzzleGenerator(seed=seed).generate(8, 8, 0.3)[1], seeds))
+        
+        assert threaded == sequential
+
+    def test_generate_many(self):
+        """Test generating several independent puzzles."""
+        generator = SnakePuzzleGenerator(seed=42)
+        results = generator.generate_many(5, rows=6, cols=6, fill_percentage=0.3)
+        
+        assert len(results) == 5
+        for puzzle, path in results:
+            assert isinstance(puzzle, SnakePuzzle)
+            assert puzzle.is_valid_solution(path)
+        
+        # Independent streams give different puzzles
+        assert len({frozenset(path) for _, path in results}) == 5
+        
+        # Reproducible for the same seed
+        again = SnakePuzzleGenerator(seed=42).generate_many(5, rows=6, cols=6, fill_percentage=0.3)
+        assert [path for _, path in again] == [path for _, path in results]
+
+    def test_generate_many_parallel_is_deterministic(self):
+        """Test that the number of workers does not change the generated puzzles."""
+        generator = SnakePuzzleGenerator(seed=7)
+        sequential = generator.generate_many(6, rows=7, cols=7, fill_percentage=0.3, workers=1)
+        parallel = generator.generate_many(6, rows=7, cols=7, fill_percentage=0.3, workers=2)
+        
+        assert [path for _, path in parallel] == [path for _, path in sequential]
+        assert [puzzle.row_sums for puzzle, _ in parallel] == [puzzle.row_sums for puzzle, _ in sequential]
+
+    def test_generate_many_invalid_parameters(self):
+        """Test parameter validation for generate_many."""
+        generator = SnakePuzzleGenerator(seed=1)
+        assert generator.generate_many(0, rows=5, cols=5) == []
+        
+        with pytest.raises(ValueError, match="Number of puzzles must be non-negative"):
+            generator.generate_many(-1, rows=5, cols=5)
+        with pytest.raises(ValueError, match="Number of workers must be positive"):
+            generator.generate_many(2, rows=5, cols=5, workers=0)
+
+    def test_generate_unique(self):
+        """Test that generate_unique returns a puzzle with exactly one solution."""
+        generator = SnakePuzzleGenerator(seed=42)
+        puzzle, path = generator.generate_unique(rows=6, cols=6, fill_percentage=0.4)
+        
+        assert puzzle.is_valid_solution(path)
+        solutions = SnakeSolver(puzzle).find_solutions(max_solutions=2)
+        assert solutions == [path]
+        
+        stats = generator.get_generation_stats()
+        assert stats['unique'] == 1
+        assert stats['candidates'] == stats['rejected'] + 1
+        assert stats['path_attempts'] >= stats['candidates']
+        assert stats['unique_per_second'] > 0
+
+    def test_generate_unique_rejects_ambiguous_candidates(self):
+        """Test that candidates with several solutions are rejected."""
+        # With this seed the first 6x6 candidate has two solutions
+        puzzle, path = SnakePuzzleGenerator(seed=36).generate(rows=6, cols=6, fill_percentage=0.6)
+        assert len(SnakeSolver(puzzle).find_solutions(max_solutions=3)) == 2
+        
+        generator = SnakePuzzleGenerator(seed=36)
+        unique_puzzle, unique_path = generator.generate_unique(rows=6, cols=6, fill_percentage=0.6)
+        
+        stats = generator.get_generation_stats()
+        assert stats['rejected'] >= 1
+        assert unique_path != path
+        assert len(SnakeSolver(unique_puzzle).find_solutions(max_solutions=3)) == 1
+
+    def test_generate_unique_failure(self):
+        """Test that generate_unique raises when no unique puzzle is found."""
+        generator = SnakePuzzleGenerator(seed=36)
+        with pytest.raises(RuntimeError, match="Failed to generate a unique puzzle after 1 attempts"):
+            generator.generate_unique(rows=6, cols=6, fill_percentage=0.6, max_attempts=1)
+        assert generator.get_generation_stats()['unique'] == 0
+
+        # Statistics are also written when no path can be generated for a candidate
+        generator = SnakePuzzleGenerator(seed=42)
+        with pytest.raises(RuntimeError, match="Failed to generate any valid puzzle"):
+            generator.generate_unique(rows=4, cols=4, fill_percentage=1.0)
+        stats = generator.get_generation_stats()
+        assert stats['candidates'] == 1 and stats['unique'] == 0
+        assert stats['path_attempts'] > 0
+
+    @pytest.mark.parametrize("order", ['greedy', 'random'])
+    def test_minimize_clues(self, order):
+        """Test that clue minimization keeps the solution unique."""
+        generator = SnakePuzzleGenerator(seed=42)
+        puzzle, path = generator.generate_unique(rows=6, cols=6, fill_percentage=0.4)
+        minimized = generator.minimize_clues(puzzle, path, order=order)
+        
+        hidden = minimized.row_sums.count(None) + minimized.col_sums.count(None)
+        assert hidden > 0
+        assert minimized.start_cell == puzzle.start_cell
+        assert minimized.end_cell == puzzle.end_cell
+        assert SnakeSolver(minimized).find_solutions(max_solutions=2) == [path]
+        
+        # Every remaining clue is needed
+        for row, value in enumerate(minimized.row_sums):
+            if value is not None:
+                row_sums = list(minimized.row_sums)
+                row_sums[row] = None
+                relaxed = SnakePuzzle(row_sums, minimized.col_sums, minimized.start_cell, minimized.end_cell)
+                assert len(SnakeSolver(relaxed).find_solutions(max_solutions=2)) == 2
+
+    def test_minimize_clues_invalid_input(self):
+        """Test that minimization rejects ambiguous puzzles and unknown orders."""
+        generator = SnakePuzzleGenerator(seed=36)
+        puzzle, path = generator.generate(rows=6, cols=6, fill_percentage=0.6)
+        with pytest.raises(ValueError, match="does not have a unique solution"):
+            generator.minimize_clues(puzzle, path)
+        with pytest.raises(ValueError, match="Unknown clue order"):
+            generator.minimize_clues(puzzle, path, order='sorted')
+        with pytest.raises(ValueError, match="not a valid solution"):
+            generator.minimize_clues(puzzle, {puzzle.start_cell, puzzle.end_cell})
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"prefetch": 2, "background": "thread"},
+        {"prefetch": 3, "workers": 2},
+    ])
+    def test_iter_generate_matches_generate_many(self, options):
+        """Test that streamed puzzles match generate_many for the same seed."""
+        generator = SnakePuzzleGenerator(seed=7)
+        expected = generator.generate_many(5, rows=6, cols=6, fill_percentage=0.4)
+        streamed = list(generator.iter_generate(6, 6, 0.4, n=5, **options))
+        
+        assert [path for _, path in streamed] == [path for _, path in expected]
+        assert [puzzle.row_sums for puzzle, _ in streamed] == [puzzle.row_sums for puzzle, _ in expected]
+
+    def test_iter_generate_is_lazy_and_infinite(self):
+        """Test that an unbounded stream yields puzzles on demand and can be closed."""
+        generator = SnakePuzzleGenerator(seed=1)
+        stream = generator.iter_generate(5, 5, 0.3, prefetch=2, background='thread')
+        puzzles = [next(stream) for _ in range(20)]
+        stream.close()
+        
+        assert len(puzzles) == 20
+        assert all(puzzle.is_valid_solution(path) for puzzle, path in puzzles)
+
+    def test_iter_generate_propagates_errors(self):
+        """Test that generation errors surface when the failing puzzle is reached."""
+        generator = SnakePuzzleGenerator(seed=1)
+        stream = generator.iter_generate(4, 4, 1.0, prefetch=2, background='thread')
+        with pytest.raises(RuntimeError, match="Failed to generate any valid puzzle"):
+            next(stream)
+
+    def test_iter_generate_invalid_parameters(self):
+        """Test that invalid parameters are rejected when the stream is created."""
+        generator = SnakePuzzleGenerator(seed=1)
+        with pytest.raises(ValueError, match="Number of puzzles must be non-negative"):
+            generator.iter_generate(5, 5, n=-1)
+        with pytest.raises(ValueError, match="Prefetch must be non-negative"):
+            generator.iter_generate(5, 5, prefetch=-1)
+        with pytest.raises(ValueError, match="Unknown background mode"):
+            generator.iter_generate(5, 5, prefetch=1, background='fiber')
+        with pytest.raises(ValueError, match="Rows and columns must be positive"):
+            generator.iter_generate(0, 5)
+
+    def test_engines_generate_identical_puzzles(self):
+        """Test that the bitboard engine reproduces the set based walk."""
+        for seed in range(20):
+            for rows, cols, fill_percentage in [(5, 5, 0.4), (8, 12, 0.3), (1, 6, 0.5), (10, 10, 0.5)]:
+                results = []
+                for engine in ('walk', 'bitboard'):
+                    generator = SnakePuzzleGenerator(seed=seed, engine=engine)
+                    try:
+                        puzzle, path = generator.generate(rows, cols, fill_percentage)
+                        results.append((path, puzzle.start_cell, puzzle.end_cell))
+                    except RuntimeError as error:
+                        results.append(str(error))
+                assert results[0] == results[1]
+
+    def test_bitboard_engine_large_grid(self):
+        """Test that the bitboard engine generates valid paths on large grids."""
+        generator = SnakePuzzleGenerator(seed=1, engine='bitboard')
+        puzzle, path = generator.generate(rows=60, cols=80, fill_percentage=0.05)
+        assert len(path) >= 240
+        assert puzzle.is_valid_solution(path)
+
+    def test_markov_engine_high_fill(self):
+        """Test that the markov engine reliably reaches fills close to the maximum."""
+        for seed in range(10):
+            generator = SnakePuzzleGenerator(seed=seed, engine='markov')
+            puzzle, path = generator.generate(rows=10, cols=10, fill_percentage=0.54)
+            assert len(path) == 54
+            assert puzzle.is_valid_solution(path)
+        
+        puzzle, path = SnakePuzzleGenerator(seed=0, engine='markov').generate(rows=40, cols=40, fill_percentage=0.5)
+        assert len(path) == 800
+        assert puzzle.is_valid_solution(path)
+
+    def test_markov_engine_randomizes_paths(self):
+        """Test that the markov engine is deterministic per seed and varies across seeds."""
+        paths = set()
+        for seed in range(10):
+            puzzle1, path1 = SnakePuzzleGenerator(seed=seed, engine='markov').generate(8, 8, 0.4)
+            puzzle2, path2 = SnakePuzzleGenerator(seed=seed, engine='markov').generate(8, 8, 0.4)
+            assert path1 == path2
+            assert puzzle1.start_cell == puzzle2.start_cell
+            paths.add(frozenset(path1))
+        assert len(paths) == 10
+
+    def test_markov_engine_fill_above_maximum(self):
+        """Test that a fill beyond the densest serpentine path fails."""
+        generator = SnakePuzzleGenerator(seed=0, engine='markov')
+        with pytest.raises(RuntimeError):
+            generator.generate(rows=10, cols=10, fill_percentage=0.6)
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError, match="Unknown generation engine"):
+            SnakePuzzleGenerator(engine='unknown')
+
     def test_generate_different_seeds_produce_different_results(self):
         """Test that different seeds produce different results."""
         generator1 = SnakePuzzleGenerator(seed=42)
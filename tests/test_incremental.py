@@ -0,0 +1,78 @@
+import random
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakePuzzleGenerator, IncrementalValidator
+
+
+class TestIncrementalValidator:
+    """Test cases for the incremental validator."""
+
+    def test_play_to_solution(self):
+        """Test filling the solution cell by cell."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        validator = IncrementalValidator(puzzle)
+        assert validator.validate().rule == 'empty'
+
+        path = [(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)]
+        for position in path[:-1]:
+            assert validator.toggle(position)
+            assert not validator.is_solved()
+        assert validator.validate().rule == 'missing_endpoint'
+
+        assert validator.toggle(path[-1])
+        assert validator.is_solved()
+        assert validator.validate().is_valid
+        assert validator.solution == set(path)
+
+        # Undoing a move breaks the solution again
+        assert not validator.toggle((1, 1))
+        assert validator.validate().rule == 'row_sum'
+        validator.set_cell((1, 1), True)
+        assert validator.is_solved()
+
+    def test_matches_full_validation(self):
+        """Test that random moves report the same result as validate_solution."""
+        rng = random.Random(5)
+        generator = SnakePuzzleGenerator(seed=8)
+        for _ in range(5):
+            puzzle, path = generator.generate(rows=6, cols=7, fill_percentage=0.4)
+            validator = IncrementalValidator(puzzle, path)
+            assert validator.is_solved()
+
+            cells = [(row, col) for row in range(6) for col in range(7)]
+            neighbourhood = list(path) + rng.sample(cells, 10)
+            for _ in range(300):
+                validator.toggle(rng.choice(neighbourhood))
+                solution = validator.solution
+                expected = puzzle.validate_solution(solution)
+                result = validator.validate()
+
+                assert validator.is_solved() == puzzle.is_valid_solution(solution)
+                assert result.is_valid == expected.is_valid
+                assert result.rule == expected.rule
+                assert result.cells == expected.cells
+
+    def test_disconnected_and_loop(self):
+        """Test that a separate loop is only reported once all local rules hold."""
+        puzzle = SnakePuzzle([None] * 6, [None] * 6, start_cell=(0, 0), end_cell=(0, 2))
+        path = {(0, 0), (1, 0), (1, 1), (1, 2), (0, 2)}
+        loop = {(3, 2), (3, 3), (3, 4), (4, 2), (4, 4), (5, 2), (5, 3), (5, 4)}
+        validator = IncrementalValidator(puzzle, path | loop)
+
+        result = validator.validate()
+        assert result.rule == 'disconnected'
+        assert result.cells == loop
+        assert result.components[0] == path
+        assert not validator.is_solved()
+
+        # Removing the loop cell by cell leaves the path, after a stale rebuild
+        for position in loop:
+            validator.toggle(position)
+        assert validator.is_solved()
+
+    def test_invalid_input(self):
+        """Test input validation."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        with pytest.raises(ValueError, match="SnakePuzzle instance"):
+            IncrementalValidator("not a puzzle")
+        with pytest.raises(ValueError, match="out of bounds"):
+            IncrementalValidator(puzzle).toggle((3, 0))
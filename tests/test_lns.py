@@ -0,0 +1,64 @@
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakePuzzleGenerator, LNSSolver
+
+
+class TestLNSSolver:
+    """Test cases for the large-neighbourhood search solver."""
+
+    def test_solve(self):
+        """Test that the search meets all sums, reporting the remaining violation."""
+        puzzle, path = SnakePuzzleGenerator(seed=3).generate(rows=10, cols=10, fill_percentage=0.4)
+        solver = LNSSolver(puzzle, seed=0)
+        events = []
+        solution = solver.solve(max_iterations=500, callback=events.append)
+
+        assert solution == path
+        assert solver.get_solve_status() == 'solved'
+        assert solver.get_violation() == 0
+        stats = solver.get_solve_stats()
+        assert stats['initial_violation'] > 0
+        assert stats['violation'] == 0
+
+        windows = [event for event in events if event.kind == 'window_solved']
+        assert len(windows) == stats['iterations']
+        violations = [stats['initial_violation']] + [event.data['violation'] for event in windows]
+        assert all(later <= earlier for earlier, later in zip(violations, violations[1:]))
+        for event in windows:
+            top, left, height, width = event.data['window']
+            assert 0 <= top <= puzzle.rows - height and 0 <= left <= puzzle.cols - width
+        assert events[-1].kind == 'finished'
+        assert events[-1].data == {'status': 'solved', 'violation': 0}
+
+    def test_current_solution_is_a_snake(self):
+        """Test that the snake stays valid apart from the sums while the search runs."""
+        puzzle, _ = SnakePuzzleGenerator(seed=3).generate(rows=10, cols=10, fill_percentage=0.4)
+        solver = LNSSolver(puzzle, seed=0)
+        relaxed = SnakePuzzle([None] * puzzle.rows, [None] * puzzle.cols, puzzle.start_cell, puzzle.end_cell)
+
+        def check(event):
+            if event.kind == 'window_solved':
+                assert relaxed.is_valid_solution(solver.get_current_solution())
+                return event.iteration < 3
+
+        assert solver.solve(callback=check) is None
+        assert solver.get_solve_status() == 'stopped'
+        assert solver.get_solve_stats()['iterations'] == 3
+        assert solver.get_violation() == solver.get_solve_stats()['violation']
+
+    def test_result_format(self):
+        """Test returning the solution as an ordered path."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        path = LNSSolver(puzzle, window_size=3).solve(result_format='path')
+        assert path == [(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)]
+
+    def test_invalid_arguments(self):
+        """Test that invalid window sizes and result formats are rejected."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        with pytest.raises(ValueError, match="Window size"):
+            LNSSolver(puzzle, window_size=1)
+        with pytest.raises(ValueError, match="Window size"):
+            LNSSolver(puzzle, window_size=8, max_window_size=6)
+        with pytest.raises(ValueError, match="Puzzle must be"):
+            LNSSolver("not a puzzle")
+        with pytest.raises(ValueError, match="Unknown result format"):
+            LNSSolver(puzzle).solve(result_format='matrix')
@@ -0,0 +1,86 @@
+import urllib.request
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakePuzzleGenerator
+from snake_mip_solver.metrics import SnakeMetrics, CONTENT_TYPE
+
+
+def sample_lines(text, name):
+    """Sample lines of one metric, without the HELP and TYPE lines."""
+    return [line for line in text.splitlines() if line.startswith(name) and not line.startswith('#')]
+
+
+class TestSnakeMetrics:
+    """Test cases for the Prometheus metrics."""
+
+    def test_solver_metrics(self):
+        """Test that builds and solves are recorded per grid size and outcome."""
+        metrics = SnakeMetrics()
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        solver = metrics.build_solver(puzzle)
+        assert metrics.solve(solver) == {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}
+
+        infeasible = metrics.build_solver(SnakePuzzle([3, 3, 3], [3, 3, 3], start_cell=(0, 0), end_cell=(2, 2)))
+        assert metrics.solve(infeasible) is None
+
+        text = metrics.render()
+        assert '# TYPE snake_solver_solve_seconds histogram' in text
+        assert 'snake_solver_build_seconds_count{grid="3x3"} 2' in text
+        assert 'snake_solver_solve_seconds_count{grid="3x3"} 2' in text
+        assert 'snake_solver_solves_total{grid="3x3",status="solved"} 1' in text
+        assert 'snake_solver_solves_total{grid="3x3",status="infeasible"} 1' in text
+        assert 'snake_solver_iterations_bucket{grid="3x3",le="+Inf"} 2' in text
+        assert text.endswith('\n')
+
+    def test_histogram_buckets(self):
+        """Test that histogram buckets are cumulative."""
+        metrics = SnakeMetrics()
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        for seconds in (0.002, 0.3, 120.0):
+            metrics.record_build(puzzle, seconds)
+
+        lines = sample_lines(metrics.render(), 'snake_solver_build_seconds')
+        assert 'snake_solver_build_seconds_bucket{grid="3x3",le="0.001"} 0' in lines
+        assert 'snake_solver_build_seconds_bucket{grid="3x3",le="0.005"} 1' in lines
+        assert 'snake_solver_build_seconds_bucket{grid="3x3",le="0.5"} 2' in lines
+        assert 'snake_solver_build_seconds_bucket{grid="3x3",le="60"} 2' in lines
+        assert 'snake_solver_build_seconds_bucket{grid="3x3",le="+Inf"} 3' in lines
+        assert 'snake_solver_build_seconds_sum{grid="3x3"} 120.302' in lines
+
+    def test_generator_metrics(self):
+        """Test that generation attempts and failures are recorded."""
+        metrics = SnakeMetrics()
+        generator = SnakePuzzleGenerator(seed=36)
+        metrics.generate(generator, 6, 6, 0.4)
+        attempts = generator.get_generation_stats()['path_attempts']
+        assert attempts >= 1
+
+        with pytest.raises(RuntimeError):
+            metrics.generate_unique(generator, 6, 6, 0.6, max_attempts=1)
+
+        text = metrics.render()
+        assert f'snake_generator_attempts_total{{grid="6x6",mode="random"}} {attempts}' in text
+        assert 'snake_generator_seconds_count{grid="6x6",mode="random"} 1' in text
+        assert 'snake_generator_candidates_total{grid="6x6"} 1' in text
+        assert 'snake_generator_rejected_total{grid="6x6"} 1' in text
+        assert 'snake_generator_failures_total{grid="6x6",mode="unique"} 1' in text
+        assert not sample_lines(text, 'snake_generator_failures_total{grid="6x6",mode="random"}')
+
+    def test_exposition(self, tmp_path):
+        """Test writing the metrics to a file and serving them over HTTP."""
+        metrics = SnakeMetrics()
+        metrics.record_build(SnakePuzzle([1, 1], [2, None], start_cell=(0, 0), end_cell=(1, 0)), 0.01)
+
+        path = tmp_path / 'snake.prom'
+        metrics.write_textfile(str(path))
+        assert path.read_text() == metrics.render()
+        assert [p.name for p in tmp_path.iterdir()] == ['snake.prom']
+
+        server = metrics.start_http_server(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers['Content-Type'] == CONTENT_TYPE
+                assert response.read().decode('utf-8') == metrics.render()
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -1,5 +1,29 @@
+import pickle
 import pytest
-from snake_mip_solver import SnakePuzzle
+import random
+import numpy as np
+from snake_mip_solver import BaseSnakePuzzle, SnakePuzzle, FrozenSnakePuzzle, SnakeSolver, count_solutions
+
+
+def serpentine_path(rows, cols):
+    """Ordered non-touching serpentine path: full even rows joined by single connector cells."""
+    path = []
+    for row in range(0, rows, 2):
+        row_cells = [(row, col) for col in range(cols)]
+        path.extend(row_cells if row % 4 == 0 else reversed(row_cells))
+        if row + 2 < rows:
+            path.append((row + 1, cols - 1 if row % 4 == 0 else 0))
+    return path
+
+
+def puzzle_from_path(path, rows, cols):
+    """Create a fully clued puzzle whose solution is the given ordered path."""
+    row_sums = [0] * rows
+    col_sums = [0] * cols
+    for row, col in path:
+        row_sums[row] += 1
+        col_sums[col] += 1
+    return SnakePuzzle(row_sums, col_sums, start_cell=path[0], end_cell=path[-1])
 
 
 class TestSnakePuzzle:
@@ -127,6 +151,175 @@ class TestSnakePuzzle:
         expected_adjacent = {(0, 1), (2, 1), (1, 0), (1, 2)}
         assert adjacent_tiles == expected_adjacent
             
+    def test_solution_validation_rules(self):
+        """Test validation of touching, branching and looping solutions."""
+        # 6x6 puzzle, valid solution: S=(0,0) -> (0,1) -> (0,2) -> (1,2) -> (2,2) -> (2,3) -> (2,4)=E
+        puzzle = SnakePuzzle([None] * 6, [None] * 6, start_cell=(0, 0), end_cell=(2, 4))
+        valid = {(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (2, 4)}
+        assert puzzle.is_valid_solution(valid)
+        
+        # Diagonal touching: (4, 0) and (5, 1) only touch diagonally
+        assert not puzzle.is_valid_solution(valid | {(4, 0), (5, 1)})
+        
+        # Branch: (1, 0) gives the start cell two neighbours
+        assert not puzzle.is_valid_solution(valid | {(1, 0)})
+        
+        # Separate loop away from the path: every cell has 2 neighbours but it is disconnected
+        loop = {(4, 0), (4, 1), (5, 0), (5, 1)}
+        assert not puzzle.is_valid_solution(valid | loop)
+
+    def test_validation_diagnostics(self):
+        """Test the structured validation result."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        valid_solution = {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}
+        
+        result = puzzle.validate_solution(valid_solution)
+        assert result
+        assert result.is_valid
+        assert result.rule is None
+        assert result.components == [valid_solution]
+        
+        result = puzzle.validate_solution(set())
+        assert not result
+        assert result.rule == 'empty'
+        
+        result = puzzle.validate_solution({(0, 1), (1, 1), (2, 1), (2, 2)})
+        assert result.rule == 'missing_endpoint'
+        assert result.cells == {(0, 0)}
+        
+        result = puzzle.validate_solution({(0, 0), (3, 0), (2, 2)})
+        assert result.rule == 'out_of_bounds'
+        assert result.cells == {(3, 0)}
+        
+        # Rows 0 and 2 have only 1 cell but need 2, row 1 has 1 cell as required
+        result = puzzle.validate_solution({(0, 0), (1, 1), (2, 2)})
+        assert result.rule == 'row_sum'
+        assert result.cells == {(0, 0), (2, 2)}
+        assert len(result.components) == 3
+        
+        result = puzzle.validate_solution({(0, 0), (0, 1), (0, 2), (2, 2)})
+        assert result.rule == 'row_sum'
+        
+        # Only the column sums are wrong
+        puzzle = SnakePuzzle([2, 1, 2], [None, 3, None], start_cell=(0, 0), end_cell=(2, 2))
+        result = puzzle.validate_solution({(0, 0), (0, 1), (1, 2), (2, 1), (2, 2)})
+        assert result.rule == 'col_sum'
+        assert result.cells == {(0, 1), (2, 1)}
+
+    def test_validation_diagnostics_path_rules(self):
+        """Test diagnostics for touching, branching and disconnected solutions."""
+        puzzle = SnakePuzzle([None] * 6, [None] * 6, start_cell=(0, 0), end_cell=(2, 4))
+        valid = {(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (2, 4)}
+        
+        result = puzzle.validate_solution(valid | {(4, 0), (5, 1)})
+        assert result.rule == 'diagonal_touching'
+        assert result.cells == {(4, 0), (5, 1)}
+        
+        result = puzzle.validate_solution(valid | {(1, 0)})
+        assert result.rule == 'degree'
+        assert result.cells == {(0, 0), (1, 0)}
+        
+        loop = {(4, 0), (4, 1), (5, 0), (5, 1)}
+        result = puzzle.validate_solution(valid | loop)
+        assert result.rule == 'disconnected'
+        assert result.cells == loop
+        assert result.components == [valid, loop]
+        
+        # Early exit reports the same rule when only one rule is violated
+        assert puzzle.validate_solution(valid | loop, early_exit=True).rule == 'disconnected'
+        assert puzzle.validate_solution(valid | {(1, 0)}, early_exit=True).rule == 'degree'
+
+    def test_validation_of_long_snake(self):
+        """Test that validating a very long snake does not hit the recursion limit."""
+        path = serpentine_path(120, 120)
+        assert len(path) > 7000
+        puzzle = puzzle_from_path(path, 120, 120)
+        
+        assert puzzle.is_valid_solution(set(path))
+        assert puzzle.validate_solution(set(path)).is_valid
+        assert not puzzle.is_valid_solution(set(path) - {path[len(path) // 2]})
+
+    def test_early_exit_agrees_with_full_validation(self):
+        """Test that early exit and full validation agree on validity."""
+        rng = random.Random(0)
+        path = serpentine_path(5, 6)
+        puzzle = puzzle_from_path(path, 5, 6)
+        cells = [(row, col) for row in range(5) for col in range(6)]
+        
+        for _ in range(500):
+            solution = set(path)
+            for cell in rng.sample(cells, rng.randint(0, 3)):
+                solution ^= {cell}
+            early = puzzle.validate_solution(solution, early_exit=True)
+            full = puzzle.validate_solution(solution, early_exit=False)
+            assert early.is_valid == full.is_valid
+
+    def test_solution_formats(self):
+        """Test validating and converting bitmask, grid and ordered path solutions."""
+        path = serpentine_path(5, 6)
+        puzzle = puzzle_from_path(path, 5, 6)
+        bitmask = sum(1 << (row * 6 + col) for row, col in path)
+        grid = np.zeros((5, 6), dtype=bool)
+        for row, col in path:
+            grid[row, col] = True
+        
+        for solution in (set(path), bitmask, grid, path, tuple(path)):
+            assert puzzle.is_valid_solution(solution)
+            assert puzzle.format_solution(solution, 'set') == set(path)
+            assert puzzle.format_solution(solution, 'bitmask') == bitmask
+            assert np.array_equal(puzzle.format_solution(solution, 'grid'), grid)
+            assert puzzle.format_solution(solution, 'path') == path
+        
+        # Invalid cells are rejected in every format
+        assert not puzzle.is_valid_solution(bitmask & ~1)
+        grid[0, 0] = False
+        assert puzzle.validate_solution(grid).rule == 'missing_endpoint'
+        assert puzzle.validate_solution(1 << 30 | bitmask).rule == 'out_of_bounds'
+        
+        # Lists are unordered cells unless path order is asked for
+        assert puzzle.is_valid_solution(path[::-1])
+        assert puzzle.is_valid_solution(sorted(path))
+        assert puzzle.is_valid_solution(path, ordered=True)
+        assert not puzzle.is_valid_solution(path[::-1], ordered=True)
+        assert puzzle.validate_solution(path[::-1], ordered=True).rule == 'path_order'
+        assert puzzle.validate_solution(path + [path[3]], ordered=True).rule == 'path_order'
+        swapped = path[:2] + [path[3], path[2]] + path[4:]
+        assert puzzle.validate_solution(swapped, ordered=True).cells == {path[2], path[3]}
+        
+        with pytest.raises(ValueError, match="Unknown result format"):
+            puzzle.format_solution(path, 'json')
+        with pytest.raises(ValueError, match="does not match"):
+            puzzle.is_valid_solution(np.zeros((6, 5), dtype=bool))
+        with pytest.raises(ValueError, match="single path"):
+            puzzle.format_solution(set(path) - {path[4]}, 'path')
+
+    def test_adjacency_tables(self):
+        """Test the precomputed neighbour tables."""
+        puzzle = SnakePuzzle([2, None, 1], [1, 2, None, 1], start_cell=(0, 0), end_cell=(2, 2))
+        adjacency = puzzle.adjacency
+        
+        assert adjacency.rows == 3
+        assert adjacency.cols == 4
+        assert adjacency.index((1, 2)) == 6
+        assert adjacency.positions[6] == (1, 2)
+        
+        # Tables agree with the offset based helpers
+        for cell, position in enumerate(adjacency.positions):
+            orthogonal = {adjacency.positions[n] for n in adjacency.orthogonal[cell]}
+            diagonal = {adjacency.positions[n] for n in adjacency.diagonal[cell]}
+            assert orthogonal == puzzle.get_tiles_by_offsets(position, puzzle._orthogonal_offsets)
+            assert diagonal == puzzle.get_tiles_by_offsets(position, puzzle._diagonal_offsets)
+        
+        # Shared orthogonal cells of the diagonal pair (1, 1) - (0, 2) are (0, 1) and (1, 2)
+        links = {adjacency.positions[d]: (adjacency.positions[a], adjacency.positions[b])
+                 for d, a, b in adjacency.diagonal_links[adjacency.index((1, 1))]}
+        assert links[(0, 2)] == ((0, 1), (1, 2))
+        
+        # Tables are shared between puzzles of the same shape
+        other = SnakePuzzle([1, 1, 1], [1, 1, 1, 1], start_cell=(0, 1), end_cell=(2, 3))
+        assert other.adjacency is adjacency
+        assert SnakePuzzle([1, 1], [1, 1], (0, 0), (1, 1)).adjacency is not adjacency
+
     def test_repr(self):
         """Test string representation."""
         puzzle = SnakePuzzle([1, None], [2, 1, None], start_cell=(0, 0), end_cell=(1, 2))
@@ -136,4 +329,71 @@ class TestSnakePuzzle:
         assert "cols=3" in repr_str
         assert "start=(0, 0)" in repr_str
         assert "end=(1, 2)" in repr_str
-        
\ No newline at end of file
+        
+
+
+class TestFrozenSnakePuzzle:
+    """Test cases for the immutable, hashable puzzle."""
+
+    def test_freeze(self):
+        """Test that a frozen puzzle has the same configuration as the original."""
+        puzzle = SnakePuzzle([2, None, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        frozen = puzzle.freeze()
+
+        assert isinstance(frozen, FrozenSnakePuzzle)
+        assert isinstance(frozen, BaseSnakePuzzle)
+        assert not isinstance(frozen, SnakePuzzle)
+        assert frozen.rows == 3 and frozen.cols == 3
+        assert frozen.row_sums == (2, None, 2)
+        assert frozen.col_sums == (1, 3, 1)
+        assert frozen.start_cell == (0, 0)
+        assert frozen.end_cell == (2, 2)
+        assert frozen.freeze() is frozen
+        # A mutable puzzle compares by identity, so it never equals a frozen one
+        assert frozen != puzzle and puzzle != frozen
+
+    def test_frozen_puzzle_is_immutable(self):
+        """Test that attributes of a frozen puzzle cannot be changed."""
+        frozen = FrozenSnakePuzzle([2, 1, 2], [1, 3, 1], (0, 0), (2, 2))
+        with pytest.raises(AttributeError, match="immutable"):
+            frozen.row_sums = (1, 1, 1)  # type: ignore
+        with pytest.raises(AttributeError, match="immutable"):
+            frozen.start_cell = (0, 1)  # type: ignore
+        with pytest.raises(AttributeError):
+            frozen.extra = 1  # type: ignore
+        assert not hasattr(frozen, '__dict__')
+        assert FrozenSnakePuzzle.__slots__ == ('_data',) and BaseSnakePuzzle.__slots__ == ()
+
+    def test_frozen_puzzle_hashing(self):
+        """Test that equal frozen puzzles can be used as dict and set keys."""
+        first = FrozenSnakePuzzle([2, 1, 2], [1, 3, 1], (0, 0), (2, 2))
+        second = SnakePuzzle([2, 1, 2], [1, 3, 1], (0, 0), (2, 2)).freeze()
+        other = FrozenSnakePuzzle([2, 1, 2], [1, 3, 1], (0, 0), (2, 1))
+
+        assert first == second and hash(first) == hash(second)
+        assert first != other
+        assert len({first, second, other}) == 2
+        assert {first: 'value'}[second] == 'value'
+
+    def test_frozen_puzzle_behaves_like_puzzle(self):
+        """Test validation, solving, pickling and large grids with a frozen puzzle."""
+        frozen = FrozenSnakePuzzle([2, 1, 2], [1, 3, 1], (0, 0), (2, 2))
+        solution = {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}
+        assert frozen.is_valid_solution(solution)
+        assert SnakeSolver(frozen).solve() == solution
+        assert count_solutions(frozen) == 1
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+        path = serpentine_path(3, 300)
+        large = puzzle_from_path(path, 3, 300).freeze()
+        assert large.col_sums[299] == 3
+        assert large.is_valid_solution(set(path))
+        assert pickle.loads(pickle.dumps(large)) == large
+
+    def test_frozen_puzzle_validation(self):
+        """Test that invalid configurations are rejected."""
+        with pytest.raises(ValueError, match="Start cell and end cell cannot be the same"):
+            FrozenSnakePuzzle([1, 1], [1, 1], (0, 0), (0, 0))
+        with pytest.raises(ValueError, match="must be between"):
+            FrozenSnakePuzzle([3, 1], [1, 1], (0, 0), (1, 1))
+
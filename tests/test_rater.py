@@ -0,0 +1,63 @@
+import pytest
+from snake_mip_solver import SnakePuzzle, SnakePuzzleGenerator, DifficultyRater, DifficultyRating
+
+
+class TestDifficultyRater:
+    """Test cases for the deduction based difficulty rater."""
+
+    def test_rate_easy_puzzle(self):
+        """Test that a puzzle solved by line logic and path forcing is rated Easy."""
+        puzzle = SnakePuzzle([1, 1, 1, 3, 2, 5], [4, 3, 1, 1, 1, 3], start_cell=(0, 0), end_cell=(3, 5))
+        rating = DifficultyRater(puzzle).rate()
+
+        assert isinstance(rating, DifficultyRating)
+        assert rating.tier == 'Easy'
+        assert rating.solved
+        assert rating.rounds == sum(rating.techniques.values())
+        assert set(rating.techniques) <= {'line_sum', 'endpoint_forcing', 'path_continuation'}
+        assert puzzle.is_valid_solution(rating.solution)
+
+    def test_rate_puzzle_needing_contradiction(self):
+        """Test that a puzzle needing a contradiction is rated Hard."""
+        puzzle, path = SnakePuzzleGenerator(seed=22).generate(rows=5, cols=5, fill_percentage=0.4)
+        rating = DifficultyRater(puzzle).rate()
+
+        assert rating.tier == 'Hard'
+        assert rating.hardest == 'contradiction'
+        assert rating.solution == path
+        assert rating.score > rating.rounds
+
+    def test_rating_matches_unique_solution(self):
+        """Test that solved ratings reproduce the unique solution."""
+        generator = SnakePuzzleGenerator(seed=42)
+        for _ in range(5):
+            puzzle, path = generator.generate_unique(rows=6, cols=6, fill_percentage=0.4)
+            rating = DifficultyRater(puzzle).rate()
+            assert rating.tier in ('Easy', 'Medium', 'Hard', 'Evil')
+            if rating.solved:
+                assert rating.solution == path
+
+    def test_rating_is_deterministic(self):
+        """Test that rating the same puzzle twice gives the same result."""
+        puzzle, _ = SnakePuzzleGenerator(seed=3).generate(rows=8, cols=8, fill_percentage=0.4)
+        assert DifficultyRater(puzzle).rate() == DifficultyRater(puzzle).rate()
+
+    def test_ambiguous_puzzle_is_not_solved(self):
+        """Test that deductions cannot solve a puzzle with several solutions."""
+        puzzle = SnakePuzzle([None] * 3, [None] * 3, start_cell=(0, 0), end_cell=(2, 2))
+        rating = DifficultyRater(puzzle).rate()
+
+        assert not rating.solved
+        assert rating.tier == 'Evil'
+        assert rating.solution is None
+
+    def test_infeasible_puzzle(self):
+        """Test that a puzzle without solution is rejected."""
+        puzzle = SnakePuzzle([2, 3, 3, 0, 0], [0, 3, 2, 2, 1], start_cell=(0, 2), end_cell=(1, 4))
+        with pytest.raises(ValueError, match="Puzzle has no solution"):
+            DifficultyRater(puzzle).rate()
+
+    def test_invalid_puzzle(self):
+        """Test that the rater requires a SnakePuzzle."""
+        with pytest.raises(ValueError, match="Puzzle must be a SnakePuzzle instance"):
+            DifficultyRater("not a puzzle")  # type: ignore
@@ -1,7 +1,10 @@
 import pytest
 import io
+import logging
+import subprocess
 import sys
-from snake_mip_solver import SnakePuzzle, SnakeSolver
+from ortools.linear_solver import linear_solver_pb2
+from snake_mip_solver import SnakePuzzle, SnakeSolver, SnakePuzzleGenerator, count_solutions, ProgressEvent
 
 
 class TestSnakeSolver:
@@ -27,6 +30,18 @@ class TestSnakeSolver:
             for col in range(3):
                 assert (row, col) in solver.variables
 
+    def test_backend_loaded_on_first_use(self):
+        """Test that OR-Tools is only imported when SnakeSolver is first used."""
+        script = (
+            "import sys\n"
+            "import snake_mip_solver\n"
+            "assert 'ortools' not in sys.modules\n"
+            "from snake_mip_solver import SnakeSolver\n"
+            "assert 'ortools' in sys.modules\n"
+            "assert snake_mip_solver.SnakeSolver is SnakeSolver\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
     def test_solver_with_invalid_puzzle(self):
         """Test that solver creation fails with invalid puzzle type."""
         with pytest.raises(ValueError, match="Puzzle must be a SnakePuzzle instance"):
@@ -197,6 +212,241 @@ class TestSnakeSolver:
         assert "No solution exists for this puzzle" in output
         assert solution is None
 
+    def test_array_builder_produces_identical_model(self):
+        """Test that the array builder produces exactly the same model as the expression builder."""
+        puzzles = [
+            SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2)),
+            SnakePuzzle([2], [1, 1], start_cell=(0, 0), end_cell=(0, 1)),
+            SnakePuzzle(
+                row_sums=[11, 2, 7, 4, 4, None, None, None, 3, 2, None, 5],
+                col_sums=[9, 7, None, 2, 5, 6, None, None, 5, None, None, None],
+                start_cell=(2, 6),
+                end_cell=(7, 5)
+            ),
+            SnakePuzzleGenerator(seed=7).generate(rows=7, cols=11, fill_percentage=0.4)[0],
+        ]
+        
+        for puzzle in puzzles:
+            expression_model = linear_solver_pb2.MPModelProto()
+            SnakeSolver(puzzle).solver.ExportModelToProto(expression_model)
+            array_model = linear_solver_pb2.MPModelProto()
+            SnakeSolver(puzzle, builder='array').solver.ExportModelToProto(array_model)
+            
+            assert array_model == expression_model
+
+    def test_array_builder_solve(self):
+        """Test solving with a model built from coefficient arrays."""
+        puzzle = SnakePuzzle(
+            row_sums=[4, 2, 2, 3, 1, 3, 2, 6],
+            col_sums=[3, 2, 7, 2, 2, 4, 1, 2],
+            start_cell=(2, 5),
+            end_cell=(6, 7)
+        )
+        solver = SnakeSolver(puzzle, builder='array')
+        
+        assert solver.variables[(3, 4)].name() == "x_3_4"
+        assert solver.solve() == SnakeSolver(puzzle).solve()
+
+    def test_result_formats(self):
+        """Test returning the solution as a bitmask, grid or ordered path."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        path = [(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)]
+        
+        assert SnakeSolver(puzzle).solve(result_format='path') == path
+        assert SnakeSolver(puzzle).solve(result_format='bitmask') == 0b110010011
+        grid = SnakeSolver(puzzle).solve(result_format='grid')
+        assert grid.dtype == bool
+        assert grid.tolist() == [[True, True, False], [False, True, False], [False, True, True]]
+        assert puzzle.is_valid_solution(grid)
+        
+        with pytest.raises(ValueError, match="Unknown result format"):
+            SnakeSolver(puzzle).solve(result_format='json')
+
+    def test_find_solutions(self):
+        """Test enumerating solutions with no-good cuts on one model."""
+        # Unique puzzle: the second solve proves there is no other solution
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        solver = SnakeSolver(puzzle)
+        solutions = solver.find_solutions(max_solutions=5)
+        assert solutions == [{(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}]
+        assert solver.get_solve_status() == 'infeasible'
+        
+        # Without sums a 3x3 grid with opposite corners has several solutions
+        puzzle = SnakePuzzle([None] * 3, [None] * 3, start_cell=(0, 0), end_cell=(2, 2))
+        cells = [(row, col) for row in range(3) for col in range(3)]
+        brute_force = [
+            {cell for bit, cell in enumerate(cells) if mask >> bit & 1}
+            for mask in range(1 << len(cells))
+        ]
+        brute_force = [solution for solution in brute_force if puzzle.is_valid_solution(solution)]
+        
+        solver = SnakeSolver(puzzle)
+        solutions = solver.find_solutions(max_solutions=100)
+        assert len(solutions) == len(brute_force) > 1
+        assert {frozenset(solution) for solution in solutions} == {frozenset(solution) for solution in brute_force}
+        
+        solver = SnakeSolver(puzzle)
+        assert len(solver.find_solutions(max_solutions=1)) == 1
+        assert solver.get_solve_status() == 'solved'
+
+    def test_get_backbone(self):
+        """Test that the backbone matches the cells shared by all enumerated solutions."""
+        puzzle, _ = SnakePuzzleGenerator(seed=3).generate(rows=8, cols=8, fill_percentage=0.4)
+        loose = SnakePuzzle([None if row % 2 else value for row, value in enumerate(puzzle.row_sums)],
+                            [None if col % 2 else value for col, value in enumerate(puzzle.col_sums)],
+                            puzzle.start_cell, puzzle.end_cell)
+        solutions = SnakeSolver(loose).find_solutions(max_solutions=20)
+        assert len(solutions) > 1
+        
+        forced_filled, forced_empty = SnakeSolver(loose).get_backbone()
+        assert forced_filled == set.intersection(*solutions)
+        assert forced_empty == set(SnakeSolver(loose).variables) - set.union(*solutions)
+        
+        # Starting from known solutions gives the same result
+        assert SnakeSolver(loose).get_backbone(solutions[:2]) == (forced_filled, forced_empty)
+
+        # Cells fixed with fix_cell are reported as forced and stay fixed
+        solver = SnakeSolver(loose)
+        fixed = next(iter(set.union(*solutions) - forced_filled))
+        solver.fix_cell(fixed, False)
+        assert fixed in solver.get_backbone()[1]
+        solution = solver.solve(max_iterations=100)
+        assert solution is not None and fixed not in solution
+
+        # Every cell of a unique puzzle is forced
+        unique = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        forced_filled, forced_empty = SnakeSolver(unique).get_backbone()
+        assert forced_filled == {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}
+        assert len(forced_empty) == 4
+        
+        infeasible = SnakePuzzle([3, 3, 3], [3, 3, 3], start_cell=(0, 0), end_cell=(2, 2))
+        with pytest.raises(ValueError, match="no solution"):
+            SnakeSolver(infeasible).get_backbone()
+
+    def test_solve_status(self):
+        """Test the status reported after solving."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        solver = SnakeSolver(puzzle)
+        assert solver.get_solve_status() is None
+        solver.solve()
+        assert solver.get_solve_status() == 'solved'
+        
+        infeasible = SnakePuzzle([2, 3, 3, 0, 0], [0, 3, 2, 2, 1], start_cell=(0, 2), end_cell=(1, 4))
+        solver = SnakeSolver(infeasible)
+        solver.solve()
+        assert solver.get_solve_status() == 'infeasible'
+        
+        disjoint = SnakePuzzle([4, 3, 3, 3, 0], [3, 0, 4, 2, 4], start_cell=(0, 0), end_cell=(2, 0))
+        solver = SnakeSolver(disjoint)
+        solver.solve(max_iterations=1)
+        assert solver.get_solve_status() == 'iteration_limit'
+
+    @pytest.mark.parametrize("builder", ['expression', 'array'])
+    def test_set_row_and_col_sum(self, builder):
+        """Test changing clues on an existing model."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        solver = SnakeSolver(puzzle, builder=builder)
+        solver.exclude_solution(solver.solve())
+        assert solver.solve() is None
+        
+        # Removing the middle column clue alone does not allow another path
+        solver.set_col_sum(1, None)
+        assert solver.puzzle.col_sums == [1, None, 1]
+        assert solver.solve() is None
+        solver.set_row_sum(0, None)
+        solver.set_row_sum(2, None)
+        solver.set_col_sum(2, None)
+        solution = solver.solve()
+        assert solution == {(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)}
+        assert solver.puzzle.is_valid_solution(solution)
+        
+        # Restoring a clue makes the excluded model infeasible again
+        solver.set_row_sum(0, 2)
+        solver.set_row_sum(2, 2)
+        assert solver.solve() is None
+        assert solver.get_solve_status() == 'infeasible'
+        
+        # Clues that were blank when the model was built can be added
+        solver = SnakeSolver(SnakePuzzle([None] * 3, [None] * 3, (0, 0), (2, 2)), builder=builder)
+        solver.set_row_sum(0, 3)
+        assert solver.solve() == {(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)}
+        
+        with pytest.raises(ValueError, match="out of bounds"):
+            solver.set_row_sum(3, 1)
+        with pytest.raises(ValueError, match="must be between"):
+            solver.set_col_sum(0, 4)
+
+    @pytest.mark.parametrize("builder", ['expression', 'array'])
+    def test_edit_session(self, builder):
+        """Test moving endpoints, changing clues and fixing cells on one model."""
+        puzzle, _ = SnakePuzzleGenerator(seed=4).generate(rows=6, cols=6, fill_percentage=0.4)
+        solver = SnakeSolver(puzzle, builder=builder)
+        first = solver.solve(max_iterations=100)
+        assert puzzle.is_valid_solution(first)
+        
+        # Fixing a cell restricts the solutions until it is freed again
+        fixed = next(iter(first - {puzzle.start_cell, puzzle.end_cell}))
+        solver.fix_cell(fixed, False)
+        assert solver.solve(max_iterations=100) is None
+        solver.fix_cell(fixed, None)
+        assert solver.solve(max_iterations=100) == first
+        
+        edits = [
+            lambda: solver.set_row_sum(0, None),
+            lambda: solver.set_start_cell((5, 5)),
+            lambda: solver.set_end_cell((0, 0)),
+            lambda: solver.set_col_sum(2, None),
+            lambda: solver.set_start_cell((0, 1)),
+            lambda: solver.set_end_cell((5, 5)),
+            lambda: solver.set_row_sum(5, None),
+        ]
+        for edit in edits:
+            edit()
+            solution = solver.solve(max_iterations=100)
+            if solution is None:
+                assert solver.get_solve_status() == 'infeasible'
+                assert count_solutions(solver.puzzle) == 0
+            else:
+                assert solver.puzzle.is_valid_solution(solution)
+        
+        # Undoing every edit gives back the original puzzle and its solution
+        solver.set_start_cell(puzzle.start_cell)
+        solver.set_end_cell(puzzle.end_cell)
+        for row in (0, 5):
+            solver.set_row_sum(row, puzzle.row_sums[row])
+        solver.set_col_sum(2, puzzle.col_sums[2])
+        assert solver.puzzle.start_cell == puzzle.start_cell
+        assert solver.solve(max_iterations=100) == first
+        
+        with pytest.raises(ValueError, match="cannot be the same"):
+            solver.set_start_cell(puzzle.end_cell)
+        with pytest.raises(ValueError, match="out of bounds"):
+            solver.set_end_cell((6, 0))
+        with pytest.raises(ValueError, match="out of bounds"):
+            solver.fix_cell((0, 6), True)
+
+    @pytest.mark.parametrize("builder", ['expression', 'array'])
+    def test_exclude_solution_then_move_endpoint(self, builder):
+        """Test that excluded solutions do not cut off snakes between moved endpoints."""
+        puzzle = SnakePuzzle([None], [None] * 5, start_cell=(0, 0), end_cell=(0, 2))
+        solver = SnakeSolver(puzzle, builder=builder)
+        solver.exclude_solution(solver.solve())
+        assert solver.solve() is None
+
+        solver.set_end_cell((0, 4))
+        assert count_solutions(solver.puzzle) == 1
+        assert solver.solve() == {(0, 0), (0, 1), (0, 2), (0, 3), (0, 4)}
+
+        # Moving back does not restore the dropped cut
+        solver.set_end_cell((0, 2))
+        assert solver.solve() == {(0, 0), (0, 1), (0, 2)}
+
+    def test_unknown_builder(self):
+        """Test that an unknown model builder is rejected."""
+        puzzle = SnakePuzzle([1, 1], [1, 1], (0, 0), (1, 1))
+        with pytest.raises(ValueError, match="Unknown model builder"):
+            SnakeSolver(puzzle, builder='unknown')
+
     def test_different_solver_types(self):
         """Test creating solvers with different solver types."""
         puzzle = SnakePuzzle(
@@ -382,4 +632,85 @@ class TestSnakeSolver:
             
         finally:
             # Ensure stdout is restored even if test fails
-            sys.stdout = sys.__stdout__
\ No newline at end of file
+            sys.stdout = sys.__stdout__
+
+    def test_progress_events(self):
+        """Test the events reported to a callback while cutting planes are added."""
+        puzzle = SnakePuzzle([4, 3, 3, 3, 0], [3, 0, 4, 2, 4], start_cell=(0, 0), end_cell=(2, 0))
+        events = []
+        solution = SnakeSolver(puzzle).solve(max_iterations=10, callback=events.append)
+        
+        assert solution is None
+        assert all(isinstance(event, ProgressEvent) for event in events)
+        kinds = [event.kind for event in events]
+        assert kinds[:6] == ['solve_started', 'iteration_started', 'backend_status',
+                             'components_found', 'cuts_added', 'iteration_started']
+        assert kinds[-1] == 'finished'
+        assert events[-1].data == {'status': 'infeasible'}
+        assert events[2].data['name'] == 'OPTIMAL'
+        assert events[3].data['count'] == len(events[3].data['sizes']) > 1
+        assert events[4].data['total'] == events[4].data['count']
+        assert [event.iteration for event in events[:6]] == [0, 1, 1, 1, 1, 2]
+        assert all(later.elapsed >= earlier.elapsed for earlier, later in zip(events, events[1:]))
+        
+        valid = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        events = []
+        SnakeSolver(valid).solve(callback=events.append)
+        assert events[-2].kind == 'incumbent_found'
+        assert events[-2].data == {'cells': 5}
+        assert events[-1].data == {'status': 'solved'}
+
+    def test_solution_pool_cuts(self, monkeypatch):
+        """Test that every disconnected pool solution is cut, sharing cuts between them."""
+        puzzle = SnakePuzzle([4, 3, 3, 3, 0], [3, 0, 4, 2, 4], start_cell=(0, 0), end_cell=(2, 0))
+        single = SnakeSolver(puzzle)
+        single.solve(max_iterations=5)
+        single_stats = single.get_solve_stats()
+        assert single_stats['pool_solutions'] == single_stats['iterations'] - 1
+
+        # Duplicate each pool solution: its stray components are only cut once
+        solver = SnakeSolver(puzzle)
+        read_pool = solver._read_solution_pool
+        monkeypatch.setattr(solver, '_read_solution_pool', lambda: read_pool() * 2)
+        events = []
+        assert solver.solve(max_iterations=5, callback=events.append) is None
+        stats = solver.get_solve_stats()
+        assert stats['disconnected_solutions_found'] == 2 * single_stats['disconnected_solutions_found']
+        assert stats['cutting_planes_added'] == single_stats['cutting_planes_added']
+        assert [event.data['solutions'] for event in events if event.kind == 'components_found'] == [2]
+
+    def test_solution_pool_valid_solution(self, monkeypatch):
+        """Test that a valid solution later in the pool is returned."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        solver = SnakeSolver(puzzle)
+        read_pool = solver._read_solution_pool
+        monkeypatch.setattr(solver, '_read_solution_pool', lambda: [{(0, 0)}] + read_pool())
+        assert solver.solve() == {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)}
+        assert solver.get_solve_status() == 'solved'
+        assert solver.get_solve_stats()['pool_solutions'] == 2
+
+    def test_callback_stops_solve(self):
+        """Test that a callback returning False stops the solve."""
+        puzzle = SnakePuzzle([4, 3, 3, 3, 0], [3, 0, 4, 2, 4], start_cell=(0, 0), end_cell=(2, 0))
+        solver = SnakeSolver(puzzle)
+        events = []
+        
+        def stop_after_first_cut(event):
+            events.append(event)
+            return event.kind != 'cuts_added'
+        
+        assert solver.solve(max_iterations=10, callback=stop_after_first_cut) is None
+        assert solver.get_solve_status() == 'stopped'
+        assert solver.get_solve_stats()['iterations'] == 1
+        assert events[-1].kind == 'finished'
+        assert events[-1].data == {'status': 'stopped'}
+
+    def test_progress_logging(self, caplog):
+        """Test that progress events are logged at DEBUG level."""
+        puzzle = SnakePuzzle([2, 1, 2], [1, 3, 1], start_cell=(0, 0), end_cell=(2, 2))
+        with caplog.at_level(logging.DEBUG, logger='snake_mip_solver'):
+            SnakeSolver(puzzle).solve()
+        
+        events = [record.event for record in caplog.records if hasattr(record, 'event')]
+        assert [event.kind for event in events] == [
+            'solve_started', 'iteration_started', 'backend_status', 'incumbent_found', 'finished']